@@ -111,10 +111,13 @@ class StopOnRigorousBound(StoppingCriterion):
     Halt when we can prove that the tail of the series is smaller than some
     given epsilon, or when we detect that we will probably not be able to reach
     this accuracy. Provide a rigorous bound on the tail even in the latter case.
+
+    Refinements of the majorant are reported to ``ctx`` when it is given.
     """
 
-    def __init__(self, maj, eps, fast_fail=True):
+    def __init__(self, maj, eps, fast_fail=True, ctx=None):
         self.maj = maj
+        self.ctx = ctx
         self.eps = eps
         self.prec = ZZ(eps.log(2).lower().floor()) - 2
         self.fast_fail = fast_fail
@@ -199,7 +202,7 @@ class StopOnRigorousBound(StoppingCriterion):
                 # branch, we do not stop asap if the bound is getting worse in
                 # the present case.)
                 logger.debug("--> intervals blowing up or bound getting worse")
-                self.maj.refine()
+                self.maj.refine(self.ctx)
             else:
                 thr = tb*est**(QQ(next_stride*(self.maj.effort()**2 + 2))/(n+1))
                 if safe_le(thr, eps):
@@ -208,7 +211,7 @@ class StopOnRigorousBound(StoppingCriterion):
                                  thr, eps)
                     break
                 logger.debug("--> bad bound but refining may help")
-                self.maj.refine()
+                self.maj.refine(self.ctx)
         logger.debug("--> ko")
         return False, tb
 
@@ -14,13 +14,16 @@ Evaluation of univariate D-finite functions by numerical analytic continuation
 # http://www.gnu.org/licenses/
 
 import logging
+import multiprocessing
 import sys
 
+from concurrent.futures import ProcessPoolExecutor
+
 import sage.rings.all as rings
 import sage.rings.real_arb
 import sage.rings.complex_arb
 
-from . import accuracy, bounds, utilities
+from . import accuracy, bounds, profiling, utilities
 from . import naive_sum, binary_splitting
 
 from sage.matrix.constructor import identity_matrix, matrix
@@ -31,6 +34,7 @@ from sage.rings.real_arb import RealBallField
 from sage.structure.element import Matrix, canonical_coercion
 
 from .context import Context, dctx # re-export Context
+from .cost_model import calibrated_model
 from .monodromy import formal_monodromy
 from .path import EvaluationPoint_step, Path, Step
 
@@ -131,6 +135,23 @@ def _use_binsplit(dop, steps, tgt_prec, base_point_size, ctx):
                 ">=" if use_binsplit else "<", est)
         return use_binsplit
 
+def _choose_algorithm(dop, steps, tgt_prec, base_point_size, bit_burst_prec,
+                      ctx):
+    r"""
+    Return ``"naive"``, ``"binsplit"`` (binary splitting at the original
+    endpoints), or ``"bit-burst"`` (binary splitting with bit-burst substeps
+    when they apply).
+    """
+    if ctx.algorithm is not None or ctx.cost_model is None:
+        if _use_binsplit(dop, steps, tgt_prec, base_point_size, ctx):
+            return "bit-burst"
+        else:
+            return "naive"
+    cost_model = ctx.cost_model
+    if cost_model == "calibrate":
+        cost_model = calibrated_model()
+    return cost_model.choose(dop, steps, tgt_prec, bit_burst_prec)
+
 def step_transition_matrix_bit_burst(dop, steps, eps, rows, fail_fast, effort,
                                      ctx=dctx):
     r"""
@@ -159,7 +180,10 @@ def step_transition_matrix_bit_burst(dop, steps, eps, rows, fail_fast, effort,
                         max(z0.bit_burst_bits(tgt_prec),
                             *(step.end.bit_burst_bits(tgt_prec)
                               for step in steps)))
-    use_binsplit = _use_binsplit(dop, steps, tgt_prec, binsplit_prec, ctx)
+    algorithm = _choose_algorithm(dop, steps, tgt_prec, binsplit_prec,
+                                  bit_burst_prec, ctx)
+    use_binsplit = (algorithm != "naive")
+    try_bit_burst = (algorithm != "binsplit")
     use_fallback = not ctx.force_algorithm and (use_binsplit or not fail_fast)
 
     while True:
@@ -167,7 +191,7 @@ def step_transition_matrix_bit_burst(dop, steps, eps, rows, fail_fast, effort,
         # Try using the bit-burst method. This only makes sense if we are
         # considering using binary splitting. The substeps thus introduced are
         # simple steps as well.
-        if use_binsplit and len(steps) == 1:
+        if use_binsplit and try_bit_burst and len(steps) == 1:
             sub = steps[0].bit_burst_split(tgt_prec, bit_burst_prec)
             if sub:
                 # Assuming bitsize(step.start) << bitsize(step.end):
@@ -275,6 +299,70 @@ def _branch_change_matrix(dop, point, branch, eps):
     mon = formal_monodromy(dop, point, ring)
     return sum(mon**b for b in branch)/len(branch)
 
+def _balanced_product(mats):
+    r"""
+    Product ``mats[-1]*...*mats[0]``, computed using a balanced product tree.
+    """
+    if len(mats) == 1:
+        return mats[0]
+    mid = len(mats)//2
+    return _balanced_product(mats[mid:])*_balanced_product(mats[:mid])
+
+# state of a worker process of the pool used by _compute_step_transition_matrices
+_step_worker_state = None
+
+def _step_worker_init(dop, groups, eps, ctx):
+    global _step_worker_state
+    _step_worker_state = (dop, groups, eps, ctx)
+
+def _step_worker(i):
+    dop, groups, eps, ctx = _step_worker_state
+    return step_transition_matrix(dop, groups[i], eps, ctx=ctx)
+
+def _step_transition_matrices(dop, groups, eps, ctx):
+    r"""
+    Transition matrices for a list of groups of steps (as accepted by
+    ``step_transition_matrix``), looked up in ``ctx.cache`` when possible.
+    """
+    if ctx.cache is None:
+        return _compute_step_transition_matrices(dop, groups, eps, ctx)
+    keys = [[ctx.cache.key(dop, step) for step in group] for group in groups]
+    mats = []
+    for group_keys in keys:
+        group_mats = [ctx.cache.get(key, eps) for key in group_keys]
+        mats.append(None if any(mat is None for mat in group_mats)
+                    else group_mats)
+    todo = [i for i, group_mats in enumerate(mats) if group_mats is None]
+    logger.info("%s of %s groups of steps found in cache",
+                len(groups) - len(todo), len(groups))
+    computed = _compute_step_transition_matrices(
+            dop, [groups[i] for i in todo], eps, ctx)
+    for i, group_mats in zip(todo, computed):
+        mats[i] = group_mats
+        for key, mat in zip(keys[i], group_mats):
+            ctx.cache.put(key, eps, mat)
+    return mats
+
+def _compute_step_transition_matrices(dop, groups, eps, ctx):
+    r"""
+    Transition matrices for a list of groups of steps, computed in
+    ``ctx.ncpus`` processes.
+    """
+    if ctx.ncpus <= 1 or len(groups) <= 1:
+        return [step_transition_matrix(dop, group, eps, ctx=ctx)
+                for group in groups]
+    logger.info("computing %s step transition matrices using %s processes",
+                len(groups), ctx.ncpus)
+    # The workers are forked so that they inherit the operator, the path, and
+    # the context without any pickling. Side effects of the computation in the
+    # workers (e.g., on ctx.recorder) are lost.
+    with ProcessPoolExecutor(
+            max_workers=min(ctx.ncpus, len(groups)),
+            mp_context=multiprocessing.get_context('fork'),
+            initializer=_step_worker_init,
+            initargs=(dop, groups, eps, ctx)) as pool:
+        return list(pool.map(_step_worker, range(len(groups))))
+
 def analytic_continuation(dop, path, eps, ctx=dctx, ini=None, post=None,
                           return_local_bases=False):
     """
@@ -296,80 +384,182 @@ def analytic_continuation(dop, path, eps, ctx=dctx, ini=None, post=None,
     A list of dictionaries with information on the computed solution(s) at each
     evaluation point.
 
+    .. SEEALSO:: :class:`AnalyticContinuation`
+
     TESTS::
 
         sage: from ore_algebra import DifferentialOperators
         sage: _, x, Dx = DifferentialOperators()
         sage: (Dx^2 + 2*x*Dx).numerical_solution([0, 2/sqrt(pi)], [0,i])
         [+/- ...] + [1.65042575879754...]*I
+
+    The transition matrices of the steps can be computed in parallel::
+
+        sage: (Dx^2 + 2*x*Dx).numerical_solution([0, 2/sqrt(pi)],
+        ....:                                    [0, i, 1+i, 1], ncpus=2)
+        [0.84270079294971...] + [+/- ...]*I
     """
+    cont = AnalyticContinuation(dop, path, ctx, ini, post, return_local_bases)
+    return cont.run(eps)
 
-    if dop.is_zero():
-        raise ValueError("operator must be nonzero")
-    _, _, _, dop = dop._normalize_base_ring()
-
-    path = _process_path(dop, path, ctx)
-    logger.info("path: %s", path)
-
-    eps = ctx.IR(eps)
-    eps1 = (eps/(1 + len(path))) >> 4
-
-    ini = _normalize_ini(ini, dop, eps1)
-
-    def maybe_push_point_dict(lst, point, value):
-        if point.detour_to is not None:
-            assert not point.store_value()
-            point = point.detour_to
-        if not point.store_value():
-            return
-        if ini is not None:
-            value = value*ini
-        if post is not None and not post.is_one():
-            value = post(point.value)*value
-        rec = {"point": point.value, "value": value}
-        if return_local_bases:
-            rec["structure"] = point.local_basis_structure(critical_monomials=False)
-        lst.append(rec)
-
-    res = []
-
-    z0 = path.vert[0]
-    path_mat = identity_matrix(ZZ, dop.order())
-    maybe_push_point_dict(res, z0, path_mat) # value at z0 = identity
-    path_mat = ~_process_detour(dop, z0, path_mat, eps1, ctx=ctx)
-
-    steps = list(path.steps())
-    i = 0
-    while i < len(steps):
-        if (ctx.two_point_mode
-                and steps[i].reversed and i + 1 < len(steps)
-                and not steps[i+1].reversed):
-            np = 2
-        else:
-            np = 1
-        main_mats = step_transition_matrix(dop, steps[i:i+np], eps1, ctx=ctx)
-        for step, main_mat in zip(steps[i:i+np], main_mats):
-            path_mat = main_mat*path_mat
-            point = step.start if step.reversed else step.end
-            branch = point.options.get("outgoing_branch")
-            if branch is not None:
-                branch_mat = _branch_change_matrix(dop, point, branch, eps1)
-                path_mat = branch_mat*path_mat
-            val_mat = _process_detour(dop, point, path_mat, eps1, ctx=ctx)
-            maybe_push_point_dict(res, point, val_mat)
-
-        i += np
-
-    cm = sage.structure.element.get_coercion_model()
-    real = (rings.RIF.has_coerce_map_from(dop.base_ring().base_ring())
-            and all(v.is_real() for v in path.vert))
-    OutputIntervals = cm.common_parent(
-            utilities.ball_field(eps, real),
-            *[rec["value"].base_ring() for rec in res])
-    for rec in res:
-        rec["value"] = rec["value"].change_ring(OutputIntervals)
-
-    return res
+class AnalyticContinuation:
+    r"""
+    Resumable analytic continuation along a path.
+
+    The input is as for :func:`analytic_continuation`, except for the target
+    accuracy, which is passed to :meth:`run`. The path is processed (checked,
+    subdivided, modified to add detours around singular points...) only once,
+    and the points along it keep the information computed about them (local
+    structure of the solutions, distance to the nearest singularities, etc.)
+    from one run to the next. The transition matrices of the steps are kept as
+    well, along with the accuracy they were computed for, and reused when
+    possible. This makes it cheaper to repeat the computation with decreasing
+    tolerances, e.g., until some property of the result can be decided.
+    The results of a run are always returned in a ball field whose precision
+    corresponds to the tolerance of that run, even when they are computed from
+    more accurate matrices kept from a previous run.
+
+    EXAMPLES::
+
+        sage: from ore_algebra import DifferentialOperators
+        sage: from ore_algebra.analytic.analytic_continuation import AnalyticContinuation
+        sage: from ore_algebra.analytic.differential_operator import DifferentialOperator
+        sage: _, x, Dx = DifferentialOperators()
+        sage: dop = DifferentialOperator(Dx^2 + 2*x*Dx)
+        sage: cont = AnalyticContinuation(dop, [0, i, 1+i, 1],
+        ....:                             ini=[0, 2/sqrt(pi)])
+        sage: cont.run(1e-10)[0]["value"][0,0]
+        [0.8427007929...] + [+/- ...]*I
+        sage: cont.run(1e-40)[0]["value"][0,0]
+        [0.842700792949714869341220635082609259...] + [+/- ...]*I
+        sage: cont.run(1e-20)[0]["value"][0,0] # reuses the previous matrices
+        [0.8427007929497148693...] + [+/- ...]*I
+    """
+
+    def __init__(self, dop, path, ctx=dctx, ini=None, post=None,
+                 return_local_bases=False):
+
+        if dop.is_zero():
+            raise ValueError("operator must be nonzero")
+        _, _, _, dop = dop._normalize_base_ring()
+
+        with profiling.span(ctx, "path"):
+            path = _process_path(dop, path, ctx)
+        logger.info("path: %s", path)
+
+        steps = list(path.steps())
+        groups = []
+        i = 0
+        while i < len(steps):
+            if (ctx.two_point_mode
+                    and steps[i].reversed and i + 1 < len(steps)
+                    and not steps[i+1].reversed):
+                np = 2
+            else:
+                np = 1
+            groups.append(steps[i:i+np])
+            i += np
+
+        self.dop = dop
+        self.path = path
+        self.ctx = ctx
+        self.ini = ini
+        self.post = post
+        self.return_local_bases = return_local_bases
+        self.groups = groups
+        # index of group -> (precision in bits, transition matrices)
+        self._step_mats = {}
+
+    def __repr__(self):
+        return f"Analytic continuation of {self.dop} along {self.path}"
+
+    def _transition_matrices(self, eps):
+        prec = utilities.prec_from_eps(eps)
+        todo = [i for i in range(len(self.groups))
+                if self._step_mats.get(i, (-1, None))[0] < prec]
+        logger.info("%s of %s groups of steps already computed",
+                    len(self.groups) - len(todo), len(self.groups))
+        computed = _step_transition_matrices(
+                self.dop, [self.groups[i] for i in todo], eps, self.ctx)
+        for i, mats in zip(todo, computed):
+            self._step_mats[i] = (prec, mats)
+        return [mats for _, mats in
+                (self._step_mats[i] for i in range(len(self.groups)))]
+
+    def run(self, eps):
+        r"""
+        Perform the analytic continuation with an absolute tolerance of
+        ``eps``.
+
+        See :func:`analytic_continuation` for the format of the output.
+        """
+
+        dop, path, ctx = self.dop, self.path, self.ctx
+        post = self.post
+        return_local_bases = self.return_local_bases
+
+        eps = ctx.IR(eps)
+        eps1 = (eps/(1 + len(path))) >> 4
+
+        ini = _normalize_ini(self.ini, dop, eps1)
+
+        def maybe_push_point_dict(lst, point, value):
+            if point.detour_to is not None:
+                assert not point.store_value()
+                point = point.detour_to
+            if not point.store_value():
+                return
+            if ini is not None:
+                value = value*ini
+            if post is not None and not post.is_one():
+                value = post(point.value)*value
+            rec = {"point": point.value, "value": value}
+            if return_local_bases:
+                rec["structure"] = point.local_basis_structure(
+                                                    critical_monomials=False)
+            lst.append(rec)
+
+        res = []
+
+        z0 = path.vert[0]
+        path_mat = identity_matrix(ZZ, dop.order())
+        maybe_push_point_dict(res, z0, path_mat) # value at z0 = identity
+        path_mat = ~_process_detour(dop, z0, path_mat, eps1, ctx=ctx)
+
+        # The transition matrices of the steps only depend on their endpoints.
+        # Compute them first (possibly in parallel), then multiply them
+        # together, one product tree per segment of the path between two
+        # points where the value of the solution is needed.
+        factors = []
+        for group, main_mats in zip(self.groups,
+                                    self._transition_matrices(eps1)):
+            for step, main_mat in zip(group, main_mats):
+                factors.append(main_mat)
+                point = step.start if step.reversed else step.end
+                branch = point.options.get("outgoing_branch")
+                if branch is not None:
+                    branch_mat = _branch_change_matrix(dop, point, branch, eps1)
+                    factors.append(branch_mat)
+                if (point if point.detour_to is None
+                          else point.detour_to).store_value():
+                    with profiling.span(ctx, "matrix_product",
+                                        factors=len(factors)):
+                        path_mat = _balanced_product(factors)*path_mat
+                    factors = []
+                    val_mat = _process_detour(dop, point, path_mat, eps1,
+                                              ctx=ctx)
+                    maybe_push_point_dict(res, point, val_mat)
+
+        cm = sage.structure.element.get_coercion_model()
+        real = (rings.RIF.has_coerce_map_from(dop.base_ring().base_ring())
+                and all(v.is_real() for v in path.vert))
+        OutputIntervals = cm.common_parent(
+                utilities.ball_field(eps, real),
+                *[rec["value"].base_ring() for rec in res])
+        for rec in res:
+            rec["value"] = rec["value"].change_ring(OutputIntervals)
+
+        return res
 
 def normalize_post_transform(dop, post_transform):
     if post_transform is None:
@@ -0,0 +1,297 @@
+# vim: tw=80
+r"""
+Benchmarks for the numerical analytic continuation code
+
+This module times the main phases of the evaluation of D-finite functions
+(transition matrices by the automatic, direct summation and binary splitting
+algorithms, series summation, construction and refinement of majorants,
+monodromy matrices) on a fixed collection of operators taken from the example
+modules, for a range of working precisions. The results can be saved in JSON
+format and compared against a previous run in order to detect performance
+regressions.
+
+From the command line::
+
+    sage -python -m ore_algebra.analytic.benchmark -o new.json
+    sage -python -m ore_algebra.analytic.benchmark -o new.json -b old.json
+
+EXAMPLES::
+
+    sage: from ore_algebra.analytic.benchmark import run, compare
+    sage: res = run(problems=["fuchsian_1_2_2"], precs=[30],
+    ....:           phases=["transition_matrix", "series_sum", "monodromy"])
+    sage: [(r["problem"], r["order"], r["phase"], r["prec"])
+    ....:  for r in res["results"]]
+    [('fuchsian_1_2_2', 2, 'transition_matrix', 30),
+     ('fuchsian_1_2_2', 2, 'series_sum', 30),
+     ('fuchsian_1_2_2', 2, 'monodromy', 30)]
+    sage: all(r["time"] > 0 for r in res["results"])
+    True
+
+    sage: compare(res, res)
+    []
+    sage: slow = copy(res); slow["results"] = [dict(r) for r in res["results"]]
+    sage: slow["results"][0]["time"] *= 2
+    sage: compare(slow, res, min_time=0)
+    [('fuchsian_1_2_2', 'transition_matrix', 30, ..., ...)]
+
+Phases that do not apply to a given problem (e.g., series summation at a
+singular point) are skipped::
+
+    sage: res = run(problems=["fcc_dop4"], precs=[30],
+    ....:           phases=["series_sum", "binsplit"])
+    sage: [r["phase"] for r in res["results"]]
+    ['binsplit']
+"""
+
+# Distributed under the terms of the GNU General Public License (GPL) either
+# version 2, or (at your option) any later version
+#
+# http://www.gnu.org/licenses/
+
+import argparse
+import collections
+import json
+import logging
+import math
+import platform
+import resource
+import sys
+import time
+
+from sage.rings.number_field.number_field import QuadraticField
+from sage.rings.rational_field import QQ
+from sage.rings.real_arb import RBF
+
+logger = logging.getLogger(__name__)
+
+Problem = collections.namedtuple("Problem", ["dop", "ini", "path", "pt"])
+Problem.__doc__ = r"""
+A benchmark problem: an operator, initial values at 0, an analytic
+continuation path, and a point in the disk of convergence of the series
+expansions at 0 where to sum them (``None`` if 0 is a singular point).
+"""
+
+def _koutschan1():
+    from .examples.misc import koutschan1
+    return Problem(koutschan1.dop, koutschan1.ini, [0, 84], QQ((1, 20)))
+
+def _fcc_dop4():
+    from ..examples import fcc
+    return Problem(fcc.dop4, [0, 0, 0, 1], [0, 1], None)
+
+def _ssw(key, path):
+    def problem():
+        from ..examples import ssw
+        return Problem(ssw.dop[key], None, path(), None)
+    return problem
+
+def _ssw_5_1_1_path():
+    i = QuadraticField(-1, 'i').gen()
+    return [0, QQ((1, 3)) + i/10, QQ((1, 3))]
+
+def _fuchsian(key, pt):
+    def problem():
+        from ..examples.random_fuchsian import irred
+        dop = irred[key].numerator()
+        return Problem(dop, [1] + [0]*(dop.order() - 1), [0, 1], pt)
+    return problem
+
+PROBLEMS = {
+    "koutschan1": _koutschan1,
+    "fcc_dop4": _fcc_dop4,
+    "ssw_1_0_0": _ssw((1, 0, 0), lambda: [0, QQ((1, 4))]),
+    "ssw_5_1_1": _ssw((5, 1, 1), _ssw_5_1_1_path),
+    "fuchsian_1_2_2": _fuchsian((1, 2, 2), QQ((1, 2))),
+    "fuchsian_1_4_2": _fuchsian((1, 4, 2), QQ((1, 10))),
+    "fuchsian_2_5_6": _fuchsian((2, 5, 6), QQ((1, 10))),
+}
+
+def _transition_matrix(pb, eps):
+    pb.dop.numerical_transition_matrix(pb.path, eps)
+
+def _naive(pb, eps):
+    pb.dop.numerical_transition_matrix(pb.path, eps, algorithm="naive",
+                                       force_algorithm=True)
+
+def _binsplit(pb, eps):
+    pb.dop.numerical_transition_matrix(pb.path, eps, algorithm="binsplit",
+                                       force_algorithm=True)
+
+def _series_sum(pb, eps):
+    from .naive_sum import series_sum
+    if pb.pt is None:
+        return NotImplemented
+    series_sum(pb.dop, pb.ini, pb.pt, eps)
+
+def _diffop_bound(pb, eps):
+    from . import utilities
+    from .bounds import DiffOpBound
+    from .differential_operator import DifferentialOperator
+    if pb.pt is None:
+        return NotImplemented
+    dop = DifferentialOperator(pb.dop)
+    maj = DiffOpBound(dop)
+    maj.refine()
+    # As in the summation code, bound the majorant series at the evaluation
+    # point, here starting from the truncation order needed for eps
+    rad = RBF(abs(pb.pt))
+    n = int(utilities.prec_from_eps(eps)/-math.log2(float(rad.upper()))) + 1
+    maj(n).bound(rad, rows=dop.order())
+
+def _monodromy(pb, eps):
+    from .differential_operator import DifferentialOperator
+    from .monodromy import monodromy_matrices
+    from .path import Point
+    dop = DifferentialOperator(pb.dop)
+    if Point(0, dop).is_irregular():
+        return NotImplemented
+    monodromy_matrices(pb.dop, 0, eps)
+
+PHASES = {
+    "transition_matrix": _transition_matrix,
+    "naive": _naive,
+    "binsplit": _binsplit,
+    "series_sum": _series_sum,
+    "diffop_bound": _diffop_bound,
+    "monodromy": _monodromy,
+}
+
+def _maxrss():
+    # peak resident set size of the process, in bytes
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else 1024*maxrss
+
+def _measure(fun, pb, eps, repeat):
+    r"""
+    Best time over ``repeat`` runs, and growth of the peak resident set size of
+    the process during these runs.
+
+    The memory figure includes allocations made outside the Python allocator
+    (e.g., by Arb or FLINT), but is zero for benchmarks that do not exceed the
+    peak reached by earlier ones in the same process.
+    """
+    rss = _maxrss()
+    elapsed = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if fun(pb, eps) is NotImplemented:
+            return None
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return elapsed, _maxrss() - rss
+
+def run(problems=None, phases=None, precs=(30, 300, 3000), repeat=1):
+    r"""
+    Run the benchmarks and return the results as a dictionary suitable for
+    conversion to JSON.
+
+    INPUT:
+
+    - ``problems`` -- list of keys of :data:`PROBLEMS` (default: all)
+    - ``phases`` -- list of keys of :data:`PHASES` (default: all)
+    - ``precs`` -- working precisions in bits
+    - ``repeat`` -- number of runs of each benchmark, the best time is kept
+    """
+    import sage.version
+    if problems is None:
+        problems = list(PROBLEMS)
+    if phases is None:
+        phases = list(PHASES)
+    results = []
+    for name in problems:
+        pb = PROBLEMS[name]()
+        for phase in phases:
+            for prec in precs:
+                eps = RBF.one() >> prec
+                logger.info("running %s/%s at prec=%s", name, phase, prec)
+                res = {"problem": name, "order": int(pb.dop.order()),
+                       "phase": phase, "prec": int(prec)}
+                try:
+                    measured = _measure(PHASES[phase], pb, eps, repeat)
+                except Exception as exn:
+                    logger.info("%s/%s at prec=%s failed", name, phase, prec,
+                                exc_info=True)
+                    res["error"] = repr(exn)
+                else:
+                    if measured is None:
+                        break
+                    res["time"], res["rss_growth"] = measured
+                results.append(res)
+    return {
+        "sage": sage.version.version,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "maxrss": _maxrss(),
+        "results": results,
+    }
+
+def compare(results, baseline, tolerance=0.25, min_time=0.01):
+    r"""
+    Return the list of benchmarks that are slower in ``results`` than in
+    ``baseline`` by a factor of more than ``1 + tolerance``, as tuples
+    ``(problem, phase, prec, old_time, new_time)``.
+
+    Benchmarks that take less than ``min_time`` seconds in the baseline are
+    ignored since their timings are too noisy. Benchmarks that used to succeed
+    and now fail are reported with a new time of ``None``.
+    """
+    def key(res):
+        return res["problem"], res["phase"], res["prec"]
+    old = {key(res): res for res in baseline["results"]}
+    regressions = []
+    for res in results["results"]:
+        ref = old.get(key(res))
+        if ref is None or "time" not in ref or ref["time"] < min_time:
+            continue
+        new_time = res.get("time")
+        if new_time is None or new_time > (1 + tolerance)*ref["time"]:
+            regressions.append(key(res) + (ref["time"], new_time))
+    return regressions
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog="sage -python -m ore_algebra.analytic.benchmark",
+        description="Benchmark the numerical analytic continuation code.")
+    parser.add_argument("-o", "--output", help="write the results (JSON) here")
+    parser.add_argument("-b", "--baseline",
+                        help="compare the results with this previous output")
+    parser.add_argument("-p", "--problem", action="append",
+                        choices=sorted(PROBLEMS), help="problem to run "
+                        "(may be repeated, default: all)")
+    parser.add_argument("--phase", action="append", choices=sorted(PHASES),
+                        help="phase to run (may be repeated, default: all)")
+    parser.add_argument("--prec", type=int, action="append",
+                        help="working precision in bits (may be repeated)")
+    parser.add_argument("-r", "--repeat", type=int, default=1)
+    parser.add_argument("-t", "--tolerance", type=float, default=0.25,
+                        help="relative slowdown reported as a regression")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args(args)
+
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO)
+    precs = args.prec or (30, 300, 3000)
+    results = run(args.problem, args.phase, precs, args.repeat)
+    for res in results["results"]:
+        if "error" in res:
+            status = "error: " + res["error"]
+        else:
+            status = f"{res['time']:10.4f} s {res['rss_growth']/2**20:9.1f} MiB"
+        print(f"{res['problem']:16} {res['phase']:18} {res['prec']:6} {status}")
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for problem, phase, prec, old_time, new_time in regressions:
+            new = "failed" if new_time is None else f"{new_time:.4f} s"
+            print(f"REGRESSION: {problem} {phase} prec={prec}: "
+                  f"{old_time:.4f} s -> {new}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
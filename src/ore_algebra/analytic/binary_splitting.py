@@ -223,6 +223,18 @@ Miscellaneous examples::
     [[1.395612425086089...] + [+/- ...]*I  [0.6244813348581596...]]
     [[1.395612425086089...] + [+/- ...]*I   [0.802904573389062...]]
     sage: logger.setLevel(logging.WARNING)
+
+The subproducts at the top levels of the product tree can be computed in
+separate processes. The tree is the same as in the sequential computation, and
+so is the result::
+
+    sage: dop = ((x + 1)*Dx^3 + Dx).lclm(x*Dx^2 - 1)
+    sage: mat = dop.numerical_transition_matrix([0, 1/2], 1e-2000,
+    ....:         algorithm="binsplit", binsplit_par_depth=2)
+    sage: mat0 = dop.numerical_transition_matrix([0, 1/2], 1e-2000,
+    ....:         algorithm="binsplit")
+    sage: all(a.identical(b) for a, b in zip(mat.list(), mat0.list()))
+    True
 """
 
 # Copyright 2015, 2016, 2017, 2018, 2019 Marc Mezzarobba
@@ -237,8 +249,11 @@ Miscellaneous examples::
 
 import copy
 import logging
+import multiprocessing
 import pprint
 
+from concurrent.futures import ProcessPoolExecutor
+
 import sage.rings.polynomial.polynomial_element as polyelt
 import sage.rings.polynomial.polynomial_ring as polyring
 import sage.rings.polynomial.polynomial_ring_constructor as polyringconstr
@@ -255,7 +270,7 @@ from sage.structure.sequence import Sequence
 
 from sage.rings.complex_arb import ComplexBall
 
-from . import accuracy, bounds, utilities
+from . import accuracy, bounds, profiling, utilities
 
 from .context import dctx
 from .local_solutions import (bw_shift_rec, FundamentalSolution,
@@ -800,7 +815,7 @@ class MatrixRec:
     """
 
     def __init__(self, dop, shift, singular_indices,
-                 evpts, derivatives, prec, binsplit_threshold):
+                 evpts, derivatives, prec, binsplit_threshold, par_depth=0):
 
         # TODO: perhaps dynamically optimize the representation when there are
         # no logs, algebraic exponents, etc.
@@ -864,6 +879,7 @@ class MatrixRec:
         self.ordrec = self.bwrec.order
 
         self.binsplit_threshold = max(binsplit_threshold, self.ordrec)
+        self.par_depth = par_depth
 
         Mat_rec0 = MatrixSpace(self.AlgInts_rec, self.ordrec)
         self.Mat_rec = PolynomialRing(Mat_rec0, 'Sk')
@@ -1017,20 +1033,60 @@ class MatrixRec:
     def step_matrix_binsplit(self, low, high, ord_log):
         r"""
         Compute R(high)·R(high-1)···R(low+1) by binary splitting.
+
+        When ``self.par_depth`` is positive and the range is large enough, the
+        subproducts at depth ``self.par_depth`` of the tree are computed in
+        separate processes, and then multiplied together in the main process.
         """
+        depth = self.par_depth
+        if depth <= 0 or high - low <= (self.binsplit_threshold << depth):
+            return self._step_matrix_binsplit(low, high, ord_log)
+        # Same split points as in the sequential version
+        cuts = [low, high]
+        for _ in range(depth):
+            new_cuts = []
+            for a, b in zip(cuts, cuts[1:]):
+                new_cuts += [a, (a + b)//2]
+            cuts = new_cuts + [high]
+        logger.info("computing %s subproducts using %s processes",
+                    len(cuts) - 1, len(cuts) - 1)
+        # The workers are forked and inherit self, the subproducts are sent
+        # back by pickling.
+        with ProcessPoolExecutor(
+                max_workers=len(cuts) - 1,
+                mp_context=multiprocessing.get_context('fork'),
+                initializer=_binsplit_worker_init,
+                initargs=(self, ord_log)) as pool:
+            mats = list(pool.map(_binsplit_worker, zip(cuts, cuts[1:])))
+        while len(mats) > 1:
+            mats = [mats[i].imulleft(mats[i+1])
+                    for i in range(0, len(mats), 2)]
+        return mats[0]
+
+    def _step_matrix_binsplit(self, low, high, ord_log):
         if high - low <= self.binsplit_threshold:
             mat = self.StepMatrix_class(self, low, high, ord_log)
         else:
             mid = (low + high) // 2
-            mat = self.step_matrix_binsplit(low, mid, ord_log)
+            mat = self._step_matrix_binsplit(low, mid, ord_log)
             if high - low > 400000//self.ordrec**3:
                 logger.info("(n=%s)", mid)
-            mat.imulleft(self.step_matrix_binsplit(mid, high, ord_log))
+            mat.imulleft(self._step_matrix_binsplit(mid, high, ord_log))
         return mat
 
     def __repr__(self):
         return pprint.pformat(self.__dict__)
 
+_binsplit_worker_state = None
+
+def _binsplit_worker_init(rec, ord_log):
+    global _binsplit_worker_state
+    _binsplit_worker_state = (rec, ord_log)
+
+def _binsplit_worker(rng):
+    rec, ord_log = _binsplit_worker_state
+    return rec._step_matrix_binsplit(rng[0], rng[1], ord_log)
+
 class MatrixRecsUnroller(LocalBasisMapper): # pylint: disable=attribute-defined-outside-init
 
     def __init__(self, dop, evpts, eps, derivatives, ctx=dctx):
@@ -1096,10 +1152,11 @@ class MatrixRecsUnroller(LocalBasisMapper): # pylint: disable=attribute-defined-
         # Generic recurrence matrix
         self.matrix_rec = MatrixRec(self.dop, self.leftmost, self.shifts,
                 self.evpts, self.derivatives, utilities.prec_from_eps(self.eps),
-                min(self.ctx.binsplit_thr, self._est_terms))
+                min(self.ctx.binsplit_thr, self._est_terms),
+                self.ctx.binsplit_par_depth)
 
         # Majorants
-        maj = {rt: bounds.DiffOpBound(self.dop, rt, self.shifts,
+        maj = {rt: bounds.diffop_bound(self.dop, rt, self.shifts,
                                       bound_inverse="solve",
                                       ind_roots=self.all_roots,
                                       ctx=self.ctx)
@@ -1107,7 +1164,8 @@ class MatrixRecsUnroller(LocalBasisMapper): # pylint: disable=attribute-defined-
 
         wrapper = bounds.MultiDiffOpBound(maj.values())
         # TODO: switch to fast_fail=True?
-        stop = accuracy.StopOnRigorousBound(wrapper, self.eps, fast_fail=False)
+        stop = accuracy.StopOnRigorousBound(wrapper, self.eps, fast_fail=False,
+                                            ctx=self.ctx)
 
         class BoundCallbacks(accuracy.BoundCallbacks): # pylint: disable=no-self-argument
             # “self” refers to the MatrixRecsUnroller
@@ -1175,7 +1233,10 @@ class MatrixRecsUnroller(LocalBasisMapper): # pylint: disable=attribute-defined-
                 si += 1
             # Unroll by binary splitting, automatically handling exceptional
             # indices as necessary
-            fwd = self.matrix_rec.step_matrix_binsplit(prev, self.shift, ord_log)
+            with profiling.span(self.ctx, "binsplit.step_matrix",
+                                terms=self.shift - prev):
+                fwd = self.matrix_rec.step_matrix_binsplit(prev, self.shift,
+                                                           ord_log)
             # Extend known solutions
             logger.log(logging.DEBUG-1, "n=%s, extending known solutions",
                        self.shift)
@@ -1199,6 +1260,9 @@ class MatrixRecsUnroller(LocalBasisMapper): # pylint: disable=attribute-defined-
                 break
             prev = self.shift
         logger.info("summed %d terms, tails <= %s", self.shift, tail_bound)
+        profiling.count(self.ctx, "terms.binsplit", self.shift)
+        profiling.sample(self.ctx, "prec.binsplit",
+                         utilities.prec_from_eps(self.eps))
         assert tail_bound.parent() is self.ctx.IR
         # logger.debug("abstract partial sums:\n* %s",
         #         '\n* '.join(str(sol) for sol in self.irred_factor_cols))
@@ -1227,7 +1291,9 @@ class MatrixRecsUnroller(LocalBasisMapper): # pylint: disable=attribute-defined-
 
 def fundamental_matrix_regular(dop, evpts, eps, fail_fast, effort, ctx=dctx): # pylint: disable=unused-argument
     rows = evpts.jet_order
-    cols = MatrixRecsUnroller(dop, evpts, eps, rows, ctx).run()
+    with profiling.span(ctx, "sum.binsplit", order=dop.order(),
+                        prec=utilities.prec_from_eps(eps)):
+        cols = MatrixRecsUnroller(dop, evpts, eps, rows, ctx).run()
     mats = [matrix([sol.value[i] for sol in cols]).transpose()
             for i in range(len(evpts))]
     return mats
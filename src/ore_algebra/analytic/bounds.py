@@ -144,9 +144,9 @@ from sage.rings.real_mpfr import RealField, RR
 from sage.structure.factorization import Factorization
 
 from .. import ore_algebra
-from . import local_solutions, utilities
+from . import local_solutions, profiling, utilities
 
-from .context import dctx
+from .context import Context, dctx
 from .differential_operator import DifferentialOperator
 from .safe_cmp import *
 
@@ -1039,7 +1039,7 @@ class RatSeqBound:
             fmt += "      ..., {asympt}"
             fmt += "{stairs}"
         n = self.den.variable_name()
-        bnds = list(zip(*(self(k) for k in range(8))))
+        bnds = list(zip(*self.eval_many(range(8))))
         stairs = self._stairs(len(self))
         dscs = []
         assert len(self.nums) == len(bnds) == len(stairs)
@@ -1214,6 +1214,62 @@ class RatSeqBound:
             bounds.append(bound)
         return bounds
 
+    def _bound_rat_many(self, ns, ord, tight=None):
+        r"""
+        Same as ``[self._bound_rat(n, ord, tight) for n in ns]``.
+
+        In the common case ``ord == 1``, the reciprocal polynomials of the
+        numerators and of the denominator are evaluated on ``[0, 1/n]`` as dot
+        products with a single table of powers per index, shared by all
+        sequences, instead of going through series composition.
+
+        TESTS::
+
+            sage: from ore_algebra.analytic.bounds import RatSeqBound
+            sage: Pols.<n> = QQ[]
+            sage: bnd = RatSeqBound([n^5-100*n^4+2, n^2],
+            ....:                   n^3*(n-1/2)*(n-2)^2*(n+3), {0:3, 2:2})
+            sage: ns = [1, 3, 10, 1000]
+            sage: all(ref.upper() <= b.upper()
+            ....:     for k, bounds in zip(ns, bnd._bound_rat_many(ns, 1))
+            ....:     for ref, b in zip(bnd.ref(k, 1), bounds))
+            True
+        """
+        if ord != 1:
+            return [self._bound_rat(n, ord, tight) for n in ns]
+        IR, IC = self.IR, self.IC
+        polys = [list(self._rcpq_den)] + [list(num) for num in self._rcpq_nums]
+        length = max(len(coeffs) for coeffs in polys)
+        if hasattr(IC, '_sum_of_products'):
+            def dot(coeffs, pows):
+                return IC._sum_of_products(zip(coeffs, pows))
+        else:
+            def dot(coeffs, pows):
+                return sum((c*p for c, p in zip(coeffs, pows)), IC.zero())
+        res = []
+        for n in ns:
+            assert n not in self.exn
+            iv = IC(IR.zero().union(~IR(n)))
+            pows = [IC.one()]
+            for _ in range(length - 1):
+                pows.append(pows[-1]*iv)
+            den, *nums = [dot(coeffs, pows) for coeffs in polys]
+            invabscst = IR.one()
+            if tight or tight is None and den.accuracy() < 0:
+                # see _bound_rat()
+                invabscst = IR.zero().union(~self._lbound_den(n))
+                invden = IC.one()
+            else:
+                invden = ~den
+            bounds = []
+            for num in nums:
+                bound = (invabscst*(invden*num).above_abs()).above_abs()
+                if not bound.is_finite():
+                    bound = IR(infinity)
+                bounds.append(bound)
+            res.append(bounds)
+        return res
+
     @cached_method
     def _stairs(self, count):
         r"""
@@ -1235,14 +1291,27 @@ class RatSeqBound:
         stairs = [[(infinity, self.IR.zero())] for _ in self.nums]
         ord = sum(m for n, m in self.exn.items())
         exn = sorted([n for n in self.exn if n >= 0], reverse=True)
+        # We want the bound to hold for ordinary k ≥ n too, so we take the max
+        # of the exceptional value at n and the value at n + 1, when n + 1 is an
+        # ordinary index. (When n + 1 is an exceptional index, it is taken care
+        # of at the previous iteration below.) The values at ordinary indices
+        # are computed first, in batches of equal order.
+        ords = {}
+        for n in exn:
+            ords[n] = ord
+            ord -= self.exn[n]
+        batches = collections.defaultdict(list)
+        for n in exn:
+            if n + 1 not in self.exn:
+                batches[ords[n]].append(n + 1)
+        all_rats = {}
+        for batch_ord, ns in batches.items():
+            all_rats.update(zip(ns, self._bound_rat_many(ns, batch_ord)))
+        ord = sum(m for n, m in self.exn.items())
         for n in exn:
-            # We want the bound to hold for ordinary k ≥ n too, so we take the
-            # max of the exceptional value at n and the value at n + 1, when
-            # n + 1 is an ordinary index. (When n + 1 is an exceptional index,
-            # it has already been done during the previous iteration.)
             refs = self.ref(n, ord)
             if n + 1 not in exn:
-                rats = self._bound_rat(n + 1, ord)
+                rats = all_rats[n + 1]
             else:
                 rats = [self.IR.zero()]*len(refs)
             assert len(refs) == len(rats) == len(stairs) == len(self.nums)
@@ -1311,6 +1380,41 @@ class RatSeqBound:
             bound_rat = self._bound_rat(n, ord, tight)
             return [b1.max(b2) for b1, b2 in zip(bound_rat, bound_exn)]
 
+    def eval_many(self, ns, tight=None):
+        r"""
+        Same as ``[self(n, tight) for n in ns]``, with the evaluations at
+        ordinary indices done in batches.
+
+        EXAMPLES::
+
+            sage: from ore_algebra.analytic.bounds import RatSeqBound
+            sage: Pols.<n> = QQ[]
+            sage: bnd = RatSeqBound([-n, Pols(1)], n*(n-3), {-1: 1, 0:1, 3:1})
+            sage: bnd.eval_many(range(2, 5))
+            [[[22.43...], [...]], [[12.00...], [...]], [[12.00...], [...]]]
+            sage: bnd = RatSeqBound([Pols(1), n^2 - 3], n*(n-1)*(n+2)*(n-3/2))
+            sage: all(ref.upper() <= b.upper()
+            ....:     for k, bounds in zip(range(2, 50), bnd.eval_many(range(2, 50)))
+            ....:     for ref, b in zip(bnd.ref(k, 1), bounds))
+            True
+        """
+        ns = list(ns)
+        batches = collections.defaultdict(list)
+        for n in ns:
+            if n not in self.exn:
+                batches[self.ord(n)].append(n)
+        rats = {}
+        for ord, idx in batches.items():
+            rats.update(zip(idx, self._bound_rat_many(idx, ord, tight)))
+        res = []
+        for n in ns:
+            bound_exn = self._bound_exn(n)
+            if n in self.exn:
+                res.append(bound_exn)
+            else:
+                res.append([b1.max(b2) for b1, b2 in zip(rats[n], bound_exn)])
+        return res
+
     def ref(self, n, ord):
         r"""
         Reference value for a single n.
@@ -1870,20 +1974,30 @@ class DiffOpBound:
     def can_refine(self):
         return self._effort < self.max_effort
 
-    def refine(self):
+    def refine(self, ctx=None):
+        r"""
+        Try to replace the bound by a tighter one.
+
+        The optional context ``ctx`` is used for reporting only and defaults to
+        the one the bound was created with.
+        """
         # XXX: make it possible to increase the precision of self.IR, self.IC
         if not self.can_refine():
             logger.debug("majorant no longer refinable")
             return
+        if ctx is None:
+            ctx = self.ctx
         self._effort += 1
         logger.info("refining majorant (effort = %s)...", self._effort)
-        if self.bound_inverse == 'simple':
-            self.bound_inverse = 'solve'
-            self._update_den_bound()
-        else:
-            new_pol_part_len = max(2, 2*self.pol_part_len())
-            split = self._split_dop(new_pol_part_len)
-            self._update_num_bound(new_pol_part_len, *split)
+        profiling.count(ctx, "bound.refinements")
+        with profiling.span(ctx, "bound.refine", effort=self._effort):
+            if self.bound_inverse == 'simple':
+                self.bound_inverse = 'solve'
+                self._update_den_bound()
+            else:
+                new_pol_part_len = max(2, 2*self.pol_part_len())
+                split = self._split_dop(new_pol_part_len)
+                self._update_num_bound(new_pol_part_len, *split)
 
     def pol_part_len(self):
         return len(self.majseq_pol_part)
@@ -2431,6 +2545,123 @@ class DiffOpBound:
         p.set_legend_options(handlelength=4, shadow=False)
         return p
 
+CacheInfo = collections.namedtuple('CacheInfo',
+        ['hits', 'misses', 'evictions', 'size', 'max_size'])
+
+class DiffOpBoundCache:
+    r"""
+    Cache of DiffOpBound objects.
+
+    Bounds are identified by the operator, the leftmost exponent, the special
+    shifts, the options that influence their construction, and the precisions
+    of the interval fields of the context, which are the only parts of the
+    context that a DiffOpBound depends on. A bound returned by the cache keeps
+    the refinements made during earlier uses, so that later computations (at
+    other steps of a path starting from the same point, at other precisions,
+    or in later calls) start from the refined version.
+
+    Cached bounds are shared between callers, and are therefore created with a
+    context of their own that holds nothing but these interval fields. In
+    particular, the cache does not keep alive the recorders or transition
+    matrix caches of the contexts it is called with. Callers that want the
+    refinements to be reported to their recorder pass their context to
+    :meth:`DiffOpBound.refine`.
+
+    EXAMPLES::
+
+        sage: from ore_algebra import DifferentialOperators
+        sage: from ore_algebra.analytic.bounds import DiffOpBoundCache
+        sage: Dops, x, Dx = DifferentialOperators()
+        sage: cache = DiffOpBoundCache(max_size=2)
+        sage: maj = cache.get((x^2 + 1)*Dx^2 + 2*x*Dx)
+        sage: maj.refine()
+        sage: cache.get((x^2 + 1)*Dx^2 + 2*x*Dx) is maj
+        True
+        sage: cache.get(Dx - 1) is maj
+        False
+        sage: cache.cache_info()
+        CacheInfo(hits=1, misses=2, evictions=0, size=2, max_size=2)
+
+    The bounds do not hold on to the contexts of the callers::
+
+        sage: from ore_algebra.analytic.context import Context
+        sage: ctx = Context()
+        sage: cache.get(Dx - 1, ctx=ctx).ctx is ctx
+        False
+
+    The analytic continuation code uses a shared cache, unless the
+    ``bound_cache`` option of the context is set to ``False``::
+
+        sage: from ore_algebra.analytic.bounds import diffop_bound_cache
+        sage: diffop_bound_cache.clear()
+        sage: _ = ((x^2 + 1)*Dx^2 + 2*x*Dx).numerical_transition_matrix([0, 1])
+        sage: diffop_bound_cache.cache_info()
+        CacheInfo(hits=..., misses=..., evictions=0, size=..., max_size=64)
+    """
+
+    def __init__(self, max_size=64):
+        self.max_size = max_size
+        self._bounds = collections.OrderedDict()
+        self._hits = self._misses = self._evictions = 0
+
+    def __repr__(self):
+        return f"Cache of {len(self._bounds)} bounds"
+
+    @staticmethod
+    def _key(dop, leftmost, special_shifts, ctx, kwds):
+        if isinstance(leftmost, PolynomialRoot):
+            leftmost = (leftmost.pol, leftmost.index)
+        if special_shifts is not None:
+            special_shifts = tuple(sorted((int(s), int(m))
+                                          for s, m in special_shifts))
+        opts = tuple(sorted((k, v) for k, v in kwds.items()
+                            if k != "ind_roots"))
+        return (dop.parent(), tuple(dop.list()), leftmost, special_shifts,
+                opts, ctx.IR.precision(), ctx.IC.precision())
+
+    def get(self, dop, leftmost=0, special_shifts=None, *, ctx=dctx, **kwds):
+        r"""
+        Return a DiffOpBound for the given parameters (as accepted by
+        :class:`DiffOpBound`), creating it if it is not in the cache.
+        """
+        dop = DifferentialOperator(dop)
+        key = self._key(dop, leftmost, special_shifts, ctx, kwds)
+        try:
+            maj = self._bounds[key]
+        except KeyError:
+            self._misses += 1
+            own_ctx = Context(bounds_prec=ctx.IR.precision())
+            maj = DiffOpBound(dop, leftmost, special_shifts, ctx=own_ctx,
+                              **kwds)
+            self._bounds[key] = maj
+            if len(self._bounds) > self.max_size:
+                self._bounds.popitem(last=False)
+                self._evictions += 1
+            return maj
+        self._hits += 1
+        self._bounds.move_to_end(key)
+        return maj
+
+    def cache_info(self):
+        return CacheInfo(self._hits, self._misses, self._evictions,
+                         len(self._bounds), self.max_size)
+
+    def clear(self):
+        self._bounds.clear()
+        self._hits = self._misses = self._evictions = 0
+
+diffop_bound_cache = DiffOpBoundCache()
+
+def diffop_bound(dop, leftmost=0, special_shifts=None, *, ctx=dctx, **kwds):
+    r"""
+    Return a DiffOpBound with the given parameters, taken from the shared cache
+    unless ``ctx.bound_cache`` is ``False``.
+    """
+    if ctx.bound_cache:
+        return diffop_bound_cache.get(dop, leftmost, special_shifts, ctx=ctx,
+                                      **kwds)
+    return DiffOpBound(dop, leftmost, special_shifts, ctx=ctx, **kwds)
+
 class MultiDiffOpBound:
     r"""
     Ad hoc wrapper for passing several DiffOpBounds to StopOnRigorousBound.
@@ -2446,9 +2677,9 @@ class MultiDiffOpBound:
     def can_refine(self):
         return any(m.can_refine() for m in self.majs)
 
-    def refine(self):
+    def refine(self, ctx=None):
         for m in self.majs:
-            m.refine()
+            m.refine(ctx)
 
     def effort(self):
         return min(m.effort() for m in self.majs)
@@ -16,6 +16,9 @@ import pprint
 
 from sage.rings.real_arb import RealBallField
 
+from .cost_model import CostModel
+from .transition_cache import TransitionMatrixCache
+
 class Context:
     r"""
     Analytic continuation context
@@ -34,15 +37,40 @@ class Context:
       deforming the path) that preserves the values of solutions satisfying this
       assumption.
 
+    - ``binsplit_par_depth`` (int) -- Number of levels at the top of the
+      product trees of the binary splitting algorithm that are split among
+      worker processes, so that up to ``2^binsplit_par_depth`` processes are
+      forked for each large enough product. (These processes come in addition
+      to those requested by ``ncpus``.) Default: 0 (everything is computed in
+      the main process).
+
     - ``binsplit_thr`` (int) -- Threshold used in the binary splitting algorithm
       to determine when to use a basecase algorithm for a subproduct.
 
     - ``bit_burst_thr`` (int) -- Minimal bit size to consider using bit-burst
       steps instead of direct binary splitting.
 
+    - ``bound_cache`` (boolean) -- Whether to reuse the majorants (see
+      :class:`~ore_algebra.analytic.bounds.DiffOpBoundCache`) computed for the
+      same local operator in earlier computations, along with their
+      refinements. Default: ``True``.
+
     - ``bounds_prec`` (int) -- Working precision for the computation of error
       bounds and other internal low-precision calculations.
 
+    - ``cache`` -- A
+      :class:`~ore_algebra.analytic.transition_cache.TransitionMatrixCache`, or
+      the name of a directory in which to create one, used to store and reuse
+      the transition matrices of the steps of analytic continuation paths across
+      calls. Default: ``None`` (no persistent cache).
+
+    - ``cost_model`` -- A :class:`~ore_algebra.analytic.cost_model.CostModel`
+      used to choose between direct summation, binary splitting and the
+      bit-burst method for each step, or the string ``"calibrate"`` to use a
+      model calibrated on the host machine the first time it is needed. The
+      ``algorithm`` option, when set, takes precedence. Default: ``None`` (use
+      a fixed heuristic).
+
     - ``deform`` (boolean) -- (EXPERIMENTAL) Whether to attempt to automatically
       deform the analytic continuation path into a faster one. Enabling this
       should result in significantly faster integration for problems with many
@@ -52,11 +80,18 @@ class Context:
     - ``force_algorithm`` (boolean) -- If ``True``, only use the algorithm
       specified by the ``algorithm`` option.
 
+    - ``ncpus`` (int) -- Number of worker processes used to compute the
+      transition matrices of the steps of an analytic continuation path, or
+      the loops and connections between singular points involved in the
+      computation of monodromy matrices. With the default value 1, everything
+      is done sequentially in the main process.
+
     - ``recorder`` -- An object that will be used to record various intermediate
       results for debugging and analysis purposes. At the moment recording just
       consists in writing data to some fields of the object. Look at the source
       code to see what fields are available; define those fields as properties
-      to process the data.
+      to process the data. A :class:`~ore_algebra.analytic.profiling.Profiler`
+      additionally collects timings of the main phases of the computation.
 
     - ``simple_approx_thr`` (int) -- Bit size above which vertices of the
       analytic continuation path should be replaced by simpler approximations if
@@ -89,11 +124,16 @@ class Context:
     def _set_options(self, *,
                      algorithm=None,
                      assume_analytic=False,
+                     binsplit_par_depth=0,
                      binsplit_thr=128,
                      bit_burst_thr=32,
+                     bound_cache=True,
                      bounds_prec=53,
+                     cache=None,
+                     cost_model=None,
                      deform=False,
                      force_algorithm=False,
+                     ncpus=1,
                      recorder=None,
                      simple_approx_thr=64,
                      squash_intervals=False,
@@ -108,12 +148,30 @@ class Context:
             raise TypeError("assume_analytic", type(assume_analytic))
         self.assume_analytic = assume_analytic
 
+        self.binsplit_par_depth = int(binsplit_par_depth)
+        if self.binsplit_par_depth < 0:
+            raise ValueError("binsplit_par_depth", binsplit_par_depth)
+
         self.binsplit_thr = int(binsplit_thr)
 
         self.bit_burst_thr = int(bit_burst_thr)
 
+        if not isinstance(bound_cache, bool):
+            raise TypeError("bound_cache", type(bound_cache))
+        self.bound_cache = bound_cache
+
         self._set_interval_fields(bounds_prec)
 
+        if cache is not None and not isinstance(cache, TransitionMatrixCache):
+            cache = TransitionMatrixCache(cache)
+        self.cache = cache
+
+        # "calibrate" is kept as is, the model is calibrated when first used
+        if (cost_model is not None and cost_model != "calibrate"
+                and not isinstance(cost_model, CostModel)):
+            raise TypeError("cost_model", type(cost_model))
+        self.cost_model = cost_model
+
         if not isinstance(deform, bool):
             raise TypeError("deform", type(deform))
         self.deform = deform
@@ -122,6 +180,10 @@ class Context:
             raise TypeError("force_algorithm", type(force_algorithm))
         self.force_algorithm = force_algorithm
 
+        self.ncpus = int(ncpus)
+        if self.ncpus < 1:
+            raise ValueError("ncpus", ncpus)
+
         self.recorder = recorder
 
         self.simple_approx_thr = int(simple_approx_thr)
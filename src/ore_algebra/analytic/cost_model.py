@@ -0,0 +1,271 @@
+# vim: tw=80
+r"""
+Cost model for the choice of summation algorithm
+
+A :class:`CostModel` predicts the time needed to compute the transition matrix
+of an analytic continuation step by direct summation, by binary splitting, and
+by the bit-burst method, as a function of the order of the recurrence, the
+height and degree of the operator, the bit size of the endpoints, the length
+of the step relative to the radius of convergence, and the target precision.
+The constants of the model can be calibrated on the host machine using a small
+benchmark.
+
+Passing a cost model to the analytic continuation code via the ``cost_model``
+option of :class:`~ore_algebra.analytic.context.Context` makes it select the
+algorithm separately for each step::
+
+    sage: from ore_algebra import DifferentialOperators
+    sage: from ore_algebra.analytic.cost_model import CostModel
+    sage: Dops, x, Dx = DifferentialOperators()
+    sage: dop = (x^2 + 1)*Dx^2 + 2*x*Dx
+    sage: cm = CostModel.calibrate(precs=(256, 1024), repeat=1); cm
+    Cost model (naive=..., naive_rec=..., binsplit=..., overhead=..., bit_burst=...)
+    sage: dop.numerical_transition_matrix([0, 1/3], 1e-10, cost_model=cm)[0,1]
+    [0.32175055439...]
+    sage: dop.numerical_transition_matrix([0, 1/3], 1e-1000,
+    ....:                                 cost_model=cm)[0,1]
+    [0.32175055439664219340...]
+
+The option also accepts the string ``"calibrate"``, in which case a model is
+calibrated the first time an algorithm needs to be chosen, and then shared by
+all subsequent computations of the session::
+
+    sage: dop.numerical_transition_matrix([0, 1/3], 1e-10,
+    ....:                                 cost_model="calibrate")[0,1]
+    [0.32175055439...]
+
+TESTS::
+
+    sage: from ore_algebra.analytic.path import Point, Step
+    sage: from ore_algebra.analytic.differential_operator import DifferentialOperator
+    sage: dop = DifferentialOperator(dop)
+    sage: step = Step(Point(0, dop), Point(1/3, dop))
+    sage: cm = CostModel()
+    sage: cm.choose(dop, [step], 30, 32)
+    'naive'
+    sage: cm.choose(dop, [step], 100000, 32)
+    'binsplit'
+    sage: step = Step(Point(0, dop), Point(1/3 + 2^-5000, dop))
+    sage: cm.choose(dop, [step], 100000, 32)
+    'bit-burst'
+"""
+
+# Distributed under the terms of the GNU General Public License (GPL) either
+# version 2, or (at your option) any later version
+#
+# http://www.gnu.org/licenses/
+
+import logging
+import math
+import time
+
+logger = logging.getLogger(__name__)
+
+class CostModel:
+    r"""
+    Predict the cost of the summation algorithms used for individual steps.
+
+    The predicted costs (in arbitrary units, or in seconds after calibration)
+    of summing ``nterms`` terms of a series solution of an operator of degree
+    ``deg`` whose associated recurrence has order ``ordrec`` to ``prec`` bits
+    are
+
+    - ``naive * ordrec * nterms * prec + naive_rec * ordrec * deg * nterms``
+      for direct summation, the second term accounting for the evaluation of
+      the coefficients of the recurrence,
+
+    - ``binsplit * ordrec * nterms * (ordrec^2 * size + overhead)`` for binary
+      splitting, where ``size`` accounts for the height of the operator and the
+      bit size of the evaluation point,
+
+    - ``bit_burst`` times the sum of the binary splitting costs of its substeps
+      for the bit-burst method.
+
+    With the default constants, and for endpoints too small for the bit-burst
+    method to apply, the choice between direct summation and binary splitting
+    is the same as that made by the fixed heuristic used when no cost model is
+    specified. (For larger endpoints, the heuristic only accounts for the first
+    bit-burst substep.)
+    """
+
+    def __init__(self, naive=1., binsplit=1., overhead=256, naive_rec=0.,
+                 bit_burst=1.):
+        self.naive = float(naive)
+        self.binsplit = float(binsplit)
+        self.overhead = overhead
+        self.naive_rec = float(naive_rec)
+        self.bit_burst = float(bit_burst)
+
+    def __repr__(self):
+        return (f"Cost model (naive={self.naive:.3g}, "
+                f"naive_rec={self.naive_rec:.3g}, "
+                f"binsplit={self.binsplit:.3g}, overhead={self.overhead:.3g}, "
+                f"bit_burst={self.bit_burst:.3g})")
+
+    @staticmethod
+    def nterms(steps, tgt_prec):
+        r"""
+        Rough estimate of the number of terms of the local expansions needed to
+        reach the endpoints of ``steps`` with a precision of ``tgt_prec`` bits.
+        """
+        # For an entire function, the terms eventually decrease faster than any
+        # geometric sequence; lg(tgt_prec) is a reasonable guess of the
+        # effective convergence rate at the precisions of interest.
+        lg = math.log2(max(tgt_prec, 2))
+        start = steps[0].start
+        rad = start.dist_to_sing()
+        for step in steps:
+            ratio = (rad/step.length()).log(2)
+            if ratio.is_finite():
+                lg = min(lg, float(ratio.lower()))
+        return tgt_prec/max(lg, 1/8) + 1
+
+    def naive_cost(self, ordrec, deg, nterms, prec):
+        return self.naive*ordrec*nterms*prec + self.naive_rec*ordrec*deg*nterms
+
+    def binsplit_cost(self, ordrec, nterms, size):
+        return self.binsplit*ordrec*nterms*(ordrec**2*size + self.overhead)
+
+    def bit_burst_cost(self, ordrec, nterms, tgt_prec, extra_size, point_size,
+                       bit_burst_prec):
+        # first substep: full length, endpoint truncated to bit_burst_prec bits
+        cost = self.binsplit_cost(ordrec, nterms, extra_size + bit_burst_prec)
+        # subsequent substeps: the length is about 2^(-size/2) when the
+        # endpoint has size bits
+        size = 2*bit_burst_prec
+        while size < point_size:
+            cost += self.binsplit_cost(ordrec, tgt_prec/(size/2) + 1,
+                                       extra_size + 2*size)
+            size *= 2
+        return self.bit_burst*cost
+
+    @staticmethod
+    def _sizes(dop, steps, tgt_prec):
+        ordrec = dop._my_to_S().order()
+        # same ad hoc size estimate as in analytic_continuation._use_binsplit
+        extra_size = (dop._naive_height() + 16*ordrec
+                      + 16*max(step.algdeg() for step in steps)**2)
+        point_size = max(steps[0].start.bit_burst_bits(tgt_prec),
+                         *(step.end.bit_burst_bits(tgt_prec) for step in steps))
+        return ordrec, extra_size, point_size
+
+    def choose(self, dop, steps, tgt_prec, bit_burst_prec):
+        r"""
+        Return the name of the fastest algorithm according to this model:
+        ``"naive"``, ``"binsplit"`` or ``"bit-burst"``.
+        """
+        ordrec, extra_size, point_size = self._sizes(dop, steps, tgt_prec)
+        nterms = self.nterms(steps, tgt_prec)
+        costs = {
+            "naive": self.naive_cost(ordrec, dop.degree(), nterms, tgt_prec),
+            "binsplit": self.binsplit_cost(ordrec, nterms,
+                                           extra_size + point_size),
+        }
+        if len(steps) == 1 and point_size > 2*bit_burst_prec:
+            costs["bit-burst"] = self.bit_burst_cost(ordrec, nterms, tgt_prec,
+                                                     extra_size, point_size,
+                                                     bit_burst_prec)
+        choice = min(costs, key=costs.get)
+        logger.debug("predicted costs: %s, choosing %s", costs, choice)
+        return choice
+
+    @classmethod
+    def calibrate(cls, precs=(256, 1024, 4096), repeat=3):
+        r"""
+        Calibrate a cost model by timing the available algorithms on a few
+        operators of different orders, degrees and heights at the precisions
+        ``precs``.
+
+        The majorants are not shared between the runs (``bound_cache=False``)
+        so that all of them include the construction of the error bounds.
+        """
+        from sage.rings.rational_field import QQ
+        from sage.rings.real_arb import RBF
+        from .. import DifferentialOperators
+        from .context import dctx
+        from .differential_operator import DifferentialOperator
+        from .path import Point, Step
+
+        Dops, x, Dx = DifferentialOperators(QQ, 'x')
+        dops = [(x**2 + 1)*Dx**2 + 2*x*Dx,
+                (x**2 + 1)*Dx**3 + (3*x + 1)*Dx - 2,
+                (x**2 + 1)*Dx**4 + QQ((123456789, 1234567))*x**3*Dx**2
+                    + QQ((98765, 7))*x - 1]
+        data = {"naive": [], "binsplit": [], "bit-burst": []}
+        for dop in dops:
+            dop = DifferentialOperator(dop)
+            deg = dop.degree()
+            for prec in precs:
+                eps = RBF.one() >> prec
+                end = QQ((1, 4))
+                # an endpoint large enough for bit-burst substeps to apply
+                big_end = end + QQ((1, 3))**(prec//4)
+                for algorithm in data:
+                    path = [0, big_end if algorithm == "bit-burst" else end]
+                    step = Step(Point(path[0], dop), Point(path[1], dop))
+                    nterms = cls.nterms([step], prec)
+                    ordrec, extra_size, point_size = cls._sizes(dop, [step],
+                                                                prec)
+                    elapsed = math.inf
+                    for _ in range(repeat):
+                        t = time.perf_counter()
+                        dop.numerical_transition_matrix(path, eps,
+                                algorithm=("naive" if algorithm == "naive"
+                                           else "binsplit"),
+                                force_algorithm=True, bound_cache=False)
+                        elapsed = min(elapsed, time.perf_counter() - t)
+                    if algorithm == "naive":
+                        feat = (ordrec*nterms*prec, ordrec*deg*nterms)
+                    elif algorithm == "binsplit":
+                        feat = (ordrec*nterms*ordrec**2*(extra_size
+                                                         + point_size),
+                                ordrec*nterms)
+                    else:
+                        bit_burst_prec = max(2*step.prec(prec),
+                                             dctx.bit_burst_thr)
+                        feat = (ordrec, nterms, prec, extra_size, point_size,
+                                bit_burst_prec)
+                    data[algorithm].append((elapsed, feat))
+        naive, naive_rec = _fit(data["naive"], 0.)
+        binsplit, binsplit_overhead = _fit(data["binsplit"], 256.)
+        model = cls(naive, binsplit, binsplit_overhead/binsplit, naive_rec)
+        # the bit-burst method is modeled relative to binary splitting
+        pts = [(t, (model.bit_burst_cost(*feat),))
+               for t, feat in data["bit-burst"]]
+        model.bit_burst, _ = _fit(pts, 0.)
+        logger.info("calibrated %s", model)
+        return model
+
+def _fit(pts, ratio):
+    r"""
+    Least squares fit of ``t ≈ a*f + b*g`` with ``a > 0`` and ``b ≥ 0`` for a
+    list of ``(t, (f, g))`` (or ``(t, (f,))`` with ``b = 0``), falling back to
+    a fit of ``t ≈ a*(f + ratio*g)`` when the two-parameter fit fails.
+    """
+    if all(len(feat) == 2 for _, feat in pts):
+        sff = sum(f*f for _, (f, g) in pts)
+        sfg = sum(f*g for _, (f, g) in pts)
+        sgg = sum(g*g for _, (f, g) in pts)
+        stf = sum(t*f for t, (f, g) in pts)
+        stg = sum(t*g for t, (f, g) in pts)
+        det = sff*sgg - sfg*sfg
+        if det > 0:
+            a = (stf*sgg - stg*sfg)/det
+            b = (stg*sff - stf*sfg)/det
+            if a > 0 and b >= 0:
+                return a, b
+    h = [(t, feat[0] + (ratio*feat[1] if len(feat) == 2 else 0.))
+         for t, feat in pts]
+    a = sum(t*f for t, f in h)/sum(f*f for _, f in h)
+    return a, ratio*a
+
+_calibrated = None
+
+def calibrated_model():
+    r"""
+    Cost model calibrated on first use and then shared by the whole session.
+    """
+    global _calibrated
+    if _calibrated is None:
+        _calibrated = CostModel.calibrate()
+    return _calibrated
@@ -0,0 +1,73 @@
+# cython: language=c++
+# cython: language_level=3
+r"""
+Evaluation of a polynomial with ball coefficients at many points in one call
+"""
+
+# Distributed under the terms of the GNU General Public License (GPL) either
+# version 2, or (at your option) any later version
+#
+# http://www.gnu.org/licenses/
+
+from sage.libs.arb.types cimport *
+from sage.libs.arb.arb cimport *
+from sage.rings.real_arb cimport RealBall
+from sage.structure.parent cimport Parent
+
+cdef extern from *:
+    """
+    #include "flint/flint.h"
+    #if __FLINT_VERSION >= 3
+    #include "flint/arb.h"
+    #include "flint/arb_poly.h"
+    #else
+    #include "arb.h"
+    #include "arb_poly.h"
+    #endif
+    """
+    arb_ptr _arb_vec_init(long n)
+    void _arb_vec_clear(arb_ptr v, long n)
+    void _arb_poly_evaluate_vec_iter(arb_ptr ys, arb_srcptr poly, long plen,
+                                     arb_srcptr xs, long n, long prec)
+
+def real_balls(list coeffs, list pts, Parent tgt, long prec):
+    r"""
+    Values at each of the real balls ``pts`` of the polynomial with real ball
+    coefficients ``coeffs``, as elements of ``tgt`` (a real ball field of
+    precision ``prec``).
+
+    The coefficients and points are copied once to Arb vectors, and the
+    evaluation takes place in a single call to Arb, without any Python-level
+    operation per point.
+
+    TESTS::
+
+        sage: from ore_algebra.analytic.eval_poly_vec import real_balls
+        sage: real_balls([RBF(3), RBF(2), RBF(1)], [RBF(0), RBF(1), RBF(-1/2)],
+        ....:            RBF, 53)
+        [3.000000000000000, 6.000000000000000, 2.250000000000000]
+    """
+    cdef long plen = len(coeffs)
+    cdef long n = len(pts)
+    cdef long i
+    cdef RealBall b
+    cdef list res = [None]*n
+    cdef arb_ptr c = _arb_vec_init(plen)
+    cdef arb_ptr x = _arb_vec_init(n)
+    cdef arb_ptr y = _arb_vec_init(n)
+    try:
+        for i in range(plen):
+            arb_set(c + i, (<RealBall?> coeffs[i]).value)
+        for i in range(n):
+            arb_set(x + i, (<RealBall?> pts[i]).value)
+        _arb_poly_evaluate_vec_iter(y, c, plen, x, n, prec)
+        for i in range(n):
+            b = RealBall.__new__(RealBall)
+            b._parent = tgt
+            arb_swap(b.value, y + i)
+            res[i] = b
+    finally:
+        _arb_vec_clear(c, plen)
+        _arb_vec_clear(x, n)
+        _arb_vec_clear(y, n)
+    return res
@@ -16,6 +16,7 @@ D-Finite analytic functions
 
 import collections
 import logging
+import pickle
 import sys
 
 import sage.plot.all as plot
@@ -35,6 +36,7 @@ from sage.rings.real_mpfr import RealNumber
 
 from . import analytic_continuation as ancont
 from . import polynomial_approximation as polapprox
+from . import utilities
 
 from .analytic_continuation import normalize_post_transform
 from .differential_operator import DifferentialOperator
@@ -52,6 +54,9 @@ logger = logging.getLogger(__name__)
 
 RealPolApprox = collections.namedtuple('RealPolApprox', ['pol', 'prec'])
 
+CacheInfo = collections.namedtuple('CacheInfo',
+        ['hits', 'misses', 'evictions', 'size', 'max_size'])
+
 class DFiniteFunction:
     r"""
     At the moment, this class just provides a simple caching mechanism for
@@ -59,6 +64,11 @@ class DFiniteFunction:
     evolve to support evaluations on the complex plane, branch cuts, ring
     operations on D-Finite functions, and more. Do not expect any API stability.
 
+    The polynomial approximations are kept in memory until their estimated
+    total size exceeds ``max_cache_size`` bytes (if specified), at which point
+    the least recently used ones are discarded. See :meth:`cache_info`,
+    :meth:`save_cache` and :meth:`load_cache`.
+
     TESTS::
 
         sage: from ore_algebra import *
@@ -133,7 +143,7 @@ class DFiniteFunction:
     #   family otherwise.
 
     def __init__(self, dop, ini, name="dfinitefun",
-                 max_prec=256, max_rad=RBF('inf')):
+                 max_prec=256, max_rad=RBF('inf'), max_cache_size=None):
         self.dop = dop = DifferentialOperator(dop)
         if not isinstance(ini, dict):
             ini = {0: ini}
@@ -158,7 +168,10 @@ class DFiniteFunction:
         self.max_prec = max_prec
 
         self._inivecs = {}
-        self._polys = {}
+        self._polys = collections.OrderedDict() # in LRU order
+        self.max_cache_size = max_cache_size
+        self._cache_size = 0
+        self._cache_hits = self._cache_misses = self._cache_evictions = 0
 
         self._sollya_object = None
         self._sollya_domain = RIF('-inf', 'inf')
@@ -255,9 +268,143 @@ class DFiniteFunction:
             else:
                 new_approx.append(approx[ord])
         self._update_approx_hook(center, rad, polys)
+        self._cache_size += (_approx_size(new_approx)
+                             - _approx_size(self._polys.get(center, [])))
         self._polys[center] = new_approx
+        self._polys.move_to_end(center)
+        self._evict()
         return polys
 
+    def _get_approx(self, center, prec, derivatives):
+        approx = self._polys.get(center, [])
+        # due to the way the polynomials are recomputed, the precisions attached
+        # to the successive derivatives are nonincreasing
+        if (len(approx) < derivatives or approx[derivatives-1].prec < prec):
+            self._cache_misses += 1
+            return self._update_approx(center, self._rad(center), prec,
+                                       derivatives)
+        self._cache_hits += 1
+        self._polys.move_to_end(center)
+        return [a.pol for a in approx]
+
+    def _evict(self):
+        if self.max_cache_size is None:
+            return
+        # never evict the most recently used entry
+        while self._cache_size > self.max_cache_size and len(self._polys) > 1:
+            center, approx = self._polys.popitem(last=False)
+            self._inivecs.pop(center, None)
+            self._cache_size -= _approx_size(approx)
+            self._cache_evictions += 1
+            logger.debug("evicted approximations on disk centered at %s",
+                         center)
+
+    def cache_info(self):
+        r"""
+        Statistics about the cache of polynomial approximations.
+
+        The size is a rough estimate, in bytes, of the memory used by the
+        polynomials.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: from ore_algebra.analytic.function import DFiniteFunction
+            sage: DiffOps, x, Dx = DifferentialOperators()
+
+            sage: f = DFiniteFunction((x^2 + 1)*Dx^2 + 2*x*Dx, [0, 1],
+            ....:                     max_cache_size=20000)
+            sage: _ = [f(k/2) for k in range(-20, 21)]
+            sage: _ = [f(k/2) for k in range(-20, 21)]
+            sage: info = f.cache_info(); info
+            CacheInfo(hits=..., misses=..., evictions=..., size=..., max_size=20000)
+            sage: info.size <= info.max_size
+            True
+            sage: info.hits > 0 and info.evictions > 0
+            True
+        """
+        return CacheInfo(self._cache_hits, self._cache_misses,
+                         self._cache_evictions, self._cache_size,
+                         self.max_cache_size)
+
+    def clear_cache(self):
+        r"""
+        Forget all polynomial approximations and cached initial values.
+        """
+        self._polys.clear()
+        self._inivecs.clear()
+        self._cache_size = 0
+
+    def _cache_signature(self):
+        return (str(self.dop), str(self.ini), self.max_rad.str())
+
+    def save_cache(self, filename):
+        r"""
+        Write the cached approximations to ``filename``.
+
+        They can be reloaded, possibly in another process, in a
+        :class:`DFiniteFunction` defined by the same operator and initial
+        values, using :meth:`load_cache`.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: from ore_algebra.analytic.function import DFiniteFunction
+            sage: DiffOps, x, Dx = DifferentialOperators()
+
+            sage: f = DFiniteFunction((x^2 + 1)*Dx^2 + 2*x*Dx, [0, 1])
+            sage: f.approx(1/3, prec=40)
+            [0.321750554396...]
+            sage: filename = tmp_filename(ext='.pickle')
+            sage: f.save_cache(filename)
+
+            sage: g = DFiniteFunction((x^2 + 1)*Dx^2 + 2*x*Dx, [0, 1])
+            sage: g.load_cache(filename)
+            sage: g.approx(1/3, prec=40)
+            [0.321750554396...]
+            sage: g.cache_info().misses
+            0
+
+            sage: h = DFiniteFunction(Dx - 1, [1])
+            sage: h.load_cache(filename)
+            Traceback (most recent call last):
+            ...
+            ValueError: cached approximations belong to a different function
+        """
+        data = {
+            "signature": self._cache_signature(),
+            "polys": [(center, [(a.pol, a.prec) for a in approx])
+                      for center, approx in self._polys.items()],
+            "inivecs": list(self._inivecs.items()),
+        }
+        with open(filename, "wb") as f:
+            pickle.dump(data, f)
+
+    def load_cache(self, filename):
+        r"""
+        Add the approximations saved by :meth:`save_cache` in ``filename`` to
+        the cache, keeping the more accurate ones in case of conflicts.
+        """
+        with open(filename, "rb") as f:
+            data = pickle.load(f)
+        if data["signature"] != self._cache_signature():
+            raise ValueError("cached approximations belong to a different "
+                             "function")
+        for vert, val in data["inivecs"]:
+            known = self._inivecs.get(vert)
+            if known is None or known[0].accuracy() < val[0].accuracy():
+                self._inivecs[vert] = val
+        for center, approx in data["polys"]:
+            approx = [RealPolApprox(pol, prec) for pol, prec in approx]
+            known = self._polys.get(center, [])
+            if len(known) > len(approx) or (len(known) == len(approx)
+                    and known and known[-1].prec >= approx[-1].prec):
+                continue
+            self._cache_size += _approx_size(approx) - _approx_size(known)
+            self._polys[center] = approx
+            self._polys.move_to_end(center)
+        self._evict()
+
     def _sollya_annotate(self, center, rad, polys):
         import sagesollya as sollya
         logger = logging.getLogger(__name__ + ".sollya")
@@ -359,20 +506,103 @@ class DFiniteFunction:
             eps = RBF.one() >> prec
             return self.dop.numerical_solution(ini, path, eps,
                     post_transform=post_transform)
-        approx = self._polys.get(center, [])
         Balls = RealBallField(prec)
-        # due to the way the polynomials are recomputed, the precisions attached
-        # to the successive derivatives are nonincreasing
-        if (len(approx) < derivatives or approx[derivatives-1].prec < prec):
-            polys = self._update_approx(center, rad, prec, derivatives)
-        else:
-            polys = [a.pol for a in approx]
+        polys = self._get_approx(center, prec, derivatives)
         bpt = Balls(pt.value)
         reduced_pt = bpt - Balls(center)
         val = sum(ZZ(j).factorial()*coeff(bpt)*polys[j](reduced_pt)
                   for j, coeff in enumerate(post_transform))
         return val
 
+    def approx_many(self, points, prec=None, post_transform=None):
+        r"""
+        Evaluate this function at several points.
+
+        The real points are sorted and grouped by approximation disk, the
+        polynomial approximation on each disk is computed (or retrieved from the
+        cache) only once, and it is then evaluated at all the points of the disk
+        by a single call to Arb. When ``prec`` is ``None``, each point is
+        evaluated at the precision of its parent (53 bits for exact points),
+        with one batch per precision.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: from ore_algebra.analytic.function import DFiniteFunction
+            sage: DiffOps, x, Dx = DifferentialOperators()
+
+            sage: f = DFiniteFunction((x^2 + 1)*Dx^2 + 2*x*Dx, [0, 1])
+            sage: f.approx_many([1/3, -1, 2, 1/3 + 1/2^20], prec=40)
+            [[0.321750554396...], [-0.785398163397...], [1.107148717794...],
+             [0.32175141...]]
+
+        TESTS::
+
+            sage: pts = [k/7 for k in range(-20, 20)] + [i, 0.5]
+            sage: vals = f.approx_many(pts, prec=30, post_transform=x*Dx + 1)
+            sage: all(f.approx(pt, 30, post_transform=x*Dx + 1).overlaps(val)
+            ....:     for pt, val in zip(pts, vals))
+            True
+            sage: f.approx_many([])
+            []
+        """
+        points = list(points)
+        if prec is None:
+            # Evaluate each point at the precision guessed from its parent, one
+            # batch per precision
+            precs = [_guess_prec(pt) for pt in points]
+            res = [None]*len(points)
+            for p in set(precs):
+                idx = [i for i, q in enumerate(precs) if q == p]
+                vals = self.approx_many([points[i] for i in idx], p,
+                                        post_transform)
+                for i, val in zip(idx, vals):
+                    res[i] = val
+            return res
+        orig_post_transform = post_transform
+        if post_transform is None:
+            post_transform = self.dop.parent().one()
+        derivatives = min(post_transform.order() + 1, self._max_derivatives)
+        post_transform = normalize_post_transform(self.dop, post_transform)
+        points = [Point(pt, self.dop) for pt in points]
+        res = [None]*len(points)
+        Balls = RealBallField(prec)
+        # Group the points by disk. Consecutive points (in increasing order)
+        # usually lie in the same disk, in which case we avoid the relatively
+        # expensive search for the largest disk. Any disk of the family
+        # containing a point is fine for evaluating at that point.
+        groups = collections.defaultdict(list)
+        if prec < self.max_prec:
+            real = [i for i, pt in enumerate(points) if pt.is_real()]
+            real.sort(key=lambda i: Balls(points[i].value).mid())
+            center = rad = None
+            for i in real:
+                if (center is None or not safe_le(
+                        (Balls(points[i].value) - center).abs(), rad)):
+                    center, rad = self._disk(points[i])
+                if center is not None:
+                    groups[center].append(i)
+        for center, idx in groups.items():
+            polys = self._get_approx(center, prec, derivatives)
+            bpts = [Balls(points[i].value) for i in idx]
+            reduced_pts = [bpt - Balls(center) for bpt in bpts]
+            vals = [Balls.zero()]*len(idx)
+            for j, coeff in enumerate(post_transform):
+                if coeff.is_zero():
+                    continue
+                fact = ZZ(j).factorial()
+                ev = _horner_many(polys[j], reduced_pts)
+                vals = [val + fact*coeff(bpt)*y
+                        for val, bpt, y in zip(vals, bpts, ev)]
+            for i, val in zip(idx, vals):
+                res[i] = val
+        # Complex points, high precisions, and points for which no disk was
+        # found go through the generic code
+        for i, pt in enumerate(points):
+            if res[i] is None:
+                res[i] = self.approx(pt.value, prec, orig_post_transform)
+        return res
+
     def __call__(self, x, prec=None):
         return self.approx(x, prec=prec)
 
@@ -398,7 +628,8 @@ class DFiniteFunction:
         mids = generate_plot_points(
             lambda x: self.approx(x, 20).mid(),
             x_range, plot_points=200)
-        ivs = [(x, self.approx(x, 20)) for x, _ in mids]
+        xs = [x for x, _ in mids]
+        ivs = list(zip(xs, self.approx_many(xs, 20)))
         bounds = [(x, y.upper()) for x, y in ivs]
         bounds += [(x, y.lower()) for x, y in reversed(ivs)]
         options.setdefault('aspect_ratio', 'automatic')
@@ -494,6 +725,50 @@ class DFiniteFunction:
         self._update_approx_hook = self._sollya_annotate
         return self._sollya_object
 
+def _approx_size(approx):
+    r"""
+    Rough estimate of the memory footprint in bytes of a list of
+    RealPolApprox.
+    """
+    # each ball stores a midpoint with prec bits, plus a fixed overhead
+    return sum((a.pol.degree() + 1)*(a.pol.base_ring().precision()//8 + 64)
+               for a in approx)
+
+def _horner_many(pol, pts):
+    r"""
+    Evaluate ``pol`` at each element of ``pts``.
+
+    When the coefficients and the points are real balls, the evaluation is done
+    by Arb in a single call, without any Python-level operation per point.
+
+    TESTS::
+
+        sage: from ore_algebra.analytic.function import _horner_many
+        sage: Pol.<x> = RBF[]
+        sage: _horner_many(x^2 + 2*x + 3, [RBF(0), RBF(1), RBF(-1/2)])
+        [3.000000000000000, 6.000000000000000, 2.250000000000000]
+        sage: _horner_many(Pol.zero(), [RBF(1)])
+        [0]
+        sage: Pol.<x> = CBF[]
+        sage: _horner_many(x^2 + i, [CBF(1), CBF(i)])
+        [1.000000000000000 + 1.000000000000000*I, -1.000000000000000 + 1.000000000000000*I]
+    """
+    coeffs = pol.list()
+    if not coeffs:
+        return [pol.base_ring().zero()]*len(pts)
+    Balls = pts[0].parent() if pts else None
+    if (isinstance(Balls, RealBallField)
+            and all(isinstance(c, RealBall) for c in coeffs)
+            and all(isinstance(pt, RealBall) for pt in pts)):
+        try:
+            from . import eval_poly_vec
+        except ImportError:
+            utilities.warn_no_cython_extensions(logger, fallback=True)
+        else:
+            return eval_poly_vec.real_balls(coeffs, pts, Balls,
+                                            Balls.precision())
+    return [pol(pt) for pt in pts]
+
 def _guess_prec(pt):
     if isinstance(pt, (RealNumber, ComplexNumber, RealBall, ComplexBall)):
         return pt.parent().precision()
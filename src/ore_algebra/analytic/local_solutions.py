@@ -102,6 +102,49 @@ def _mygcd_ZZ(seq):
 if not hasattr(Integer, '_gcd'): # Sage < 9.3
     _mygcd_ZZ = gcd
 
+class CoeffTable:
+    r"""
+    Growable table of the values ``bwrec.eval_series(tgt, n, ord)`` for
+    nonnegative integers ``n``, computed on demand.
+
+    Entries with ``n >= max_len`` are computed but not stored. The entries are
+    stored as they are returned by ``eval_series``, i.e., as Python lists of
+    elements of ``tgt``, not as contiguous arrays of balls.
+    """
+
+    max_len = 4096
+
+    def __init__(self, bwrec, tgt, ord):
+        self.bwrec = bwrec
+        self.tgt = tgt
+        self.ord = ord
+        self.values = []
+        self.hits = 0
+
+    def __repr__(self):
+        known = sum(val is not None for val in self.values)
+        return f"Coefficient table ({known} entries, ord={self.ord})"
+
+    def __getitem__(self, n):
+        if n < len(self.values):
+            val = self.values[n]
+            if val is not None:
+                self.hits += 1
+                return val
+        val = self.bwrec.eval_series(self.tgt, n, self.ord)
+        if n < self.max_len:
+            if n >= len(self.values):
+                self.values.extend([None]*(n + 1 - len(self.values)))
+            self.values[n] = val
+        return val
+
+# Tables of values of recurrences with exact coefficients, shared by all
+# BwShiftRec objects with the same coefficients (e.g., those used at successive
+# steps of an analytic continuation path starting from the same point, or in
+# successive passes over the same series), least recently used first
+_coeff_tables = collections.OrderedDict()
+_coeff_tables_max_size = 32
+
 class BwShiftRec:
     r"""
     A recurrence relation, written in terms of the backward shift operator.
@@ -119,6 +162,7 @@ class BwShiftRec:
         self.order = len(coeff) - 1
         self._coeff_series_cache = [[[] for _ in self.coeff] for _ in [0,1]]
         self._ord = [0, 0]
+        self._coeff_tables = {}
 
     def __repr__(self):
         n = self.base_ring.variable_name()
@@ -231,6 +275,48 @@ class BwShiftRec:
         rng = range(ord)
         return [ [eval_poly(c[j], point, tgt) for j in rng] for c in coeff]
 
+    def coeff_table(self, tgt, ord):
+        r"""
+        Table of the values ``self.eval_series(tgt, n, ord)``, for integer
+        ``n``, computed on demand and reused across calls.
+
+        When the coefficients of the recurrence are exact (over a number field,
+        or more generally over any exact ring), the table is shared with all
+        recurrences with the same coefficients. Recurrences with inexact
+        coefficients (e.g., over a ball field) only reuse their own tables, as
+        equal-looking balls do not compare equal.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import DifferentialOperators
+            sage: from ore_algebra.analytic.local_solutions import bw_shift_rec
+            sage: Dops, x, Dx = DifferentialOperators()
+            sage: dop = (x^2 + 1)*Dx^2 + 2*x*Dx
+            sage: bwrec = bw_shift_rec(dop)
+            sage: tab = bwrec.coeff_table(CBF, 1)
+            sage: len(tab[5]) == bwrec.order + 1
+            True
+            sage: bw_shift_rec(dop).coeff_table(CBF, 1) is tab
+            True
+            sage: tab[5] is tab[5], tab.hits
+            (True, 2)
+        """
+        if self.Scalars.is_exact():
+            key = (tuple(self.coeff), tgt, ord)
+            tables = _coeff_tables
+        else:
+            key = (tgt, ord)
+            tables = self._coeff_tables
+        try:
+            table = tables[key]
+        except KeyError:
+            table = tables[key] = CoeffTable(self, tgt, ord)
+            if tables is _coeff_tables and len(tables) > _coeff_tables_max_size:
+                tables.popitem(last=False)
+        if tables is _coeff_tables:
+            tables.move_to_end(key)
+        return table
+
     def eval_inv_lc_series(self, point, ord, shift):
         eval_poly, components = self.poly_eval_strategy(self.Scalars)
         if self._ord[int(components)] < ord:
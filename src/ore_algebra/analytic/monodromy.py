@@ -29,6 +29,9 @@ in the handling of algebraic numbers in the binary splitting code::
 
 import collections
 import logging
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
 
 import sage.matrix.special as matrix
 
@@ -236,7 +239,7 @@ def _test_formal_monodromy(dop):
 # transition matrix may not actually be analytic but we do not care which path
 # is taken
 
-def _local_monodromy_loop(x, eps, ctx, effort=3):
+def _local_monodromy_loop(x, eps, ctx, effort=3, polygon=None):
     r"""
     TESTS::
 
@@ -247,7 +250,8 @@ def _local_monodromy_loop(x, eps, ctx, effort=3):
         [3.7975339214908450838528472219121833930467139062244128500652173291400519760900043930710428392780611358292087744635087753829152392259557126284093959961212186601...e+1158 +/- ...] +
         [-1.0907799857818368151501817928994979524542825249884040984277371301954332475924993671608411858764307809823591665306474900630885106316087831863249971763581367813...e+1158 +/- ...]*I
     """
-    polygon = path.polygon_around(x)
+    if polygon is None:
+        polygon = path.polygon_around(x)
     n = len(polygon)
     mats = []
     for i in range(n):
@@ -324,13 +328,14 @@ def _closest_unsafe(lst, x):
     x = CC(x.alg)
     return min(enumerate(lst), key=lambda y: abs(CC(y[1].value) - x))
 
-def _extend_path_mat(dop, path_mat, inv_path_mat, x, y, eps, matprod, ctx):
-    anchor_index_x, anchor_x = _closest_unsafe(x.polygon, y)
-    anchor_index_y, anchor_y = _closest_unsafe(y.polygon, x)
-    bypass_mat_x = matprod(x.local_monodromy[:anchor_index_x])
-    bypass_mat_y = matprod(y.local_monodromy[anchor_index_y:]
-                           if anchor_index_y > 0
-                           else [])
+def _edge_transition_matrix(dop, x, y, eps, ctx):
+    r"""
+    Transition matrix from the polygon around x to that around y, and whether
+    it was computed in the reverse direction (i.e., is really the inverse of
+    the transition matrix).
+    """
+    _, anchor_x = _closest_unsafe(x.polygon, y)
+    _, anchor_y = _closest_unsafe(y.polygon, x)
     if anchor_y.is_singular():
         # Avoid computing inverses of inverses
         path = [anchor_y, anchor_x]
@@ -341,6 +346,19 @@ def _extend_path_mat(dop, path_mat, inv_path_mat, x, y, eps, matprod, ctx):
     path[0].options["store_value"] = False # XXX bugware
     path[1].options["store_value"] = True
     edge_mat = dop.numerical_transition_matrix(path, eps, ctx=ctx)
+    return edge_mat, invert
+
+def _extend_path_mat(dop, path_mat, inv_path_mat, x, y, eps, matprod, ctx,
+                     edge=None):
+    anchor_index_x, _ = _closest_unsafe(x.polygon, y)
+    anchor_index_y, _ = _closest_unsafe(y.polygon, x)
+    bypass_mat_x = matprod(x.local_monodromy[:anchor_index_x])
+    bypass_mat_y = matprod(y.local_monodromy[anchor_index_y:]
+                           if anchor_index_y > 0
+                           else [])
+    if edge is None:
+        edge = _edge_transition_matrix(dop, x, y, eps, ctx)
+    edge_mat, invert = edge
     inv_edge_mat = ~edge_mat
     if invert:
         edge_mat, inv_edge_mat = inv_edge_mat, edge_mat
@@ -351,6 +369,64 @@ def _extend_path_mat(dop, path_mat, inv_path_mat, x, y, eps, matprod, ctx):
     assert isinstance(new_path_mat, Matrix_complex_ball_dense)
     return new_path_mat, new_inv_path_mat
 
+_worker_state = None
+
+def _worker_init(dop, tasks, eps, ctx):
+    global _worker_state
+    _worker_state = (dop, tasks, eps, ctx)
+
+def _worker(i):
+    dop, tasks, eps, ctx = _worker_state
+    task = tasks[i]
+    if task[0] == "loop":
+        _, x = task
+        _, mats = _local_monodromy_loop(x.point(), eps, ctx,
+                                        polygon=x.polygon)
+        return mats
+    else:
+        _, x, y = task
+        return _edge_transition_matrix(dop, x, y, eps, ctx)
+
+def _parallel_loops_and_edges(dop, base, tree, eps, ctx):
+    r"""
+    Compute the local monodromy loops around irregular singular points and the
+    transition matrices along the edges of the spanning tree in ``ctx.ncpus``
+    processes.
+
+    The loops are stored in the corresponding todo items, and the edge
+    matrices are returned as a dictionary indexed by the (oriented) edges.
+    """
+    tasks = []
+    for x in tree:
+        if x.local_monodromy is None:
+            if x.polygon is None:
+                x.polygon = path.polygon_around(x.point())
+            tasks.append(("loop", x))
+    for x, y in tree.breadth_first_search(base, edges=True):
+        tasks.append(("edge", x, y))
+    if not tasks:
+        return {}
+    logger.info("computing %s loops and edges using %s processes",
+                len(tasks), ctx.ncpus)
+    # As in analytic_continuation, the workers are forked and inherit their
+    # input, the results are sent back by pickling. They compute their tasks
+    # sequentially, so as not to fork pools of their own.
+    worker_ctx = Context(ctx=ctx)
+    worker_ctx.ncpus = 1
+    with ProcessPoolExecutor(
+            max_workers=min(ctx.ncpus, len(tasks)),
+            mp_context=multiprocessing.get_context('fork'),
+            initializer=_worker_init,
+            initargs=(dop, tasks, eps, worker_ctx)) as pool:
+        results = list(pool.map(_worker, range(len(tasks))))
+    edges = {}
+    for task, res in zip(tasks, results):
+        if task[0] == "loop":
+            task[1].local_monodromy = res
+        else:
+            edges[task[1], task[2]] = res
+    return edges
+
 LocalMonodromyData = collections.namedtuple("LocalMonodromyData",
         ["point", "monodromy", "is_scalar"])
 
@@ -410,62 +486,95 @@ def _monodromy_matrices(dop, base, eps=1e-16, sing=None, **kwds):
         [LocalMonodromyData(point=1*I, monodromy=[1.0000000000000000], is_scalar=True),
         LocalMonodromyData(point=-1*I, monodromy=[1.0000000000000000], is_scalar=True)]
     """
-    ctx = Context(**kwds)
-    ctx.assume_analytic = True
-    dop = dop.numerator()
-    if all(c in QQ for pol in dop for c in pol):
-        dop = dop.change_ring(dop.base_ring().change_ring(QQ))
-    dop = DifferentialOperator(dop)
-    eps = RBF(eps)
-    if sing is None:
-        sing = dop._singularities(apparent=False)
-    else:
-        sing = [x for x in dop._singularities() if x.as_algebraic() in sing]
-
-    # Normalize base point. If it is one of the singularities, make sure we
-    # represent them by the same object (and thus by a PolynomialRoot compatible
-    # with the remaining singularities).
-    base = QQbar.coerce(base)
-    base_iv = CBF(base)
-    for s in dop._singularities():
-        if base_iv in s.as_ball(CBF) and base == s.as_algebraic():
-            base = s
-            break
-    else:
-        base = PolynomialRoot.make(base)
-
-    todo = {x: TodoItem(x, dop, want_self=True, want_conj=False)
-            for x in sing}
-    base = todo.setdefault(base, TodoItem(base, dop))
-    if not base.point().is_regular():
-        raise ValueError("irregular singular base point")
-    # If the coefficients are rational, reduce to handling singularities in the
-    # same half-plane as the base point, and share some computations between
-    # Galois conjugates.
-    need_conjugates = False
-    crit_cache = None
-    if dop.base_ring().base_ring() is QQ:
-        need_conjugates = _merge_conjugate_singularities(dop, sing, base, todo)
-        # TODO: do something like that even over number fields?
-        # XXX this is actually a bit costly: do it only after checking that the
-        # monodromy is not scalar?
-        # XXX keep the cache from one run to the next when increasing prec?
-        crit_cache = {}
-
-    Scalars = ComplexBallField(utilities.prec_from_eps(eps))
-    id_mat = matrix.identity_matrix(Scalars, dop.order())
-    def matprod(elts):
-        return prod(reversed(elts), id_mat)
-
-    for key, todoitem in list(todo.items()):
-        point = todoitem.point()
-        # We could call _local_monodromy_loop() if point is irregular, but
-        # delaying it may allow us to start returning results earlier.
-        if point.is_regular():
+    return MonodromyComputation(dop, base, sing, **kwds).local_monodromies(eps)
+
+class MonodromyComputation:
+    r"""
+    Resumable computation of local monodromy matrices.
+
+    The parts of the computation that do not depend on the target accuracy
+    (normalization of the operator, location and local structure of the
+    singular points, choice of the paths connecting them, polygons around
+    irregular singular points) are done once when the object is created. Each
+    call to :meth:`local_monodromies` or :meth:`matrices` then only redoes the
+    numerical analytic continuation, so that the monodromy matrices can be
+    recomputed to increasing accuracies at a lower cost.
+
+    INPUT:
+
+    See :func:`monodromy_matrices`
+
+    EXAMPLES::
+
+        sage: from ore_algebra import DifferentialOperators
+        sage: from ore_algebra.analytic.monodromy import MonodromyComputation
+        sage: Dops, x, Dx = DifferentialOperators()
+        sage: mc = MonodromyComputation((x^2 + 1)*Dx^2 + 2*x*Dx, 0)
+        sage: mc.matrices(1e-10)[0][0,1]
+        [3.14159265...] + [+/- ...]*I
+        sage: mc.matrices(1e-50)[0][0,1]
+        [3.1415926535897932384626433832795028841971693993751...] + [+/- ...]*I
+    """
+
+    def __init__(self, dop, base, sing=None, **kwds):
+        ctx = Context(**kwds)
+        ctx.assume_analytic = True
+        dop = dop.numerator()
+        if all(c in QQ for pol in dop for c in pol):
+            dop = dop.change_ring(dop.base_ring().change_ring(QQ))
+        dop = DifferentialOperator(dop)
+        if sing is None:
+            sing = dop._singularities(apparent=False)
+        else:
+            sing = [x for x in dop._singularities() if x.as_algebraic() in sing]
+
+        # Normalize base point. If it is one of the singularities, make sure we
+        # represent them by the same object (and thus by a PolynomialRoot
+        # compatible with the remaining singularities).
+        base = QQbar.coerce(base)
+        base_iv = CBF(base)
+        for s in dop._singularities():
+            if base_iv in s.as_ball(CBF) and base == s.as_algebraic():
+                base = s
+                break
+        else:
+            base = PolynomialRoot.make(base)
+
+        todo = {x: TodoItem(x, dop, want_self=True, want_conj=False)
+                for x in sing}
+        base = todo.setdefault(base, TodoItem(base, dop))
+        if not base.point().is_regular():
+            raise ValueError("irregular singular base point")
+        # If the coefficients are rational, reduce to handling singularities in
+        # the same half-plane as the base point, and share some computations
+        # between Galois conjugates.
+        need_conjugates = False
+        crit_cache = None
+        if dop.base_ring().base_ring() is QQ:
+            need_conjugates = _merge_conjugate_singularities(dop, sing, base,
+                                                             todo)
+            # TODO: do something like that even over number fields?
+            # XXX this is actually a bit costly: do it only after checking that
+            # the monodromy is not scalar?
+            crit_cache = {}
+
+        # Formal monodromies at regular singular points, stored as critical
+        # monomials along with the data needed to embed them in ball fields
+        self._formal = {}
+        # Items whose local monodromy is scalar, with the monodromy matrices
+        # they contribute to the output
+        self._scalar = []
+
+        for key, todoitem in list(todo.items()):
+            point = todoitem.point()
+            # Irregular singular points are handled by local loops computed
+            # with the connection matrices.
+            if not point.is_regular():
+                continue
             point_value = point.as_sage_value()
             if crit_cache is None or point.algdeg() == 1:
                 crit = point.local_basis_structure()
-                emb = point_value.parent().hom(Scalars)
+                formal = (crit, point_value.parent(), None)
             else:
                 mpol = point_value.minpoly()
                 try:
@@ -476,75 +585,136 @@ def _monodromy_matrices(dop, base, eps=1e-16, sing=None, **kwds):
                     # Only store the critical monomials for reusing when all
                     # local exponents are rational. We need to restrict to this
                     # case because we do not have the technology in place to
-                    # follow algebraic exponents along the embedding of NF in ℂ.
-                    # (They are represented as elements of "new" number fields
-                    # given by as_embedded_number_field_element(), even when
-                    # they actually lie in NF itself as opposed to a further
-                    # algebraic extension. XXX: Ideally, LocalBasisMapper should
-                    # give us access to the tower of extensions in which the
-                    # exponents "naturally" live.)
+                    # follow algebraic exponents along the embedding of NF in
+                    # ℂ. (They are represented as elements of "new" number
+                    # fields given by as_embedded_number_field_element(), even
+                    # when they actually lie in NF itself as opposed to a
+                    # further algebraic extension. XXX: Ideally,
+                    # LocalBasisMapper should give us access to the tower of
+                    # extensions in which the exponents "naturally" live.)
                     if all(sol.leftmost.is_rational() for sol in crit):
                         crit_cache[mpol] = NF, crit
-                emb = NF.hom([Scalars(point_value.parent().gen())], check=False)
-            mon, scalar = _formal_monodromy_from_critical_monomials(crit, emb)
+                formal = (crit, NF, point_value.parent().gen())
+            _, scalar = _formal_monodromy_from_critical_monomials(
+                    crit, self._embedding(formal, CBF))
             if scalar:
                 # No need to compute the connection matrices then!
                 # XXX When we do need them, though, it would be better to get
                 # the formal monodromy as a byproduct of their computation.
-                if todoitem.want_self:
-                    yield LocalMonodromyData(key.as_algebraic(), mon, True)
-                if todoitem.want_conj:
-                    conj = key.conjugate()
-                    logger.info("Computing local monodromy around %s by "
-                                "complex conjugation", conj)
-                    conj_mat = ~mon.conjugate()
-                    yield LocalMonodromyData(conj.as_algebraic(), conj_mat, True)
+                self._scalar.append((key, todoitem.want_self,
+                                     todoitem.want_conj, formal))
                 if todoitem is not base:
                     del todo[key]
                     continue
                 else:
                     todoitem.want_self = todoitem.want_conj = False
-            todoitem.local_monodromy = [mon]
-            todoitem.polygon = [point]
-
-    if need_conjugates:
-        base_conj_mat = dop.numerical_transition_matrix(
-            [base.alg.as_exact(), base.alg.conjugate().as_exact()],
-            eps, ctx=ctx)
-        def conjugate_monodromy(mat):
-            return ~base_conj_mat*~mat.conjugate()*base_conj_mat
+            self._formal[todoitem] = formal
 
-    tree = _spanning_tree(base, todo.values())
+        self.dop = dop
+        self.base = base
+        self.ctx = ctx
+        self.need_conjugates = need_conjugates
+        self.tree = _spanning_tree(base, todo.values())
 
-    def dfs(x, path, path_mat, inv_path_mat):
-
-        logger.info("Computing local monodromy around %s via %s", x, path)
-
-        local_mat = matprod(x.local_monodromy)
-        based_mat = inv_path_mat*local_mat*path_mat
-
-        if x.want_self:
-            yield LocalMonodromyData(x.alg.as_algebraic(), based_mat, False)
-        if x.want_conj:
-            conj = x.alg.conjugate()
-            logger.info("Computing local monodromy around %s by complex "
-                        "conjugation", conj)
-            conj_mat = conjugate_monodromy(based_mat)
-            yield LocalMonodromyData(conj.as_algebraic(), conj_mat, False)
-
-        x.done = True
-
-        for y in tree.neighbors(x):
-            if y.done:
-                continue
-            if y.local_monodromy is None:
-                y.polygon, y.local_monodromy = _local_monodromy_loop(y.point(),
-                                                                     eps, ctx)
-            new_path_mat, new_inv_path_mat = _extend_path_mat(dop, path_mat,
-                                          inv_path_mat, x, y, eps, matprod, ctx)
-            yield from dfs(y, path + [y], new_path_mat, new_inv_path_mat)
-
-    yield from dfs(base, [base], id_mat, id_mat)
+    def __repr__(self):
+        return (f"Monodromy computation for {self.dop} "
+                f"at {self.base.alg.as_algebraic()}")
+
+    @staticmethod
+    def _embedding(formal, Scalars):
+        _, NF, gen = formal
+        if gen is None:
+            return NF.hom(Scalars)
+        else:
+            return NF.hom([Scalars(gen)], check=False)
+
+    def local_monodromies(self, eps=1e-16):
+        r"""
+        Return an iterator over local monodromy matrices computed with an
+        absolute tolerance of ``eps``.
+
+        See :func:`_monodromy_matrices` for the format of the output.
+        """
+        dop, base, ctx, tree = self.dop, self.base, self.ctx, self.tree
+        eps = RBF(eps)
+        Scalars = ComplexBallField(utilities.prec_from_eps(eps))
+        id_mat = matrix.identity_matrix(Scalars, dop.order())
+        def matprod(elts):
+            return prod(reversed(elts), id_mat)
+
+        for key, want_self, want_conj, formal in self._scalar:
+            mon, _ = _formal_monodromy_from_critical_monomials(
+                    formal[0], self._embedding(formal, Scalars))
+            if want_self:
+                yield LocalMonodromyData(key.as_algebraic(), mon, True)
+            if want_conj:
+                conj = key.conjugate()
+                logger.info("Computing local monodromy around %s by "
+                            "complex conjugation", conj)
+                conj_mat = ~mon.conjugate()
+                yield LocalMonodromyData(conj.as_algebraic(), conj_mat, True)
+
+        for todoitem in tree:
+            todoitem.done = False
+            formal = self._formal.get(todoitem)
+            if formal is None:
+                todoitem.local_monodromy = None
+            else:
+                mon, _ = _formal_monodromy_from_critical_monomials(
+                        formal[0], self._embedding(formal, Scalars))
+                todoitem.local_monodromy = [mon]
+                todoitem.polygon = [todoitem.point()]
+
+        if self.need_conjugates:
+            base_conj_mat = dop.numerical_transition_matrix(
+                [base.alg.as_exact(), base.alg.conjugate().as_exact()],
+                eps, ctx=ctx)
+            def conjugate_monodromy(mat):
+                return ~base_conj_mat*~mat.conjugate()*base_conj_mat
+
+        # Loops and edges are independent of each other, compute them all in
+        # advance when several processes are available.
+        edges = {}
+        if ctx.ncpus > 1:
+            edges = _parallel_loops_and_edges(dop, base, tree, eps, ctx)
+
+        def dfs(x, path, path_mat, inv_path_mat):
+
+            logger.info("Computing local monodromy around %s via %s", x, path)
+
+            local_mat = matprod(x.local_monodromy)
+            based_mat = inv_path_mat*local_mat*path_mat
+
+            if x.want_self:
+                yield LocalMonodromyData(x.alg.as_algebraic(), based_mat, False)
+            if x.want_conj:
+                conj = x.alg.conjugate()
+                logger.info("Computing local monodromy around %s by complex "
+                            "conjugation", conj)
+                conj_mat = conjugate_monodromy(based_mat)
+                yield LocalMonodromyData(conj.as_algebraic(), conj_mat, False)
+
+            x.done = True
+
+            for y in tree.neighbors(x):
+                if y.done:
+                    continue
+                if y.local_monodromy is None:
+                    y.polygon, y.local_monodromy = _local_monodromy_loop(
+                            y.point(), eps, ctx, polygon=y.polygon)
+                new_path_mat, new_inv_path_mat = _extend_path_mat(dop,
+                                        path_mat, inv_path_mat, x, y, eps,
+                                        matprod, ctx, edges.get((x, y)))
+                yield from dfs(y, path + [y], new_path_mat, new_inv_path_mat)
+
+        yield from dfs(base, [base], id_mat, id_mat)
+
+    def matrices(self, eps=1e-16):
+        r"""
+        Compute generators of the monodromy group with an absolute tolerance
+        of ``eps``, in the same format as :func:`monodromy_matrices`.
+        """
+        return [mat for _, mat, _ in self.local_monodromies(eps)]
 
 def monodromy_matrices(dop, base, eps=1e-16, sing=None, **kwds):
     r"""
@@ -605,6 +775,14 @@ def monodromy_matrices(dop, base, eps=1e-16, sing=None, **kwds):
         [[1.000000000...] + [-2.8675932949...]*I          [+/- ...] + [1.4337966474...]*I]
         [       [+/- ...] + [-5.7351865899...]*I  [1.0000000000...] + [2.8675932949...]*I]
 
+    The local loops and the connections between singular points can be
+    computed in several processes::
+
+        sage: mon2 = monodromy_matrices(dop, 1, ncpus=2)
+        sage: all(a.overlaps(b) for m, m2 in zip(mon, mon2)
+        ....:                   for a, b in zip(m.list(), m2.list()))
+        True
+
     The base point can be a singular point::
 
         sage: monodromy_matrices(Dx*x*Dx, 0)
@@ -636,8 +814,7 @@ def monodromy_matrices(dop, base, eps=1e-16, sing=None, **kwds):
         sage: mon[1].trace()
         [4.000000...] + [+/- ...]*I
     """
-    it = _monodromy_matrices(dop, base, eps, sing, **kwds)
-    return [mat for _, mat, _ in it]
+    return MonodromyComputation(dop, base, sing, **kwds).matrices(eps)
 
 def _test_monodromy_matrices():
     r"""
@@ -28,7 +28,7 @@ from sage.rings.polynomial import polynomial_element
 from sage.rings.real_arb import RealBallField, RBF
 from sage.structure.sequence import Sequence
 
-from . import accuracy, bounds, utilities
+from . import accuracy, bounds, profiling, utilities
 from .context import Context, dctx
 from .differential_operator import DifferentialOperator
 from .local_solutions import (bw_shift_rec, LogSeriesInitialValues,
@@ -139,6 +139,58 @@ class CoefficientSequence:
 
         return err
 
+    @staticmethod
+    def next_terms(cseqs, n, mult, bwrec_n, cst, squash):
+        r"""
+        Call ``next_term()`` on each element of ``cseqs``, which must be
+        coefficient sequences of solutions of the same recurrence, and return
+        the list of errors.
+
+        In the common case of an ordinary index and sequences without
+        logarithmic terms, the recurrence coefficients are extracted once and
+        shared by all sequences.
+
+        TESTS::
+
+            sage: from ore_algebra import DifferentialOperators
+            sage: from ore_algebra.analytic.naive_sum import CoefficientSequence
+            sage: from ore_algebra.analytic.local_solutions import LogSeriesInitialValues
+            sage: Dops, x, Dx = DifferentialOperators()
+            sage: ini = LogSeriesInitialValues(0, [1, 0], Dx^2 - 1)
+            sage: seqs = [CoefficientSequence(CBF, ini, 2, False) for _ in range(3)]
+            sage: for k, seq in enumerate(seqs):
+            ....:     seq.last[0][0], seq.last[1][0] = CBF(k), CBF(1)
+            ....:     seq.log_prec = 1
+            sage: bwrec_n = [[CBF(1)], [CBF(2)], [CBF(3)]]
+            sage: CoefficientSequence.next_terms(seqs, 5, 0, bwrec_n, CBF(-1), False)
+            [None, None, None]
+            sage: [seq.last[0][0] for seq in seqs]
+            [-3.000000000000000, -5.000000000000000, -7.000000000000000]
+        """
+        if mult > 0 or any(cseq.log_prec != 1 for cseq in cseqs):
+            return [cseq.next_term(n, mult, bwrec_n, cst, squash)
+                    for cseq in cseqs]
+        ordrec = cseqs[0].ordrec
+        coeffs = [bwrec_n[i][0] for i in range(ordrec, 0, -1)]
+        errs = []
+        for cseq in cseqs:
+            last = cseq.last
+            last.rotate(1)
+            terms = zip(coeffs, (last[i][0] for i in range(ordrec, 0, -1)))
+            if cseq._use_sum_of_products:
+                combin = cseq.Intervals._sum_of_products(terms)
+            else:
+                combin = sum((a*b for a, b in terms), cseq.Intervals.zero())
+            term = cst*combin
+            err = None
+            if squash:
+                err = RBF(term.rad())
+                term = term.squash()
+            last[0][0] = term
+            cseq.nterms += 1
+            errs.append(err)
+        return errs
+
 class PartialSum:
 
     def __init__(self, cseq, Jets, ord, pt, pt_opts, IR):
@@ -370,6 +422,8 @@ class RecUnroller:
             self._next_term()
         rnd_err = self._error_analysis()
         self._report_stats(rnd_err)
+        profiling.count(self.ctx, "terms.naive", self.n)
+        profiling.sample(self.ctx, "prec.naive", bit_prec)
         return # self.sols
 
     def _init_sums(self, bit_prec):
@@ -396,6 +450,7 @@ class RecUnroller:
             CS, PS = cy_classes()
         else:
             CS, PS = CoefficientSequence, PartialSum
+        self._next_terms = CS.next_terms
 
         self.sols = []
         for ini in self.inis:
@@ -416,12 +471,21 @@ class RecUnroller:
             len(v) for s, v in self.inis[0].shift.items()
                    if self.start <= s < self.start + self.precomp_len)
         assert self.rec_add_log_prec == 0 or not self.ordinary
+        self._coeff_tables = {}
         self.bwrec_nplus = collections.deque(
-                (self.shifted_bwrec.eval_series(self.Intervals, self.start + i,
-                                self.log_prec + self.rec_add_log_prec)
+                (self._eval_bwrec(self.start + i,
+                                  self.log_prec + self.rec_add_log_prec)
                     for i in range(self.precomp_len)),
                 maxlen=self.precomp_len)
 
+    def _eval_bwrec(self, n, ord):
+        try:
+            table = self._coeff_tables[ord]
+        except KeyError:
+            table = self._coeff_tables[ord] = self.shifted_bwrec.coeff_table(
+                                                            self.Intervals, ord)
+        return table[n]
+
     def _next_term(self):
 
         if self.n < self.start:
@@ -437,9 +501,11 @@ class RecUnroller:
             if squash:
                 rnd_shift, hom_maj_coeff_lb = next(self.rnd_den)
                 assert self.n0_squash + rnd_shift == self.n
-            for (cseq, psums) in self.sols:
-                err = cseq.next_term(self.n, self.mult, self.bwrec_nplus[0],
-                                     cst, squash)
+            # advance all solutions together so that the recurrence
+            # coefficients are converted only once
+            errs = self._next_terms([cseq for cseq, _ in self.sols], self.n,
+                                    self.mult, self.bwrec_nplus[0], cst, squash)
+            for (cseq, psums), err in zip(self.sols, errs):
                 if squash:
                     # XXX lookup of IR and/or conversion is slow
                     self.rnd_loc = self.rnd_loc.max(self._IR(self.n*err)
@@ -456,10 +522,8 @@ class RecUnroller:
             self.rec_add_log_prec += self.mult_dict[self.n + self.precomp_len]
             self.rec_add_log_prec -= self.mult
             self.bwrec_nplus.append(
-                self.shifted_bwrec.eval_series(
-                    self.Intervals,
-                    self.n + self.precomp_len,
-                    self.log_prec + self.rec_add_log_prec))
+                self._eval_bwrec(self.n + self.precomp_len,
+                                 self.log_prec + self.rec_add_log_prec))
 
         for i in range(len(self.jetpows)):
             self.jetpows[i] = self.jetpows[i]._mul_trunc_(self.jets[i],
@@ -563,7 +627,7 @@ class RecUnroller_tail_bound(RecUnroller):
 
     def sum_auto(self, eps, maj, effort, fail_fast, stride=None):
 
-        self._stop = accuracy.StopOnRigorousBound(maj, eps)
+        self._stop = accuracy.StopOnRigorousBound(maj, eps, ctx=self.ctx)
 
         input_accuracy = max(0,
                              min(chain((self.evpts.accuracy,),
@@ -664,7 +728,7 @@ class RecUnroller_tail_bound(RecUnroller):
         bit_prec0 += ZZ(self.dop._naive_height()).nbits()
         bit_prec0 += lg_mag + nterms.nbits()
         n0_squash, g = guard_bits(self.dop, maj, self.evpts,
-                                  ordrec, nterms)
+                                  ordrec, nterms, ctx=self.ctx)
         # adding twice the computed number of guard bits seems to work better
         # in practice, but I don't really understand why
         bit_prec = bit_prec0 + 2*g
@@ -675,7 +739,7 @@ class RecUnroller_tail_bound(RecUnroller):
             raise accuracy.PrecisionError
         return bit_prec, n0_squash
 
-def guard_bits(dop, maj, evpts, ordrec, nterms):
+def guard_bits(dop, maj, evpts, ordrec, nterms, ctx=None):
     r"""
     Helper for choosing a working precision.
 
@@ -743,7 +807,7 @@ def guard_bits(dop, maj, evpts, ordrec, nterms):
 
         if (refine and maj.can_refine() and
              guard_bits_squashed > guard_bits_intervals + 50):
-            maj.refine()
+            maj.refine(ctx)
         else:
             new_n0, cur_n0 = new_n0*2, new_n0
             cur_cost = new_cost
@@ -911,7 +975,7 @@ def series_sum(dop, ini, evpts, tgt_error, *, maj=None, bwrec=None,
         ini = LogSeriesInitialValues(ZZ.zero(), ini, dop)
     if maj is None:
         special_shifts = [(s, len(v)) for s, v in ini.shift.items()]
-        maj = bounds.DiffOpBound(dop, ini.expo, special_shifts, ctx=ctx)
+        maj = bounds.diffop_bound(dop, ini.expo, special_shifts, ctx=ctx)
     tgt_error = ctx.IR(tgt_error)
 
     unr = RecUnroller_tail_bound(dop, [ini], evpts, bwrec, ctx=ctx)
@@ -985,7 +1049,7 @@ class HighestSolMapper_tail_bound(HighestSolMapper):
         self.effort = effort
 
     def do_sum(self, inis):
-        maj = bounds.DiffOpBound(self.dop, self.leftmost,
+        maj = bounds.diffop_bound(self.dop, self.leftmost,
                         special_shifts=(None if self.ordinary else self.shifts),
                         bound_inverse="solve",
                         pol_part_len=(4 if self.ordinary else None),
@@ -1047,7 +1111,9 @@ def fundamental_matrix_regular(dop, evpts, eps, fail_fast, effort, ctx=dctx):
     eps_col = ctx.IR(eps)/ctx.IR(dop.order()).sqrt()
     hsm = HighestSolMapper_tail_bound(dop, evpts, eps_col, fail_fast, effort,
                                       ctx=ctx)
-    cols = hsm.run()
+    with profiling.span(ctx, "sum.naive", order=dop.order(),
+                        prec=utilities.prec_from_eps(eps)):
+        cols = hsm.run()
     mats = [matrix([sol.value[i] for sol in cols]).transpose()
             for i in range(len(evpts))]
     return mats
@@ -121,6 +121,66 @@ class CoefficientSequence(naive_sum.CoefficientSequence):
 
         return err
 
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def next_terms(list cseqs, py_n, py_mult, py_bwrec_n not None, py_cst,
+                   squash):
+        r"""
+        Batched version of next_term() sharing the recurrence coefficients
+        among all sequences in the ordinary, non-logarithmic case.
+        """
+
+        if py_mult != 0 or any(cseq.log_prec != 1 for cseq in cseqs):
+            return [cseq.next_term(py_n, py_mult, py_bwrec_n, py_cst, squash)
+                    for cseq in cseqs]
+
+        cdef ssize_t i
+        cdef list last_0
+        cdef ComplexBall ball
+        cdef RealBall err
+
+        cdef list bwrec_n = <list> py_bwrec_n
+        cdef ComplexBall cst = <ComplexBall> py_cst
+        cdef ssize_t ordrec = cseqs[0].ordrec
+        cdef Parent Intervals = cseqs[0].Intervals
+        cdef ssize_t prec = Intervals.precision()
+
+        cdef acb_struct *left  = <acb_struct *> malloc(ordrec*sizeof(acb_struct))
+        cdef acb_struct *right = <acb_struct *> malloc(ordrec*sizeof(acb_struct))
+
+        for i in range(ordrec):
+            left[i] = ((<ComplexBall> (<list> bwrec_n[ordrec - i])[0]).value)[0]
+
+        errs = []
+        for cseq in cseqs:
+            last = cseq.last
+            last.rotate(1)
+            for i in range(ordrec):
+                right[i] = ((<ComplexBall> (<list> last[ordrec - i])[0]).value)[0]
+            ball = <ComplexBall> ComplexBall.__new__(ComplexBall)
+            ball._parent = Intervals
+            acb_zero(ball.value)
+            acb_dot(ball.value, ball.value, False, left, 1, right, 1, ordrec,
+                    prec)
+            acb_mul(ball.value, cst.value, ball.value, prec)
+            err = None
+            if squash:
+                err = <RealBall> RealBall.__new__(RealBall)
+                err._parent = RBF
+                acb_get_rad_ubound_arf(arb_midref(err.value), ball.value, MAG_BITS)
+                mag_zero(arb_radref(acb_realref(ball.value)))
+                mag_zero(arb_radref(acb_imagref(ball.value)))
+            last_0 = <list> (last[0])
+            last_0[0] = ball
+            cseq.nterms += 1
+            errs.append(err)
+
+        free(right)
+        free(left)
+
+        return errs
+
 
 class PartialSum(naive_sum.PartialSum):
 
@@ -5,6 +5,8 @@ Ad-hoc algebraic numbers
 
 from sage.misc.cachefunc import cached_method
 from sage.rings.all import ZZ, QQ, QQbar, CIF, CBF
+from sage.rings.complex_arb import ComplexBallField
+from sage.rings.complex_interval_field import ComplexIntervalField
 from sage.rings.number_field.number_field import NumberField, NumberField_quadratic
 from sage.rings.number_field.number_field_element import NumberFieldElement
 from sage.rings.polynomial.complex_roots import complex_roots
@@ -63,8 +65,15 @@ class PolynomialRoot(SageObject):
         return hash((self.pol, self.index))
 
     def as_ball(self, tgt):
-        alg = self.as_algebraic()
         prec = tgt.precision()
+        if isinstance(tgt, ComplexBallField) and self.pol.base_ring() is QQ:
+            # Avoid constructing an algebraic number when the isolating
+            # intervals are, or can easily be made, accurate enough.
+            if (_accuracy(self.interval()) >= prec
+                    or self._refine_all(prec + 10)
+                    and _accuracy(self.interval()) >= prec):
+                return tgt(self.interval())
+        alg = self.as_algebraic()
         if alg._value.prec() < prec:
             # avoid the loop in AlgebraicNumber_base._more_precision()...
             alg._value = alg._descr._interval_fast(prec)
@@ -72,6 +81,37 @@ class PolynomialRoot(SageObject):
 
     _acb_ = _complex_mpfr_field_ = _complex_mpfi_ = as_ball
 
+    def _refine_all(self, prec):
+        r"""
+        Try to replace the isolating intervals of all roots of ``self.pol`` by
+        enclosures of precision about ``prec``.
+
+        TESTS::
+
+            sage: from ore_algebra.analytic.polynomial_root import roots_of_irred
+            sage: Pol.<z> = QQ[]
+            sage: rt = next(rt for rt in roots_of_irred(z^3 - 2) if rt.is_real())
+            sage: rt.as_ball(ComplexBallField(1000))
+            [1.259921049894873164767210607278228350570251464701507980081975112155299676513959483729396562436255094...]
+            sage: rt.interval().prec() >= 1000
+            True
+        """
+        new = _isolate_roots_arb(self.pol, prec)
+        if new is None:
+            return False
+        perm = []
+        for rt in self.all_roots:
+            compat = [i for i, iv in enumerate(new) if iv.overlaps(rt)]
+            if len(compat) != 1:
+                return False
+            perm.append(compat[0])
+        for i, j in enumerate(perm):
+            iv = new[j]
+            if self.all_roots[i].imag().is_zero():
+                iv = iv.parent()(iv.real())
+            self.all_roots[i] = iv
+        return True
+
     def __complex__(self):
         return complex(self.all_roots[self.index])
 
@@ -299,14 +339,82 @@ class PolynomialRoot(SageObject):
         assert len(indices) == 1
         return cls(pol, list(roots), indices[0])
 
+# Minimal degree of the polynomials whose roots are isolated using Arb rather
+# than complex_roots()
+_ARB_ROOTS_MIN_DEGREE = 32
+
+def _accuracy(iv):
+    return ComplexBallField(iv.prec())(iv).accuracy()
+
+def _pairwise_disjoint(ivs):
+    r"""
+    Check that the complex intervals ``ivs`` are pairwise disjoint.
+
+    Sweeps the intervals by increasing lower bound of the real part, so that
+    only intervals whose real parts overlap are compared.
+    """
+    ivs = sorted(ivs, key=lambda iv: iv.real().lower())
+    for i, a in enumerate(ivs):
+        up = a.real().upper()
+        for j in range(i + 1, len(ivs)):
+            if ivs[j].real().lower() > up:
+                break
+            if a.overlaps(ivs[j]):
+                return False
+    return True
+
+def _isolate_roots_arb(pol, prec):
+    r"""
+    Isolating intervals of the roots of a squarefree polynomial with rational
+    coefficients computed using Arb, or ``None`` if isolation fails at this
+    precision.
+    """
+    if pol.base_ring() is not QQ:
+        return None
+    try:
+        roots = pol.roots(ComplexBallField(prec), multiplicities=False)
+    except ValueError:
+        return None
+    if len(roots) != pol.degree():
+        return None
+    IF = ComplexIntervalField(prec)
+    roots = [IF(rt) for rt in roots]
+    # The balls are disjoint, but the intervals containing them may not be
+    if not _pairwise_disjoint(roots):
+        return None
+    return roots
+
 def roots_of_irred(pol):
+    r"""
+    Roots of an irreducible polynomial, as PolynomialRoot objects.
+
+    TESTS::
+
+        sage: from ore_algebra.analytic.polynomial_root import roots_of_irred
+        sage: Pol.<z> = QQ[]
+        sage: rts = roots_of_irred(z^60 - z - 1)
+        sage: len(rts), sum(rt.is_real() for rt in rts)
+        (60, 2)
+        sage: all(rt.conjugate().conjugate() is not None for rt in rts)
+        True
+    """
     if pol.degree() == 1:
         pol = pol.monic()
         return [PolynomialRoot(pol, [-CIF(pol[0])], 0)]
-    roots, _ = zip(*complex_roots(pol, skip_squarefree=True))
-    assert not any(a.overlaps(b) for a in roots for b in roots
-                                 if a is not b)
-    roots = list(roots)
+    roots = None
+    if pol.degree() >= _ARB_ROOTS_MIN_DEGREE:
+        # Much faster than complex_roots() for large degrees
+        for prec in [CIF.prec(), 4*CIF.prec()]:
+            roots = _isolate_roots_arb(pol, prec)
+            if roots is not None:
+                roots.sort(key=lambda iv: (iv.real().center(),
+                                           iv.imag().center()))
+                break
+    if roots is None:
+        roots, _ = zip(*complex_roots(pol, skip_squarefree=True))
+        assert not any(a.overlaps(b) for a in roots for b in roots
+                                     if a is not b)
+        roots = list(roots)
     return [PolynomialRoot(pol, roots, i) for i in range(len(roots))]
 
 ################################################################################
@@ -0,0 +1,193 @@
+# vim: tw=80
+r"""
+Profiling of the numerical analytic continuation code
+
+A :class:`Profiler` can be passed as the ``recorder`` option of the analytic
+continuation routines. It then collects timing spans for the main phases of the
+computation (path processing, series summation by direct summation or binary
+splitting, refinement of error bounds, products of transition matrices) along
+with counters and samples of quantities such as the number of terms summed or
+the working precision. The collected data can be summarized or exported as a
+trace in the Chrome trace event format, which can be displayed using, e.g.,
+``chrome://tracing`` or Perfetto.
+
+EXAMPLES::
+
+    sage: from ore_algebra import DifferentialOperators
+    sage: from ore_algebra.analytic.profiling import Profiler
+    sage: Dops, x, Dx = DifferentialOperators()
+    sage: dop = (x^2 + 1)*Dx^2 + 2*x*Dx
+
+    sage: prof = Profiler()
+    sage: dop.numerical_transition_matrix([0, 1/2, 1], 1e-100, recorder=prof)[0,1]
+    [0.78539816339744830961566084581987572104929234984377645524373614807695410157155...]
+    sage: summary = prof.summary()
+    sage: "path" in summary and "sum.naive" in summary
+    True
+    sage: summary["sum.naive"]
+    SpanStats(calls=..., total=...)
+    sage: prof.counters["terms.naive"] > 100
+    True
+    sage: print(prof.report())
+    span ...calls...total (s)
+    ...
+
+    sage: prof = Profiler()
+    sage: _ = dop.numerical_transition_matrix([0, 1/2], 1e-100, recorder=prof,
+    ....:                                     algorithm="binsplit")
+    sage: "sum.binsplit" in prof.summary()
+    True
+    sage: max(prof.samples["prec.binsplit"]) >= 332
+    True
+
+    sage: import json
+    sage: filename = tmp_filename(ext='.json')
+    sage: prof.export_trace(filename)
+    sage: events = json.load(open(filename))["traceEvents"]
+    sage: sorted(set(ev["ph"] for ev in events))
+    ['C', 'X']
+
+The instrumentation is a no-op when no recorder is specified, or when the
+recorder does not provide the corresponding methods.
+"""
+
+# Distributed under the terms of the GNU General Public License (GPL) either
+# version 2, or (at your option) any later version
+#
+# http://www.gnu.org/licenses/
+
+import collections
+import contextlib
+import json
+import os
+import time
+
+Span = collections.namedtuple("Span",
+                              ["name", "start", "duration", "depth", "attrs"])
+
+SpanStats = collections.namedtuple("SpanStats", ["calls", "total"])
+
+def _json_value(val):
+    if isinstance(val, (bool, int, float, str)) or val is None:
+        return val
+    try:
+        return int(val)
+    except (TypeError, ValueError):
+        return str(val)
+
+class Profiler:
+    r"""
+    Recorder collecting timing spans, counters and samples.
+
+    Attributes:
+
+    - ``spans`` -- list of completed :class:`Span` objects, with start times
+      (in seconds) relative to the creation of the profiler
+    - ``counters`` -- :class:`collections.Counter` of accumulated quantities
+    - ``samples`` -- dictionary mapping names to lists of recorded values
+    - ``path`` -- the processed analytic continuation path of the last
+      computation (as with the ad hoc recorders supported by
+      :class:`~ore_algebra.analytic.context.Context`)
+    """
+
+    def __init__(self):
+        self.spans = []
+        self.counters = collections.Counter()
+        self.samples = collections.defaultdict(list)
+        self.path = None
+        self._depth = 0
+        self._t0 = time.perf_counter()
+
+    def __repr__(self):
+        return f"Profiler ({len(self.spans)} spans)"
+
+    @contextlib.contextmanager
+    def span(self, name, **attrs):
+        r"""
+        Context manager measuring the time spent in a block of code.
+        """
+        start = time.perf_counter()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.spans.append(Span(name, start - self._t0,
+                                   time.perf_counter() - start, self._depth,
+                                   attrs))
+
+    def count(self, name, value=1):
+        self.counters[name] += value
+
+    def sample(self, name, value):
+        self.samples[name].append(value)
+
+    def summary(self):
+        r"""
+        Number of calls and total time of each type of span.
+        """
+        calls = collections.Counter()
+        total = collections.Counter()
+        for span in self.spans:
+            calls[span.name] += 1
+            total[span.name] += span.duration
+        return {name: SpanStats(calls[name], total[name]) for name in calls}
+
+    def report(self):
+        r"""
+        Human-readable summary of the collected data.
+        """
+        lines = [f"{'span':24} {'calls':>8} {'total (s)':>12}"]
+        for name, stats in sorted(self.summary().items(),
+                                  key=lambda item: -item[1].total):
+            lines.append(f"{name:24} {stats.calls:8} {stats.total:12.6f}")
+        for name, val in sorted(self.counters.items()):
+            lines.append(f"{name:24} {val}")
+        for name, vals in sorted(self.samples.items()):
+            lines.append(f"{name:24} min={min(vals)} max={max(vals)} "
+                         f"n={len(vals)}")
+        return "\n".join(lines)
+
+    def trace(self):
+        r"""
+        List of trace events in the Chrome trace event format.
+        """
+        pid = os.getpid()
+        events = [{"name": span.name, "ph": "X", "pid": pid, "tid": 0,
+                   "ts": 1e6*span.start, "dur": 1e6*span.duration,
+                   "args": {key: _json_value(val)
+                            for key, val in span.attrs.items()}}
+                  for span in sorted(self.spans, key=lambda s: s.start)]
+        end = 1e6*(time.perf_counter() - self._t0)
+        events.extend({"name": name, "ph": "C", "pid": pid, "tid": 0,
+                       "ts": end, "args": {name: _json_value(val)}}
+                      for name, val in self.counters.items())
+        return events
+
+    def export_trace(self, filename):
+        r"""
+        Write the collected data to ``filename`` in the Chrome trace event
+        format.
+        """
+        with open(filename, "w") as f:
+            json.dump({"traceEvents": self.trace(),
+                       "displayTimeUnit": "ms"}, f)
+
+# Instrumentation helpers used in the analytic continuation code. They accept
+# arbitrary recorders, including ad hoc ones that only define some fields.
+
+def span(ctx, name, **attrs):
+    method = getattr(ctx.recorder, "span", None)
+    if method is None:
+        return contextlib.nullcontext()
+    return method(name, **attrs)
+
+def count(ctx, name, value=1):
+    method = getattr(ctx.recorder, "count", None)
+    if method is not None:
+        method(name, value)
+
+def sample(ctx, name, value):
+    method = getattr(ctx.recorder, "sample", None)
+    if method is not None:
+        method(name, value)
@@ -0,0 +1,272 @@
+# vim: tw=80
+r"""
+Persistent cache of step transition matrices
+
+A :class:`TransitionMatrixCache` stores the transition matrices computed for
+individual steps of analytic continuation paths in a directory, so that they
+can be reused across calls and processes. Entries are addressed by a hash of
+the (normalized) operator and of the exact endpoints of the step, and each
+entry keeps the most accurate matrix computed so far, which is also used to
+answer requests for lower accuracies. When the total size of the entries
+exceeds a given budget, the least recently used ones are evicted. The sizes
+and the order of use of the entries are tracked in memory; entries added by
+other processes after the cache object was created are only taken into account
+in the budget once they have been read.
+
+EXAMPLES::
+
+    sage: from ore_algebra import DifferentialOperators
+    sage: from ore_algebra.analytic.transition_cache import TransitionMatrixCache
+    sage: Dops, x, Dx = DifferentialOperators()
+    sage: cache = TransitionMatrixCache(tmp_dir())
+    sage: dop = (x^2 + 1)*Dx^2 + 2*x*Dx
+    sage: mat = dop.numerical_transition_matrix([0, 1, 1+i], 1e-30, cache=cache)
+    sage: len(cache) > 0
+    True
+    sage: dop.numerical_transition_matrix([0, 1, 1+i], 1e-20, cache=cache)
+    [ [1.00...] + [+/- ...]*I  [1.017221967897851...] + [0.402359478108525...]*I]
+    [ [+/- ...] + [+/- ...]*I  [0.200000000000000...] + [-0.400000000000000...]*I]
+"""
+
+# Distributed under the terms of the GNU General Public License (GPL) either
+# version 2, or (at your option) any later version
+#
+# http://www.gnu.org/licenses/
+
+import collections
+import hashlib
+import logging
+import os
+import struct
+
+from sage.matrix.constructor import matrix
+from sage.rings.complex_arb import ComplexBall, ComplexBallField
+from sage.rings.integer import Integer
+from sage.rings.number_field.number_field_element import NumberFieldElement
+from sage.rings.rational import Rational
+from sage.rings.real_arb import RealBall, RealBallField
+from sage.rings.real_mpfr import RealField
+
+from . import utilities
+from .polynomial_root import PolynomialRoot
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"OATM\x01"
+
+def _point_key(pt):
+    r"""
+    Exact description of the value of a point, or ``None`` if it has none.
+    """
+    val = pt.value
+    if isinstance(val, (Integer, Rational)):
+        return "Q:" + str(val)
+    elif isinstance(val, NumberFieldElement):
+        return f"NF:{val.parent()!r}:{val.polynomial()}"
+    elif isinstance(val, PolynomialRoot):
+        return f"R:{val.pol.parent()!r}:{val.pol}:{val.index}"
+    elif isinstance(val, RealBall):
+        return f"RB:{val.mid().exact_rational()}:{val.rad().exact_rational()}"
+    elif isinstance(val, ComplexBall):
+        return "CB:" + ":".join(str(a.exact_rational()) for a in
+                (val.real().mid(), val.imag().mid(),
+                 val.real().rad(), val.imag().rad()))
+    else:
+        return None # lazy constants
+
+def _write_int(f, n):
+    n = int(n)
+    data = n.to_bytes((n.bit_length() + 8)//8, 'little', signed=True)
+    f.write(struct.pack("<I", len(data)))
+    f.write(data)
+
+def _read_int(f):
+    (length,) = struct.unpack("<I", f.read(4))
+    return int.from_bytes(f.read(length), 'little', signed=True)
+
+def _write_real(f, x):
+    # exact mantissa and exponent of a real number (mpfr)
+    if x.is_zero():
+        m, e = 0, 0
+    else:
+        s, m, e = x.sign_mantissa_exponent()
+        m *= s
+    _write_int(f, m)
+    f.write(struct.pack("<q", int(e)))
+
+def _read_real(f):
+    m = _read_int(f)
+    (e,) = struct.unpack("<q", f.read(8))
+    return Integer(m) << e if e >= 0 else Rational((m, Integer(1) << -e))
+
+class TransitionMatrixCache:
+    r"""
+    Directory-backed cache of step transition matrices.
+
+    INPUT:
+
+    - ``directory`` -- directory where the entries are stored (created if
+      needed); several caches, possibly in different processes, may share it
+    - ``max_size`` -- approximate maximal total size of the entries, in bytes;
+      the least recently used entries are deleted when it is exceeded
+    """
+
+    def __init__(self, directory, max_size=2**30):
+        self.directory = str(directory)
+        self.max_size = int(max_size)
+        os.makedirs(self.directory, exist_ok=True)
+        # path -> size, from the least to the most recently used entry
+        self._sizes = collections.OrderedDict()
+        entries = []
+        for path in self._entries():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        for _, size, path in sorted(entries):
+            self._sizes[path] = size
+        self._total_size = sum(self._sizes.values())
+
+    def __repr__(self):
+        return f"Transition matrix cache in {self.directory}"
+
+    def __len__(self):
+        r"""
+        Number of entries known to this object, i.e., those present in the
+        directory when it was created and those it has stored or found since.
+        Entries added by other processes in the meantime are not counted until
+        they are looked up.
+        """
+        return len(self._sizes)
+
+    def _entries(self):
+        return [os.path.join(self.directory, name)
+                for name in os.listdir(self.directory)
+                if name.endswith(".tm")]
+
+    def _touch(self, path, size=None):
+        # mark as recently used, and record the size of entries written by
+        # this object or found by get()
+        try:
+            if size is None and path not in self._sizes:
+                size = os.path.getsize(path)
+            os.utime(path)
+        except OSError:
+            pass
+        if size is not None:
+            self._total_size += size - self._sizes.pop(path, 0)
+            self._sizes[path] = size
+        elif path in self._sizes:
+            self._sizes.move_to_end(path)
+
+    def key(self, dop, step):
+        r"""
+        Key of the transition matrix of ``dop`` along ``step``, or ``None`` if
+        the step cannot be described exactly.
+        """
+        start, end = _point_key(step.start), _point_key(step.end)
+        if start is None or end is None:
+            return None
+        lc = dop.leading_coefficient().leading_coefficient()
+        descr = "\n".join([repr(dop.parent()),
+                           *(str(c/lc) for c in dop.list()),
+                           start, end, str(step.reversed)])
+        return hashlib.sha256(descr.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".tm")
+
+    def get(self, key, eps):
+        r"""
+        Cached transition matrix for ``key``, computed for an accuracy at least
+        as good as ``eps``, or ``None``.
+        """
+        if key is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                header = self._read_header(f)
+                if header is None:
+                    return None
+                bits, prec, cplx, nrows, ncols = header
+                if bits < utilities.prec_from_eps(eps):
+                    return None
+                Balls = ComplexBallField(prec) if cplx else RealBallField(prec)
+                IR = RealBallField(prec)
+                parts = 2 if cplx else 1
+                entries = []
+                for _ in range(nrows*ncols):
+                    re = [IR(_read_real(f), _read_real(f))
+                          for _ in range(parts)]
+                    entries.append(Balls(*re))
+        except (OSError, struct.error):
+            return None
+        self._touch(path)
+        logger.debug("transition matrix cache hit: %s", key)
+        return matrix(Balls, nrows, ncols, entries)
+
+    @staticmethod
+    def _read_header(f):
+        if f.read(len(_MAGIC)) != _MAGIC:
+            return None
+        return struct.unpack("<qqBII", f.read(25))
+
+    def _stored_bits(self, key):
+        # accuracy of the stored matrix for key, in bits, or -1
+        try:
+            with open(self._path(key), "rb") as f:
+                header = self._read_header(f)
+        except (OSError, struct.error):
+            return -1
+        return -1 if header is None else header[0]
+
+    def put(self, key, eps, mat):
+        r"""
+        Store ``mat`` as the transition matrix for ``key`` at accuracy ``eps``,
+        unless a more accurate one is already known.
+        """
+        Balls = mat.base_ring()
+        if key is None or not isinstance(Balls, (RealBallField,
+                                                 ComplexBallField)):
+            return
+        bits = utilities.prec_from_eps(eps)
+        if self._stored_bits(key) >= bits:
+            return
+        cplx = isinstance(Balls, ComplexBallField)
+        RR = RealField(Balls.precision())
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}"
+        with open(tmp, "wb") as f:
+            f.write(_MAGIC)
+            f.write(struct.pack("<qqBII", int(bits),
+                                Balls.precision(), cplx, mat.nrows(),
+                                mat.ncols()))
+            for a in mat.list():
+                for b in ((a.real(), a.imag()) if cplx else (a,)):
+                    _write_real(f, RR(b.mid()))
+                    _write_real(f, RR(b.rad()))
+            size = f.tell()
+        os.replace(tmp, path) # atomic, so that concurrent readers are safe
+        self._touch(path, size)
+        self._evict()
+
+    def _evict(self):
+        while self._total_size > self.max_size and len(self._sizes) > 1:
+            path, size = self._sizes.popitem(last=False)
+            self._total_size -= size
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            logger.debug("evicted %s from transition matrix cache", path)
+
+    def clear(self):
+        r"""
+        Delete all entries.
+        """
+        for path in self._entries():
+            os.remove(path)
+        self._sizes.clear()
+        self._total_size = 0
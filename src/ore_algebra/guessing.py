@@ -31,7 +31,10 @@ except:
 #######################################
 
 import math
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime
+from functools import partial
 
 from sage.arith.all import previous_prime
 from sage.arith.functions import lcm
@@ -42,14 +45,14 @@ from sage.rings.finite_rings.all import GF
 from sage.matrix.constructor import matrix
 from sage.matrix.matrix_space import MatrixSpace
 from sage.misc.lazy_string import lazy_string
-from sage.parallel.decorate import parallel
+from sage.misc.prandom import sample
 from sage.rings.polynomial.polynomial_ring import is_PolynomialRing
 from sage.rings.polynomial.polynomial_ring_constructor import PolynomialRing
 from sage.modules.free_module_element import vector
 from sage.sets.primes import Primes
 
 from . import nullspace
-from .nullspace import _hermite, _rational_reconstruction
+from .nullspace import _hermite, _mpade, _rational_reconstruction
 from .ore_algebra import OreAlgebra
 
 def guess_rec(data, n, S, **kwargs):
@@ -106,7 +109,9 @@ def guess(data, algebra, **kwargs):
     - ``ensure`` -- if `N` is the minimum number of terms needed for some particular
       choice of order and degree, and if ``len(data)`` is less than ``N+ensure``,
       raise an error. This must be a nonnegative integer. Default: 0.
-    - ``ncpus`` -- number of processors to be used. Default: 1.
+    - ``ncpus`` -- number of processors to be used. Default: 1. If greater than 1,
+      homomorphic images are computed by a pool of worker processes and each
+      image is taken into account as soon as it is available.
     - ``order`` -- bounds the order of the operators being searched for.
       Default: infinity.
     - ``min_order`` -- smallest order to be considered in the search. The output
@@ -122,9 +127,16 @@ def guess(data, algebra, **kwargs):
       given amount of data.
     - ``solver`` -- function to be used for computing the right kernel of a matrix
       with elements in `K`.
+    - ``verify`` -- when the equation is reconstructed from homomorphic images,
+      number of additional images which must agree with the reconstructed
+      equation before it is accepted. Default: 0.
     - ``infolevel`` -- an integer specifying the level of details of progress
       reports during the calculation.
-    - ``method`` -- either "linalg" (for linear algebra) or "hp" (for Hermite-Pade) or "automatic"
+    - ``method`` -- either "linalg" (for linear algebra) or "hp" (for Hermite-Pade) or
+      "pm_basis" (for Hermite-Pade via a divide-and-conquer minimal approximant basis) or
+      "structured" (for Hermite-Pade for differential and algebraic equations and
+      simultaneous interpolation for recurrences; it never forms the linear system
+      and is therefore suitable for long sequences) or "automatic"
       (for the default choice), or a callable with the specification of a raw guesser.
 
     OUTPUT:
@@ -347,7 +359,6 @@ def guess_raw(data, A, order=-1, degree=-1, lift=None, solver=None, cut=25, ensu
 
     R = A.base_ring()
     K = R.base_ring()
-    q = A.is_Q()
 
     def info(bound, msg):
         if bound <= infolevel:
@@ -360,8 +371,6 @@ def guess_raw(data, A, order=-1, degree=-1, lift=None, solver=None, cut=25, ensu
         raise TypeError("unexpected algebra")
 
     alg_case = True if A.is_C() else False
-    diff_case = True if A.is_D() else False
-    deform = (lambda n: q[1]**n) if q is not False else (lambda n: n)
     min_len_data = (order + 1)*(degree + 2 - (1 if alg_case else 0))
 
     if cut is not None and len(data) > min_len_data + cut:
@@ -382,6 +391,132 @@ def guess_raw(data, A, order=-1, degree=-1, lift=None, solver=None, cut=25, ensu
     if solver is None:
         solver = nullspace.sage_native
 
+    sys = _guess_raw_system(data, A, order, degree)
+    sys = matrix(K, zip(*[sys[i, j] for j in range(order + 1) for i in range(degree + 1)]))
+
+    dims = sys.dimensions()
+    info(2, lazy_string(lambda: datetime.today().ctime() + ": matrix construction completed. size=" + str(dims)))
+    sol = solver(sys, infolevel=infolevel - 2)
+    del sys
+    info(2, lazy_string(lambda: datetime.today().ctime() + ": nullspace computation completed. size=" + str(len(sol))))
+
+    return _guess_raw_operators(sol, data, A, order, degree, info)
+
+def guess_sweep(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infolevel=0):
+    """
+    Guesses recurrence or differential equations of a fixed order for all degrees at once.
+
+    INPUT:
+
+    The same as for ``guess_raw``, except that no ``solver`` can be specified.
+    The base ring of the base ring of ``A`` must be a field.
+
+    OUTPUT:
+
+    A list ``sols`` of length ``degree + 1`` such that ``sols[d]`` is a basis of the
+    ``K``-vector space of all the operators `L` in ``A`` of order at most ``order``
+    and degree at most ``d`` such that `L` applied to ``data`` gives an array of zeros.
+    In particular, ``[len(s) for s in sols]`` is the trade-off curve between degree
+    and number of solutions for the given order.
+
+    ALGORITHM:
+
+    The linear system of ``guess_raw`` for order ``order`` and degree ``degree``
+    is constructed with the columns ordered by degree, so that the system for
+    any smaller degree consists of the leading columns. A single reduced echelon
+    form of this system then gives the nullspaces for all degrees.
+
+    Note that the equations for smaller degrees are imposed for as many terms as
+    those for the largest degree.
+
+    EXAMPLES::
+
+      sage: from ore_algebra import *
+      sage: from ore_algebra.guessing import guess_sweep
+      sage: K = GF(1091); R.<n> = K['n']; A = OreAlgebra(R, 'Sn')
+      sage: data = [(5*n+3)/(3*n+4)*fibonacci(n)^3 for n in range(200)]
+      sage: sols = guess_sweep(data, A, order=5, degree=4, lift=K)
+      sage: [len(s) for s in sols]
+      [0, 0, 0, 2, 4]
+      sage: data = [K(a) for a in data]
+      sage: all(sum(L[j](k)*data[k+j] for j in range(6)) == 0 for L in sols[3] for k in range(194))
+      True
+    """
+
+    if min(order, degree) < 0:
+        return []
+
+    R = A.base_ring()
+    K = R.base_ring()
+
+    def info(bound, msg):
+        if bound <= infolevel:
+            print(msg)
+
+    info(1, lazy_string(lambda: datetime.today().ctime() + ": guessing sweep started."))
+    info(1, "len(data)=" + str(len(data)) + ", algebra=" + str(A._latex_()))
+
+    if A.ngens() > 1 or (not A.is_S() and not A.is_Q() and not A.is_D() and not A.is_C()):
+        raise TypeError("unexpected algebra")
+
+    alg_case = True if A.is_C() else False
+    min_len_data = (order + 1)*(degree + 2 - (1 if alg_case else 0))
+
+    if cut is not None and len(data) > min_len_data + cut:
+        data = data[:min_len_data + cut]
+
+    if len(data) < min_len_data + ensure:
+        raise ValueError("not enough terms")
+
+    if lift is not None:
+        data = list(map(lift, data))
+
+    if not all(p in K for p in data):
+        raise ValueError("illegal term in data list")
+
+    # columns ordered by degree: the system for degree d consists of the first (d+1)*(order+1) columns
+    sys = _guess_raw_system(data, A, order, degree)
+    sys = matrix(K, zip(*[sys[i, j] for i in range(degree + 1) for j in range(order + 1)]))
+    info(2, lazy_string(lambda: datetime.today().ctime() + ": matrix construction completed. size=" + str(sys.dimensions())))
+    sys = sys.echelon_form()
+    pivots = sys.pivots()
+    info(2, lazy_string(lambda: datetime.today().ctime() + ": echelon form computed. rank=" + str(len(pivots))))
+
+    nonpivots = set(range(sys.ncols())).difference(pivots)
+    zero = K.zero()
+    sols = []
+    for d in range(degree + 1):
+        ncols = (d + 1)*(order + 1)
+        sol = []
+        for c in range(ncols):
+            if c not in nonpivots:
+                continue
+            # kernel vector of the leading ncols columns, in the layout used by guess_raw
+            v = [zero]*ncols
+            v[(c % (order + 1))*(d + 1) + c // (order + 1)] = K.one()
+            for k, p in enumerate(pivots):
+                if p >= c:
+                    break
+                v[(p % (order + 1))*(d + 1) + p // (order + 1)] = -sys[k, c]
+            sol.append(v)
+        sols.append(_guess_raw_operators(sol, data, A, order, d, info))
+
+    return sols
+
+def _guess_raw_system(data, A, order, degree):
+    """
+    Columns of the linear system used by ``guess_raw``.
+
+    Returns a dictionary mapping `(i, j)` to the column which corresponds to the
+    coefficient of `x^i X^j` in the ansatz, all columns having the same length.
+    """
+    R = A.base_ring()
+    K = R.base_ring()
+    q = A.is_Q()
+    alg_case = True if A.is_C() else False
+    diff_case = True if A.is_D() else False
+    deform = (lambda n: q[1]**n) if q is not False else (lambda n: n)
+
     sys = {(0,0):data}
     nn = [deform(n) for n in range(len(data))]
     z = [K.zero()]
@@ -413,21 +548,18 @@ def guess_raw(data, A, order=-1, degree=-1, lift=None, solver=None, cut=25, ensu
             for i in range(degree + 1):
                 sys[i, j + 1] = sys[i, j][1:]
 
-    sys = [sys[i, j] for j in range(order + 1) for i in range(degree + 1) ]
-
-    trim = min(len(c) for c in sys)
-    for i in range(len(sys)):
-        if len(sys[i]) > trim:
-            sys[i] = sys[i][:trim]
+    trim = min(len(c) for c in sys.values())
+    for ij in sys:
+        if len(sys[ij]) > trim:
+            sys[ij] = sys[ij][:trim]
 
-    sys = matrix(K, zip(*sys))
-
-    dims = sys.dimensions()
-    info(2, lazy_string(lambda: datetime.today().ctime() + ": matrix construction completed. size=" + str(dims)))
-    sol = solver(sys, infolevel=infolevel - 2)
-    del sys
-    info(2, lazy_string(lambda: datetime.today().ctime() + ": nullspace computation completed. size=" + str(len(sol))))
+    return sys
 
+def _guess_raw_operators(sol, data, A, order, degree, info):
+    """
+    Turn nullspace vectors of the system constructed by ``guess_raw`` into normalized operators.
+    """
+    R = A.base_ring()
     sigma = A.sigma()
     for l in range(len(sol)):
         s = list(sol[l])
@@ -443,7 +575,7 @@ def guess_raw(data, A, order=-1, degree=-1, lift=None, solver=None, cut=25, ensu
 
 ###########################################################################################
 
-def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infolevel=0):
+def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infolevel=0, algorithm="recursive"):
     """
     Guesses differential equations or algebraic equations for a given sample of terms.
 
@@ -464,6 +596,8 @@ def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infoleve
       raise an error. This must be a nonnegative integer.
     - ``infolevel`` (optional) -- an integer indicating the desired amount of
       progress report to be printed during the calculation. Default: 0 (no output).
+    - ``algorithm`` (optional) -- the algorithm used for Hermite-Pade approximation,
+      either ``"recursive"`` (default) or ``"pm_basis"``; see ``nullspace.hermite``.
 
     OUTPUT:
 
@@ -498,6 +632,8 @@ def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infoleve
       [(x^4 + 819*x^3 + 136*x^2 + 17*x + 635)*Dx^4 + (14*x^3 + 417*x^2 + 952*x + 605)*Dx^3 + (598*x^2 + 497*x + 99)*Dx^2 + (598*x + 794)*Dx + 893]
       sage: len(guess_hp(data, OreAlgebra(R, 'C'), order=16, degree=64, lift=K))
       1
+      sage: len(guess_hp(data, OreAlgebra(R, 'C'), order=16, degree=64, lift=K, algorithm="pm_basis"))
+      1
     """
 
     if min(order, degree) < 0:
@@ -544,7 +680,7 @@ def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infoleve
             series.append((series[1]*series[-1]).truncate(truncate))
 
     info(2, lazy_string(lambda: datetime.today().ctime() + ": matrix construction completed."))
-    sol = _hermite(True, matrix(R, [series]), [degree], infolevel - 2, truncate = truncate - 1)
+    sol = _hermite(True, matrix(R, [series]), [degree], infolevel - 2, truncate = truncate - 1, algorithm = algorithm)
     info(2, lazy_string(lambda: datetime.today().ctime() + ": hermite pade approximation completed."))
 
     sol = [A(list(map(R, s))) for s in sol]
@@ -554,6 +690,134 @@ def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infoleve
 
 ###########################################################################################
 
+def guess_mp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infolevel=0):
+    """
+    Guesses recurrence equations or q-recurrence equations for a given sample of terms.
+
+    INPUT:
+
+    - ``data`` -- list of terms
+    - ``A`` -- an Ore algebra of recurrence operators or q-recurrence operators
+      whose base ring's base ring `K` is a field.
+    - ``order`` -- maximum order of the sought operators
+    - ``degree`` -- maximum degree of the sought operators
+    - ``lift`` (optional) -- a function to be applied to the terms in ``data``
+      prior to computation
+    - ``cut`` (optional) -- if `N` is the minimum number of terms needed for
+      the the specified order and degree and ``len(data)`` is more than ``N+cut``,
+      use ``data[:N+cut]`` instead of ``data``. This must be a nonnegative integer
+      or ``None``.
+    - ``ensure`` (optional) -- if `N` is the minimum number of terms needed
+      for the specified order and degree and ``len(data)`` is less than ``N+ensure``,
+      raise an error. This must be a nonnegative integer.
+    - ``infolevel`` (optional) -- an integer indicating the desired amount of
+      progress report to be printed during the calculation. Default: 0 (no output).
+
+    OUTPUT:
+
+    The same as for ``guess_raw``: a basis of the ``K``-vector space of all the
+    operators `L` in ``A`` of order at most ``order`` and degree at most ``degree``
+    such that `L` applied to ``data`` gives an array of zeros.
+
+    An error is raised in the following situations:
+
+    * the algebra ``A`` has more than one generator, or its unique generator
+      is neither a standard shift nor a q-shift.
+    * ``data`` contains some item which does not belong to ``K``, even after
+      application of ``lift``
+    * if the condition on ``ensure`` is violated.
+    * if the points `n` (resp. `q^n`) at which the equations are imposed are
+      not pairwise distinct in `K`.
+
+    ALGORITHM:
+
+    Simultaneous interpolation (M-Pade approximation). The `n`-th equation
+    `\sum_j p_j(n) a_{n+j} = 0` is read as an interpolation condition on the
+    coefficients `p_j` at the point `n`. Unlike ``guess_raw``, this does not
+    construct the linear system, so that the memory needed is linear in the
+    number of terms.
+
+    .. NOTE::
+
+      This is a low-level method. Don't call it directly unless you know what you
+      are doing. In usual applications, the right method to call is ``guess``.
+
+    EXAMPLES::
+
+      sage: from ore_algebra import *
+      sage: from ore_algebra.guessing import guess_mp
+      sage: K = GF(1091); R.<n> = K['n']; A = OreAlgebra(R, 'Sn')
+      sage: data = [(5*n+3)/(3*n+4)*fibonacci(n)^3 for n in range(200)]
+      sage: sols = guess_mp(data, A, order=5, degree=3, lift=K)
+      sage: len(sols)
+      2
+      sage: data = [K(a) for a in data]
+      sage: all(sum(L[j](k)*data[k+j] for j in range(6)) == 0 for L in sols for k in range(194))
+      True
+    """
+
+    if min(order, degree) < 0:
+        return []
+
+    R = A.base_ring()
+    K = R.base_ring()
+    q = A.is_Q()
+
+    def info(bound, msg):
+        if bound <= infolevel:
+            print(msg)
+
+    info(1, lazy_string(lambda: datetime.today().ctime() + ": M-Pade guessing started."))
+    info(1, "len(data)=" + str(len(data)) + ", algebra=" + str(A._latex_()))
+
+    if A.ngens() > 1 or (not A.is_S() and not A.is_Q()):
+        raise TypeError("unexpected algebra")
+
+    deform = (lambda n: q[1]**n) if q is not False else (lambda n: n)
+    min_len_data = (order + 1)*(degree + 2)
+
+    if cut is not None and len(data) > min_len_data + cut:
+        data = data[:min_len_data + cut]
+
+    if len(data) < min_len_data + ensure:
+        raise ValueError("not enough terms")
+
+    if lift is not None:
+        data = list(map(lift, data))
+
+    if not all(p in K for p in data):
+        raise ValueError("illegal term in data list")
+
+    data = [K(p) for p in data]
+    N = len(data) - order
+    points = [K(deform(n)) for n in range(N)]
+    if len(set(points)) < N:
+        raise ValueError("interpolation points are not distinct")
+
+    # E[n][j] is the coefficient of the value of the jth coefficient at points[n] in the nth equation
+    E = [data[n:n + order + 1] for n in range(N)]
+    info(2, lazy_string(lambda: datetime.today().ctime() + ": interpolation problem constructed."))
+    V, _ = _mpade(R, E, points, infolevel - 2)
+    del E
+    info(2, lazy_string(lambda: datetime.today().ctime() + ": simultaneous interpolation completed."))
+
+    # the solutions of degree at most 'degree' are the multiples of the basis elements allowed by their degree
+    x = R.gen()
+    sol = []
+    for c in range(order + 1):
+        col = [V[j, c] for j in range(order + 1)]
+        for k in range(degree - max(p.degree() for p in col) + 1):
+            L = A([x**k*p for p in col])
+            L *= ~L.leading_coefficient().leading_coefficient()
+            if L.is_one() and any(data): # catch degenerate solution obtained for [0,0,0,1]
+                info(2, lazy_string("degenerate solution discarded."))
+                continue
+            sol.append(L)
+
+    return sol
+
+###########################################################################################
+
 def _guess_via_hom(data, A, modulus, to_hom, **kwargs):
     """
     Implementation of guessing via homomorphic images.
@@ -602,11 +866,15 @@ def _guess_via_hom(data, A, modulus, to_hom, **kwargs):
 
     L = A.zero()
     mod = K.one() if atomic else ZZ.one()
+    verify = kwargs.pop('verify', 0)
+    acc = _HomImageAccumulator(verify=verify)
     order_adjustment = None
 
     nn = 0
     path = []
     ncpus = 1
+    pool = None
+    pending = {}
     return_short_path = 'return_short_path' in kwargs and kwargs['return_short_path'] is True
 
     def op2vec(L, r, d):
@@ -623,140 +891,146 @@ def _guess_via_hom(data, A, modulus, to_hom, **kwargs):
              for i in range(r + 1)]
         return A(c)
 
-    while mod != 0:
+    try:
+        while mod != 0:
 
-        nn += 1 # iteration counter
+            nn += 1 # iteration counter
 
-        if nn == 1:
-            # 1st iteration: use the path specified by the user (or a default path)
-            kwargs['return_short_path'] = True
+            if nn == 1:
+                # 1st iteration: use the path specified by the user (or a default path)
+                kwargs['return_short_path'] = True
 
-        elif nn == 2 and atomic and path[0][0] >= Lp.order() + 2:
-            # 2nd iteration: try to optimize the path obtained in the 1st iteration
-            r0 = Lp.order()
-            d0 = Lp.degree()
-            r1, d1 = path[0]
-            # determine the hyperbola through (r0,d0) and (r1,d1) and
-            # choose (r2,d2) as the point on this hyperbola for which (r2+1)*(d2+1) is minimized
-            try:
-                r2 = r0 - 1 + math.sqrt(abs((d0-d1)*r0*(r0-1.-r1)/(d0+r0+d1*(r0-1.-r1)-r1)))
-                d2 = (d1*(r0-1-r1)*(r0-r2) + d0*(r1-r2))/((r0-r1)*(r0-1-r2))
-                r2 = int(math.ceil(r2))
-                d2 = int(math.ceil(d2))
-                if abs(r2 - r1) >= 2 and abs(d2 - d1) >= 2:
-                    path = [ (i, d2 + ((d1-d2)*(i-r2))//(r1-r2)) for i in range(r2, r1, 1 if r1 >= r2 else -1) ] + path
-                    kwargs['path'] = path
-                else:
+            elif nn == 2 and atomic and path[0][0] >= Lp.order() + 2:
+                # 2nd iteration: try to optimize the path obtained in the 1st iteration
+                r0 = Lp.order()
+                d0 = Lp.degree()
+                r1, d1 = path[0]
+                # determine the hyperbola through (r0,d0) and (r1,d1) and
+                # choose (r2,d2) as the point on this hyperbola for which (r2+1)*(d2+1) is minimized
+                try:
+                    r2 = r0 - 1 + math.sqrt(abs((d0-d1)*r0*(r0-1.-r1)/(d0+r0+d1*(r0-1.-r1)-r1)))
+                    d2 = (d1*(r0-1-r1)*(r0-r2) + d0*(r1-r2))/((r0-r1)*(r0-1-r2))
+                    r2 = int(math.ceil(r2))
+                    d2 = int(math.ceil(d2))
+                    if abs(r2 - r1) >= 2 and abs(d2 - d1) >= 2:
+                        path = [ (i, d2 + ((d1-d2)*(i-r2))//(r1-r2)) for i in range(r2, r1, 1 if r1 >= r2 else -1) ] + path
+                        kwargs['path'] = path
+                    else:
+                        del kwargs['return_short_path']
+                except:
                     del kwargs['return_short_path']
-            except:
-                del kwargs['return_short_path']
 
-            if A.is_C():
-                kwargs['path'] = [(Lp.order(), Lp.degree())] # there is no curve for algebraic equations
+                if A.is_C():
+                    kwargs['path'] = [(Lp.order(), Lp.degree())] # there is no curve for algebraic equations
 
-        elif 'return_short_path' in kwargs:
-            # subsequent iterations: stick to the path we have.
-            del kwargs['return_short_path']
+            elif 'return_short_path' in kwargs:
+                # subsequent iterations: stick to the path we have.
+                del kwargs['return_short_path']
 
-        if 'path' not in kwargs:
-            kwargs['return_short_path'] = True
+            if 'path' not in kwargs:
+                kwargs['return_short_path'] = True
 
-        if ncpus == 1:
-            # sequential version
+            if ncpus == 1:
+                # sequential version
 
-            imgs = []
-            for i in range(max(1, nn - 3)): # do several imgs before proceeding with a reconstruction attempt
+                imgs = []
+                for i in range(max(1, nn - 3)): # do several imgs before proceeding with a reconstruction attempt
 
-                data_mod = None
-                while data_mod is None:
-                    p = next(modulus)
-                    hom = to_hom(p)
-                    info(2, "modulus = " + str(p))
-                    try:
-                        data_mod = list(map(hom, data))
-                    except ArithmeticError:
-                        info(2, "unlucky modulus discarded.")
+                    data_mod = None
+                    while data_mod is None:
+                        p = next(modulus)
+                        hom = to_hom(p)
+                        info(2, "modulus = " + str(p))
+                        try:
+                            data_mod = list(map(hom, data))
+                        except ArithmeticError:
+                            info(2, "unlucky modulus discarded.")
 
-                qq = A.is_Q()
-                if not qq:
-                    Lp = guess(data_mod, A.change_ring(hom(K.one()).parent()[x]), **kwargs)
-                else:
-                    qq = hom(qq[1])
-                    Lp = guess(data_mod, OreAlgebra(hom(K.one()).parent()[x], (A.var(), {x:qq*x}, {}), q=qq), **kwargs)
+                    Lp = _guess_hom_image(data_mod, A, hom, kwargs)
 
-                if type(Lp) is tuple and len(Lp) == 2:  ## this implies nn < 3
-                    Lp, path = Lp
-                    kwargs['path'] = path
+                    if type(Lp) is tuple and len(Lp) == 2:  ## this implies nn < 3
+                        Lp, path = Lp
+                        kwargs['path'] = path
 
-                imgs.append((Lp, p))
+                    imgs.append((Lp, p))
+
+                if len(imgs) == 1:
+                    Lp, p = imgs[0]
+                    r = Lp.order()
+                    d = Lp.degree()
+                else:
+                    Lp = A.zero()
+                    p = K.one()
+                    for Lpp, pp in imgs:
+                        try:
+                            Lp, p = _merge_homomorphic_images(op2vec(Lp, r, d), p, op2vec(Lpp, r, d), pp, reconstruct=False)
+                            Lp = vec2op(Lp, r, d)
+                        except:
+                            info(2, "unlucky modulus " + str(pp) + " discarded")
 
-            if len(imgs) == 1:
-                Lp, p = imgs[0]
-                r = Lp.order()
-                d = Lp.degree()
             else:
+                # we can assume at this point that nn >= 3 and 'return_short_path' is switched off.
+                if pool is None:
+                    # the workers are forked, so they inherit data and settings without any pickling;
+                    # afterwards, only moduli and modular operators travel between the processes.
+                    pool = ProcessPoolExecutor(max_workers=ncpus, mp_context=multiprocessing.get_context('fork'),
+                                               initializer=_hom_worker_init, initargs=(data, A, to_hom, dict(kwargs)))
+                # keep all workers busy and merge whatever images have arrived so far
+                while len(pending) < ncpus:
+                    pp = next(modulus)
+                    pending[pool.submit(_hom_worker_image, pp)] = pp
+                completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                info(2, "moduli = " + str([pending[f] for f in completed]))
                 Lp = A.zero()
                 p = K.one()
-                for Lpp, pp in imgs:
+                for f in completed:
+                    pp = pending.pop(f)
+                    try:
+                        Lpp = f.result()
+                    except ArithmeticError:
+                        Lpp = None
+                    if Lpp is None:
+                        info(2, "unlucky modulus " + str(pp) + " discarded")
+                        continue
                     try:
                         Lp, p = _merge_homomorphic_images(op2vec(Lp, r, d), p, op2vec(Lpp, r, d), pp, reconstruct=False)
                         Lp = vec2op(Lp, r, d)
                     except:
                         info(2, "unlucky modulus " + str(pp) + " discarded")
 
-        else:
-            # we can assume at this point that nn >= 3 and 'return_short_path' is switched off.
-            primes = [next(modulus) for i in range(ncpus)]
-            info(2, "moduli = " + str(primes))
-            primes = [ (p, to_hom(p)) for p in primes ]
-            primes = [ (p, hom, A.change_ring(hom(K.one()).parent()[x])) for p, hom in primes ]
-            Lp = A.zero()
-            p = K.one()
-            out = [ (arg[0][0], arg[0][2], Lpp) for arg, Lpp in forked_guess(primes) ]
-            for pp, alg, Lpp in out:
-                Lpp = alg(Lpp)
-                try:
-                    Lp, p = _merge_homomorphic_images(op2vec(Lp, r, d), p, vec2op(Lpp, r, d), pp, reconstruct=False)
-                    Lp = vec2op(Lp, r, d)
-                except:
-                    info(2, "unlucky modulus " + str(pp) + " discarded")
-
-        if nn == 1:
-            r = Lp.order()
-            d = Lp.degree()
-            info(2, "solution of order " + str(r) + " and degree " + str(d) + " predicted")
+            if nn == 1:
+                r = Lp.order()
+                d = Lp.degree()
+                info(2, "solution of order " + str(r) + " and degree " + str(d) + " predicted")
 
-        elif nn == 2 and 'ncpus' in kwargs and kwargs['ncpus'] > 1:
-            info(2, "Switching to multiprocessor code.")
-            ncpus = kwargs['ncpus']
-            del kwargs['ncpus']
-            kwargs['infolevel'] = 0
+            elif nn == 2 and 'ncpus' in kwargs and kwargs['ncpus'] > 1:
+                info(2, "Switching to multiprocessor code.")
+                ncpus = kwargs['ncpus']
+                del kwargs['ncpus']
+                kwargs['infolevel'] = 0
 
-            @parallel(ncpus=ncpus)
-            def forked_guess(p, hom, alg):
-                try:
-                    return guess(list(map(hom, data)), alg, **kwargs).polynomial()
-                except ArithmeticError:
-                    return None
+            elif nn == 3 and 'infolevel' in kwargs:
+                kwargs['infolevel'] = kwargs['infolevel'] - 2
 
-        elif nn == 3 and 'infolevel' in kwargs:
-            kwargs['infolevel'] = kwargs['infolevel'] - 2
+            if not Lp.is_zero():
+                info(2, "Reconstruction attempt...")
+                s = Lp.parent().sigma()
+                if not s.is_identity() and mod.parent() is ZZ:
+                    try:
+                        if order_adjustment is None:
+                            order_adjustment = Lp.order() // ZZ(2)
+                        Lp = Lp.map_coefficients(lambda p: s(p, -order_adjustment))
+                    except:
+                        acc = _HomImageAccumulator(verify=verify)
+                        mod = K.one() if atomic else ZZ.one()
+                        order_adjustment = 0
 
-        if not Lp.is_zero():
-            info(2, "Reconstruction attempt...")
-            s = Lp.parent().sigma()
-            if not s.is_identity() and mod.parent() is ZZ:
-                try:
-                    if order_adjustment is None:
-                        order_adjustment = Lp.order() // ZZ(2)
-                    Lp = Lp.map_coefficients(lambda p: s(p, -order_adjustment))
-                except:
-                    L = A.zero()
-                    mod = K.one() if atomic else ZZ.one()
-                    order_adjustment = 0
+                L, mod = acc.merge(op2vec(Lp, r, d), p)
+                L = vec2op(L, r, d)
 
-            L, mod = _merge_homomorphic_images(op2vec(L, r, d), mod, op2vec(Lp, r, d), p)
-            L = vec2op(L, r, d)
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     if order_adjustment:
         s = L.parent().sigma()
@@ -764,6 +1038,40 @@ def _guess_via_hom(data, A, modulus, to_hom, **kwargs):
 
     return (L, path) if return_short_path else L
 
+def _guess_hom_image(data_mod, A, hom, kwargs):
+    """
+    Guess an operator for ``data_mod``, the image of some data under ``hom``, in the image of ``A``.
+    """
+    R = A.base_ring()
+    x = R.gen()
+    Kp = hom(R.base_ring().one()).parent()
+    qq = A.is_Q()
+    if not qq:
+        return guess(data_mod, A.change_ring(Kp[x]), **kwargs)
+    else:
+        qq = hom(qq[1])
+        return guess(data_mod, OreAlgebra(Kp[x], (A.var(), {x:qq*x}, {}), q=qq), **kwargs)
+
+# state of a worker process of the pool used by _guess_via_hom, set once per process by _hom_worker_init
+_hom_worker_state = None
+
+def _hom_worker_init(data, A, to_hom, kwargs):
+    global _hom_worker_state
+    _hom_worker_state = (data, A, to_hom, kwargs)
+
+def _hom_worker_image(p):
+    """
+    Compute the homomorphic image of the guessing problem for the modulus ``p`` in a worker process.
+    Returns the operator as a polynomial, or ``None`` if the modulus is unlucky.
+    """
+    data, A, to_hom, kwargs = _hom_worker_state
+    hom = to_hom(p)
+    try:
+        data_mod = list(map(hom, data))
+        return _guess_hom_image(data_mod, A, hom, kwargs).polynomial()
+    except ArithmeticError:
+        return None
+
 ###########################################################################################
 
 def _guess_via_gcrd(data, A, **kwargs):
@@ -797,6 +1105,9 @@ def _guess_via_gcrd(data, A, **kwargs):
     if 'ncpus' in kwargs:
         del kwargs['ncpus']
 
+    if 'verify' in kwargs:
+        del kwargs['verify']
+
     if 'return_short_path' in kwargs:
         return_short_path = True
         del kwargs['return_short_path']
@@ -856,6 +1167,10 @@ def _guess_via_gcrd(data, A, **kwargs):
             subguesser = guess_raw
         elif kwargs['method'] == 'hp':
             subguesser = guess_hp
+        elif kwargs['method'] == 'pm_basis':
+            subguesser = partial(guess_hp, algorithm="pm_basis")
+        elif kwargs['method'] == 'structured':
+            subguesser = guess_hp if (A.is_C() or A.is_D()) else guess_mp
         elif kwargs['method'] == 'automatic' or kwargs['method'] == 'default':
             pass # same as when no method is specified
         else:
@@ -882,12 +1197,24 @@ def _guess_via_gcrd(data, A, **kwargs):
 
     # search equation
 
+    # with the default linear algebra guesser and a solver based on sage's echelon forms,
+    # all degrees for a given order are obtained from a single system, see guess_sweep
+    solver = kwargs.get('solver') or A._solver(A.base_ring().base_ring()) or nullspace.sage_native
+    sweep = subguesser is guess_raw and solver is nullspace.sage_native
+    sweeps = {}
+
     neg_probes = []
     def probe(r, d):
         if (r, d) in neg_probes:
             return []
-        kwargs['order'], kwargs['degree'] = r, d
-        sols = subguesser(data, A, **kwargs)
+        if sweep:
+            if r not in sweeps or len(sweeps[r]) <= d:
+                kwargs['order'], kwargs['degree'] = r, d
+                sweeps[r] = guess_sweep(data, A, **{k: v for k, v in kwargs.items() if k != 'solver'})
+            sols = sweeps[r][d] if d < len(sweeps[r]) else []
+        else:
+            kwargs['order'], kwargs['degree'] = r, d
+            sols = subguesser(data, A, **kwargs)
         info(2, str(len(sols)) + " sols for (r, d)=" + str((r, d)))
         if len(sols) == 0:
             neg_probes.append((r, d))
@@ -1053,46 +1380,153 @@ def _merge_homomorphic_images(v, mod, vp, p, reconstruct=True):
 
         coords = [mod0 * v[i] + p0 * B(vp[i])
                   for i in range(len(v))]
+        mod *= p
+
+        # keep the representatives reduced, otherwise they grow with every merge
+        if poly:
+            coords = [c.map_coefficients(lambda a: a % mod) for c in coords]
+        else:
+            coords = [c % mod for c in coords]
 
         vmod = vector(R, coords)
-        mod *= p
 
     if not reconstruct:
         return vmod, mod
 
     # rational reconstruction attempt
 
+    try:
+        coords = _reconstruct_coordinates(list(vmod), mod, poly)
+    except (ArithmeticError, ValueError):
+        return vmod, mod # reconstruction failed
+
+    return v.parent()(coords), R.zero()
+
+def _reconstruct_coordinates(coords, mod, poly):
+    """
+    Rational reconstruction of a list of coordinates known modulo ``mod``, followed by
+    clearing of their common denominator. Raises an ``ArithmeticError`` or a ``ValueError``
+    if reconstruction fails.
+
+    If ``poly`` is ``True``, the coordinates are polynomials and reconstruction is applied
+    to each of their coefficients.
+    """
+    R = mod.parent()
+
     if R.characteristic() == 0:
         mod2 = mod // ZZ(2)
         adjust = lambda c : ((c + mod2) % mod) - mod2
     else:
         if mod.degree() <= 5: # require at least 5 evaluation points
-            return vmod, mod
+            raise ArithmeticError
         adjust = lambda c : c % mod
 
-    coords = list(vmod)
-
-    try:
-        d = R.one()
-        for i in range(len(coords) - 1, -1, -1):
-            c = coords[i]
-            if poly:
-                for l in range(c.degree(), -1, -1):
-                    d *= _rat_recon(d*c[l], mod)[1]
-            else:
-                d *= _rat_recon(d*c, mod)[1]
-    except (ArithmeticError, ValueError):
-        return vmod, mod # reconstruction failed
+    d = R.one()
+    for i in range(len(coords) - 1, -1, -1):
+        c = coords[i]
+        if poly:
+            for l in range(c.degree(), -1, -1):
+                d *= _rat_recon(d*c[l], mod)[1]
+        else:
+            d *= _rat_recon(d*c, mod)[1]
 
     # rat recon succeeded, the common denominator is d. clear it and normalize numerators.
 
-    for i in range(len(coords)):
-        c = d*coords[i]
-        if adjust is not None:
-            c = c.map_coefficients(adjust) if poly else adjust(c)
-        coords[i] = c
+    coords = [d*c for c in coords]
+    return [c.map_coefficients(adjust) for c in coords] if poly else [adjust(c) for c in coords]
 
-    return v.parent()(coords), R.zero()
+class _HomImageAccumulator:
+    r"""
+    Incremental variant of ``_merge_homomorphic_images``.
+
+    Homomorphic images of a vector are merged one at a time by chinese remaindering
+    or interpolation. Before attempting rational reconstruction on all coordinates,
+    reconstruction is attempted on a random sample of ``sample_size`` coordinates,
+    and the expensive full reconstruction is only carried out once the sample could
+    be reconstructed. A reconstructed vector is only accepted after ``verify`` further
+    images have been found to agree with it.
+
+    The ground rings are as for ``_merge_homomorphic_images``.
+
+    EXAMPLES::
+
+        sage: from ore_algebra.guessing import _HomImageAccumulator, _word_size_primes
+        sage: v = vector(QQ, [1/3, -2/7, 5, 0, 11/13, 1])
+        sage: acc = _HomImageAccumulator(sample_size=2, verify=1)
+        sage: primes = _word_size_primes()
+        sage: mod = 1
+        sage: while mod != 0:
+        ....:     p = next(primes)
+        ....:     w, mod = acc.merge(vector(ZZ, v.change_ring(GF(p))), p)
+        sage: w
+        (91, -78, 1365, 0, 231, 273)
+    """
+
+    def __init__(self, sample_size=8, verify=0):
+        self.sample_size = sample_size
+        self.verify = verify
+        self.v = None
+        self.mod = None
+        self.poly = None
+        self.sample = None
+        self.candidate = None
+        self.confirmed = 0
+
+    def merge(self, vp, p):
+        r"""
+        Take the image ``vp`` modulo ``p`` into account.
+
+        Returns a pair ``(w, mod)`` as ``_merge_homomorphic_images``, i.e., ``mod`` is zero
+        if and only if ``w`` is the reconstructed vector.
+        """
+        if self.v is None:
+            B = vp.base_ring()
+            self.poly = not ((B is ZZ) or (B.characteristic() > 0))
+            self.v, self.mod = vp, p
+        else:
+            if self.candidate is not None:
+                if self._agrees(vp, p):
+                    self.confirmed += 1
+                else:
+                    self.candidate = None
+            self.v, self.mod = _merge_homomorphic_images(self.v, self.mod, vp, p, reconstruct=False)
+
+        if self.candidate is None:
+            self.candidate = self._reconstruct()
+            self.confirmed = 0
+
+        if self.candidate is not None and self.confirmed >= self.verify:
+            return self.candidate, self.mod.parent().zero()
+        return self.v, self.mod
+
+    def _reconstruct(self):
+        coords = list(self.v)
+        if self.sample is None:
+            nonzero = [i for i in range(len(coords)) if coords[i]]
+            if len(nonzero) <= self.sample_size:
+                self.sample = []
+            else:
+                self.sample = sorted(sample(nonzero, self.sample_size))
+        try:
+            if self.sample:
+                _reconstruct_coordinates([coords[i] for i in self.sample], self.mod, self.poly)
+            coords = _reconstruct_coordinates(coords, self.mod, self.poly)
+        except (ArithmeticError, ValueError):
+            return None
+        return self.v.parent()(coords)
+
+    def _agrees(self, vp, p):
+        # check whether the candidate reduces to a multiple of vp modulo p
+        if self.poly:
+            red = lambda c: c.map_coefficients(lambda a: a % p)
+        else:
+            red = lambda c: c % p
+        w = [red(c) for c in self.candidate]
+        u = [red(c) for c in vp]
+        j = next((i for i in range(len(u)) if u[i]), None)
+        if j is None or len(w) != len(u):
+            return False
+        return all(not red(w[i]*u[j] - u[i]*w[j]) for i in range(len(w)))
 
 ###########################################################################################
 
@@ -1294,6 +1728,9 @@ def guess_mult(data, algebra, **kwargs):
       Default: None (everything allowed).
     - ``solver`` -- function to be used for computing the right kernel of a matrix
       with elements in `K`.
+    - ``ncpus`` -- number of processors to be used. Default: 1. If greater than 1 and `K`
+      is `QQ` or a rational function field over a prime field, the modular images
+      are computed by a pool of worker processes.
     - ``infolevel`` -- an integer specifying the level of details of progress
       reports during the calculation.
 
@@ -1317,6 +1754,8 @@ def guess_mult(data, algebra, **kwargs):
       Left Ideal (Sn*Sk - Sn - 1) of Multivariate Ore algebra in Sn, Sk over Fraction Field of Multivariate Polynomial Ring in n, k over Integer Ring
       sage: guess_mult(data, OreAlgebra(ZZ['x','y'], 'Dx', 'Dy'), order=1, degree=1)
       Left Ideal ((x + 1)*Dx + (-y)*Dy) of Multivariate Ore algebra in Dx, Dy over Fraction Field of Multivariate Polynomial Ring in x, y over Integer Ring
+      sage: guess_mult(data, OreAlgebra(ZZ['x','y'], 'Dx', 'Dy'), order=1, degree=1, ncpus=2)
+      Left Ideal ((x + 1)*Dx + (-y)*Dy) of Multivariate Ore algebra in Dx, Dy over Fraction Field of Multivariate Polynomial Ring in x, y over Integer Ring
       sage: guess_mult(data, OreAlgebra(ZZ['n','y'], 'Sn', 'Dy'), order=1, degree=1)
       Left Ideal ((-y + 1)*Sn*Dy - Sn + (-y)*Dy - 1, (-n - 1)*Sn + y*Dy - n, (-y + 1)*Sn - y) of Multivariate Ore algebra in Sn, Dy over Fraction Field of Multivariate Polynomial Ring in n, y over Integer Ring
       sage: guess_mult(data, OreAlgebra(ZZ['x','k'], 'Dx', 'Sk'), order=1, degree=1)
@@ -1325,6 +1764,7 @@ def guess_mult(data, algebra, **kwargs):
     """
 
     infolevel = kwargs.setdefault('infolevel', 0)
+    ncpus = kwargs.pop('ncpus', 1)
 
     def info(bound, msg):
         if bound <= infolevel:
@@ -1427,81 +1867,88 @@ def guess_mult(data, algebra, **kwargs):
         R = ZZ if C is QQ else C.base()
         mod = [R.one()]
         sol = None
-        power = [None]*dim
         imgs = []
         kwargs['infolevel'] = infolevel - 2
-
-        while not all(m.is_zero() for m in mod):
-
-            p = next(modulus_generator)
-            info(1, "modulus = " + str(p))
-            C_mod = GF(p) if C is QQ else C.base_ring()
-            phi = to_hom(p)
-
-            for i in range_dim:
-                if algebra.is_D(i):
-                    power[i] = _ff_factory(C_mod)
-                elif algebra.is_S(i):
-                    power[i] = _power_factory(C_mod)
-                elif algebra.is_Q(i):
-                    _, q = algebra.is_Q(i)
-                    A[i] = lambda n, u, v: (phi(q), n*u)
-                    power[i] = _power_factory(C_mod)
-
-            ## compute modular image
-            kwargs['phi'] = phi
-            solp = guess_mult_raw(C_mod, data, terms, points, power, A, B, **kwargs)
-            del kwargs['phi']
-
-            if sol is None: ## initialization
-
-                ## early termination check
-                if len(solp) == 0:
-                    info(1, lazy_string(lambda: datetime.today().ctime() + " : multivariate guessing completed by early termination."))
-                    return algebra.ideal([])
-
-                ## extract support of solutions
-                for i in range(len(terms)):
-                    if all(v[i].is_zero() for v in solp):
-                        terms[i] = None
-
-                sol = [[] for i in range(len(solp))]
-                new_terms = []
-                for i in range(len(terms)):
-                    if terms[i] is not None:
-                        new_terms.append(terms[i])
-                        for j in range(len(solp)):
-                            sol[j].append(R(solp[j][i]))
-                terms = new_terms
-                sol = [vector(R, s) for s in sol]
-                mod = [p]*len(sol)
-
-                if cut is not None and len(points) > len(terms) + cut:
-                    points = points[:len(terms) + cut]
-
-            else: ## subsequent iterations
-
-                try: ## save
-                    imgs[imgs.index(None)] = ([vector(R, s) for s in solp], p)
-                except: ## merge, merge, and reconstruct
-
-                    p = [p]*len(solp)
-                    solp = [vector(R, s) for s in solp]
-                    for solpp, pp in imgs:
-                        for i in range(len(solp)):
+        pool = None
+        pending = []
+
+        try:
+            while not all(m.is_zero() for m in mod):
+
+                ## compute modular image
+                if pool is None and sol is not None and ncpus > 1:
+                    # the workers are forked only now, so that they inherit the support found
+                    # by the first image; moduli are then processed in the order of their submission.
+                    pool = ProcessPoolExecutor(max_workers=ncpus, mp_context=multiprocessing.get_context('fork'),
+                                               initializer=_mult_worker_init,
+                                               initargs=(C, algebra, data, terms, points, A, B, to_hom, dict(kwargs)))
+                try:
+                    if pool is None:
+                        p = next(modulus_generator)
+                        solp = _guess_mult_image(C, algebra, data, terms, points, A, B, to_hom(p), p, kwargs)
+                    else:
+                        while len(pending) < ncpus:
+                            pp = next(modulus_generator)
+                            pending.append((pp, pool.submit(_mult_worker_image, pp)))
+                        p, f = pending.pop(0)
+                        solp = f.result()
+                except ArithmeticError:
+                    info(2, "unlucky modulus " + str(p) + " discarded")
+                    continue
+                info(1, "modulus = " + str(p))
+
+                if sol is None: ## initialization
+
+                    ## early termination check
+                    if len(solp) == 0:
+                        info(1, lazy_string(lambda: datetime.today().ctime() + " : multivariate guessing completed by early termination."))
+                        return algebra.ideal([])
+
+                    ## extract support of solutions
+                    for i in range(len(terms)):
+                        if all(v[i].is_zero() for v in solp):
+                            terms[i] = None
+
+                    sol = [[] for i in range(len(solp))]
+                    new_terms = []
+                    for i in range(len(terms)):
+                        if terms[i] is not None:
+                            new_terms.append(terms[i])
+                            for j in range(len(solp)):
+                                sol[j].append(R(solp[j][i]))
+                    terms = new_terms
+                    sol = [vector(R, s) for s in sol]
+                    mod = [p]*len(sol)
+
+                    if cut is not None and len(points) > len(terms) + cut:
+                        points = points[:len(terms) + cut]
+
+                else: ## subsequent iterations
+
+                    try: ## save
+                        imgs[imgs.index(None)] = ([vector(R, s) for s in solp], p)
+                    except: ## merge, merge, and reconstruct
+
+                        p = [p]*len(solp)
+                        solp = [vector(R, s) for s in solp]
+                        for solpp, pp in imgs:
+                            for i in range(len(solp)):
+                                try:
+                                    solp[i], p[i] = _merge_homomorphic_images(solp[i], p[i], solpp[i], pp, reconstruct=False)
+                                except:
+                                    info(2, "unlucky modulus " + str(pp) + " discarded")
+
+                        imgs = [None]*(len(imgs) + 1)
+
+                        for i in range(len(sol)):
                             try:
-                                solp[i], p[i] = _merge_homomorphic_images(solp[i], p[i], solpp[i], pp, reconstruct=False)
+                                # if all mod[i] are zero in the end, this will terminate the while loop
+                                sol[i], mod[i] = _merge_homomorphic_images(sol[i], mod[i], solp[i], p[i], reconstruct=True)
                             except:
-                                info(2, "unlucky modulus " + str(pp) + " discarded")
-
-                    imgs = [None]*(len(imgs) + 1)
-
-                    for i in range(len(sol)):
-                        try:
-                            # if all mod[i] are zero in the end, this will terminate the while loop
-                            sol[i], mod[i] = _merge_homomorphic_images(sol[i], mod[i], solp[i], p[i], reconstruct=True)
-                        except:
-                            info(2, "unlucky modulus " + str(p[i]) + " discarded")
+                                info(2, "unlucky modulus " + str(p[i]) + " discarded")
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
 
     elif C.base_ring().fraction_field() is QQ and is_PolynomialRing(C.base()) and len(C.base().gens()) == 1:
         ### C = QQ(t)
@@ -1537,6 +1984,40 @@ def guess_mult(data, algebra, **kwargs):
     info(1, lazy_string(lambda: datetime.today().ctime() + " : multivariate guessing completed."))
     return algebra.ideal(basis)
 
+def _guess_mult_image(C, algebra, data, terms, points, A, B, phi, p, kwargs):
+    """
+    Solve the multivariate guessing problem modulo ``p``, where ``phi`` maps the constant field ``C``
+    to its homomorphic image.
+    """
+    C_mod = GF(p) if C is QQ else C.base_ring()
+    power = []
+    A = list(A)
+    for i in range(len(A)):
+        if algebra.is_D(i):
+            power.append(_ff_factory(C_mod))
+        elif algebra.is_S(i):
+            power.append(_power_factory(C_mod))
+        elif algebra.is_Q(i):
+            _, q = algebra.is_Q(i)
+            A[i] = (lambda q: lambda n, u, v: (q, n*u))(phi(q))
+            power.append(_power_factory(C_mod))
+    return guess_mult_raw(C_mod, data, terms, points, power, A, B, phi=phi, **kwargs)
+
+# state of a worker process of the pool used by guess_mult, set once per process by _mult_worker_init
+_mult_worker_state = None
+
+def _mult_worker_init(*state):
+    global _mult_worker_state
+    _mult_worker_state = state
+
+def _mult_worker_image(p):
+    """
+    Compute the modular solution vectors of the multivariate guessing problem for the modulus ``p``
+    in a worker process.
+    """
+    C, algebra, data, terms, points, A, B, to_hom, kwargs = _mult_worker_state
+    return _guess_mult_image(C, algebra, data, terms, points, A, B, to_hom(p), p, kwargs)
+
 def guess_mult_raw(C, data, terms, points, power, A, B, **kwargs):
     """
     Low-level multivariate guessing function. Do not call this method unless you know what you are doing.
@@ -1575,39 +2056,49 @@ def guess_mult_raw(C, data, terms, points, power, A, B, **kwargs):
     monomial_cache = {}
     range_dim = list(range(len(A)))
 
-    for k, n in enumerate(points):
+    if C.characteristic() in Primes() and C.characteristic() < 2**31 and C is GF(C.characteristic()):
+
+        # word size prime field: assemble the whole system at once
+        M = _guess_mult_system_modp(C, data, terms, points, power, A, B, phi)
+        nonzero = M.any(axis=1)
+        points[:] = [n for n, keep in zip(points, nonzero) if keep]
+        mat = M[nonzero].tolist()
+
+    else:
+
+        for k, n in enumerate(points):
 
-        row = []
-        for u, v in terms:
+            row = []
+            for u, v in terms:
 
-            idx = tuple(B[i](n[i], u[i], v[i]) for i in range_dim)
-            if min(idx) < 0:
-                row.append(phi(C.zero()))
+                idx = tuple(B[i](n[i], u[i], v[i]) for i in range_dim)
+                if min(idx) < 0:
+                    row.append(phi(C.zero()))
+                else:
+                    exp = tuple(A[i](n[i], u[i], v[i]) for i in range_dim)
+                    d = data
+                    try:
+                        factor = monomial_cache[exp]
+                        for i in idx:
+                            d = d[i]
+                    except KeyError:
+                        factor = phi(C.one())
+                        for p, i, e in zip(*(power, idx, exp)):
+                            d = d[i]
+                            factor *= p(e[0], e[1])
+                        monomial_cache[exp] = factor
+                    row.append(phi(d) * factor)
+
+            if all(e.is_zero() for e in row):
+                points[k] = None
             else:
-                exp = tuple(A[i](n[i], u[i], v[i]) for i in range_dim)
-                d = data
-                try:
-                    factor = monomial_cache[exp]
-                    for i in idx:
-                        d = d[i]
-                except KeyError:
-                    factor = phi(C.one())
-                    for p, i, e in zip(*(power, idx, exp)):
-                        d = d[i]
-                        factor *= p(e[0], e[1])
-                    monomial_cache[exp] = factor
-                row.append(phi(d) * factor)
-
-        if all(e.is_zero() for e in row):
-            points[k] = None
-        else:
-            mat.append(row)
+                mat.append(row)
 
-    try:
-        while True:
-            points.remove(None) # in place
-    except ValueError:
-        pass
+        try:
+            while True:
+                points.remove(None) # in place
+        except ValueError:
+            pass
 
     monomial_cache.clear()
     if len(terms) + kwargs.setdefault('ensure') >= len(mat):
@@ -1618,3 +2109,60 @@ def guess_mult_raw(C, data, terms, points, power, A, B, **kwargs):
 
     info(1, lazy_string(lambda: datetime.today().ctime() + " : " + str(len(sol)) + " solutions detected."))
     return sol
+
+def _guess_mult_system_modp(C, data, terms, points, power, A, B, phi):
+    """
+    Assemble the matrix of the system solved by ``guess_mult_raw`` for a prime field ``C`` of word size.
+
+    The index and exponent lambdas are applied to whole arrays of points and terms at once. The data
+    entries and the monomial factors are computed only once for each distinct index resp. exponent
+    tuple, and the products are formed with machine integers. Returns an integer array whose rows
+    correspond to the points and whose columns correspond to the terms.
+
+    EXAMPLES::
+
+      sage: from ore_algebra.guessing import _guess_mult_system_modp, _power_factory
+      sage: C = GF(1093); data = [[C(binomial(n, k)) for k in range(4)] for n in range(4)]
+      sage: S = lambda n, u, v: (n, u); T = lambda n, u, v: n + v
+      sage: M = _guess_mult_system_modp(C, data, [((0, 0), (1, 1)), ((1, 0), (0, 1))], [(1, 0), (2, 1)],
+      ....:                             [_power_factory(C)]*2, [S, S], [T, T], lambda x: x)
+      sage: M.tolist()
+      [[2, 1], [3, 2]]
+    """
+    import numpy
+    p = int(C.characteristic())
+    dim = len(A)
+    shape = (len(points), len(terms))
+    N = numpy.array(points, dtype=numpy.int64).reshape(len(points), dim)
+    U = numpy.array([u for u, _ in terms], dtype=numpy.int64).reshape(len(terms), dim)
+    V = numpy.array([v for _, v in terms], dtype=numpy.int64).reshape(len(terms), dim)
+    nuv = [(N[:, i, None], U[None, :, i], V[None, :, i]) for i in range(dim)]
+
+    idx = [numpy.broadcast_to(B[i](*nuv[i]), shape) for i in range(dim)]
+    mask = numpy.logical_and.reduce([k >= 0 for k in idx])
+    M = numpy.zeros(shape, dtype=numpy.int64)
+    if not mask.any():
+        return M
+
+    def evaluate(f, args):
+        # apply f to every distinct tuple of the given integer arrays and spread the values
+        keys, inv = numpy.unique(numpy.stack(args, axis=1), axis=0, return_inverse=True)
+        values = numpy.array([f(*map(int, k)) for k in keys], dtype=numpy.int64)
+        return values[inv.reshape(-1)]
+
+    def entry(*i):
+        d = data
+        for j in i:
+            d = d[j]
+        return int(C(phi(d)))
+
+    values = evaluate(entry, [k[mask] for k in idx])
+    for i in range(dim):
+        base, exp = A[i](*nuv[i])
+        if not isinstance(base, numpy.ndarray):
+            base = int(base) # e.g., q
+        base, exp = (numpy.broadcast_to(a, shape)[mask] for a in (base, exp))
+        values = (values * evaluate(lambda a, b: int(power[i](a, b)) % p, [base, exp])) % p
+
+    M[mask] = values
+    return M
@@ -102,24 +102,25 @@ input domains, and the input domains of the subsolvers they require.
 The notation `K[x,...]` refers to univariate or multivariate polynomial ring, understanding the same
 reading (unvariate vs. multivariate) in corresponding rows of the 2nd and 3rd column.
 
-  =============== ================================================== ========================
-  method           input domain                                      requires subsolver for
-  =============== ================================================== ========================
-  cra_            `K[x,...]` where `K` is `ZZ`, `QQ`, or `GF(p)`     `GF(p)[x,...]`
-  galois_         `QQ(alpha)[x,...]`                                 `GF(p)[x,...]`
-  clear_          `K(x,...)`                                         `K[x,...]`
-  clear_          `K[x,...]` where `K` is the fraction field of `R`  `R[x,...]`
-  compress_       `K[x,...]` or `K(x,...)`                           same domain and `GF(p)`
-  kronecker_      `K[x,...]`                                         `K[x]` and `GF(p)[x]`
-  gauss_          `K[x,...]`                                         None
-  wiedemann_      `K[x,...]` or `K(x,...)`                           None
-  lagrange_       `K[x]` or `K(x)` where `K` is a field              `K`
-  hermite_        `K[x]` where `K` is a field                        None
-  newton_         `K[x]` where `K` is a field                        `K`
-  merge_          `K[x,...][y,...]`                                  `K[x,...,y,...]`
-  `quick_check`_  `K[x,...]` where `K` is `ZZ`, `QQ`, or `GF(p)`     same domain and `GF(p)`
-  `sage_native`_  `K[x,...]` or `K(x,...)` or `K`                    None
-  =============== ================================================== ========================
+  =================== ================================================== ========================
+  method               input domain                                      requires subsolver for
+  =================== ================================================== ========================
+  cra_                `K[x,...]` where `K` is `ZZ`, `QQ`, or `GF(p)`     `GF(p)[x,...]`
+  galois_             `QQ(alpha)[x,...]`                                 `GF(p)[x,...]`
+  clear_              `K(x,...)`                                         `K[x,...]`
+  clear_              `K[x,...]` where `K` is the fraction field of `R`  `R[x,...]`
+  compress_           `K[x,...]` or `K(x,...)`                           same domain and `GF(p)`
+  kronecker_          `K[x,...]`                                         `K[x]` and `GF(p)[x]`
+  gauss_              `K[x,...]`                                         None
+  wiedemann_          `K[x,...]` or `K(x,...)`                           None
+  lagrange_           `K[x]` or `K(x)` where `K` is a field              `K`
+  hermite_            `K[x]` where `K` is a field                        None
+  newton_             `K[x]` where `K` is a field                        `K`
+  merge_              `K[x,...][y,...]`                                  `K[x,...,y,...]`
+  `quick_check`_      `K[x,...]` where `K` is `ZZ`, `QQ`, or `GF(p)`     same domain and `GF(p)`
+  `sage_native`_      `K[x,...]` or `K(x,...)` or `K`                    None
+  `word_size_gauss`_  `GF(p)` where `p < 2^{31}`                         None
+  =================== ================================================== ========================
 
 AUTHOR:
 
@@ -138,6 +139,7 @@ AUTHOR:
 .. _merge : #nullspace.merge
 .. _galois : #nullspace.galois
 .. _`quick_check` : #nullspace.quick_check
+.. _`word_size_gauss` : #nullspace.word_size_gauss
  
 """
 
@@ -170,6 +172,7 @@ systematic benchmarking with random matrices and meaningful matrices
 testsuite
 
 """
+import collections
 import math
 
 from sage.arith.all import CRT_basis, xgcd, gcd, lcm, previous_prime as pp
@@ -503,6 +506,121 @@ def sage_native(mat, degrees=[], infolevel=0):
     _launch_info(infolevel, "sage_native", dim=mat.dimensions(), domain=mat.parent().base_ring())
     return _normalize(list(mat.right_kernel_matrix()))
 
+def word_size_gauss(mat, degrees=[], infolevel=0):
+    r"""
+    Computes the nullspace of a matrix over a prime field `GF(p)` with `p < 2^{31}` by gaussian
+    elimination on machine integers.
+
+    INPUT:
+
+    - ``mat`` -- a matrix over `GF(p)` with `p < 2^{31}`
+    - ``degrees`` -- ignored
+    - ``infolevel`` -- a nonnegative integer indicating the desired verbosity.
+
+    OUTPUT:
+
+    - a list of vectors that form a basis of the right kernel of ``mat``, in the same normal form as
+      the output of ``sage_native``.
+
+    EXAMPLES::
+
+       sage: from ore_algebra.nullspace import word_size_gauss, sage_native
+       sage: A = MatrixSpace(GF(1093), 4, 7).random_element()
+       sage: V = word_size_gauss(A)
+       sage: A*V[0]
+       (0, 0, 0, 0)
+       sage: V == sage_native(A)
+       True
+
+    When used as subsolver of ``lagrange``, the images of the matrix at all evaluation points are
+    eliminated simultaneously::
+
+       sage: from ore_algebra.nullspace import lagrange
+       sage: A = MatrixSpace(GF(1093)['x'], 4, 7).random_element(degree=3)
+       sage: V = lagrange(word_size_gauss)(A)
+       sage: A*V[0]
+       (0, 0, 0, 0)
+
+    ALGORITHM: Gauss-Jordan elimination modulo `p` on 64-bit integer arrays, followed by an echelon
+    form computation for the resulting kernel basis.
+    """
+    K = mat.parent().base_ring()
+    _launch_info(infolevel, "word_size_gauss", dim=mat.dimensions(), domain=K)
+    n, m = mat.dimensions()
+    return _word_size_gauss_batch(K, [[list(row) for row in mat.rows()]], n, m, infolevel)[0]
+
+def _word_size_gauss_batch(K, mats, n, m, infolevel=0):
+    # Nullspaces of several n x m matrices over K=GF(p), p < 2^31, given as lists of lists.
+    # The elimination steps are performed for all matrices at once.
+    import numpy
+    p = K.characteristic()
+    if not (K.is_prime_field() and 0 < p < 2**31):
+        raise TypeError("word size prime field expected")
+    p = int(p)
+    if len(mats) == 0:
+        return []
+    A = numpy.array([[[int(e) for e in row] for row in mat] for mat in mats], dtype=numpy.int64).reshape(len(mats), n, m)
+    rank, pivots = _echelon_modp(A, p)
+
+    _info(infolevel, "Constructing nullspace basis vectors.", alter = -1)
+    kernels = []
+    for k in range(len(mats)):
+        r = int(rank[k])
+        free = numpy.setdiff1d(numpy.arange(m), pivots[k, :r])
+        V = numpy.zeros((len(free), m), dtype=numpy.int64)
+        V[numpy.arange(len(free)), free] = 1
+        V[:, pivots[k, :r]] = (-A[k, :r][:, free].T) % p
+        kernels.append(V)
+
+    # bring the kernel bases into echelon form, simultaneously for all bases of the same dimension
+    for d in set(len(V) for V in kernels):
+        idx = [k for k in range(len(kernels)) if len(kernels[k]) == d]
+        V = numpy.array([kernels[k] for k in idx], dtype=numpy.int64).reshape(len(idx), d, m)
+        _echelon_modp(V, p)
+        for i, k in enumerate(idx):
+            kernels[k] = V[i]
+
+    return [[vector(K, v.tolist()) for v in V] for V in kernels]
+
+def _inverse_modp(a, p):
+    # entrywise modular inverse of an integer array with entries in [1, p), by fast exponentiation
+    r = a*0 + 1
+    e = p - 2
+    while e > 0:
+        if e & 1:
+            r = (r*a) % p
+        a = (a*a) % p
+        e >>= 1
+    return r
+
+def _echelon_modp(A, p):
+    # Replaces the matrices A[0], A[1], ... (an integer array of shape (k, n, m) with entries in [0, p))
+    # in place by their reduced row echelon forms modulo p. Returns the ranks and, for each matrix,
+    # the pivot columns of its nonzero rows.
+    import numpy
+    k, n, m = A.shape
+    rank = numpy.zeros(k, dtype=numpy.int64)
+    pivots = numpy.full((k, n), -1, dtype=numpy.int64)
+    rows = numpy.arange(n)
+    for c in range(m):
+        candidates = (A[:, :, c] != 0) & (rows[None, :] >= rank[:, None])
+        found = candidates.any(axis=1)
+        if not found.any():
+            continue
+        b = numpy.nonzero(found)[0]
+        r = rank[b]
+        i = candidates[b].argmax(axis=1)
+        tmp = A[b, i]
+        A[b, i] = A[b, r]
+        A[b, r] = (tmp * _inverse_modp(tmp[:, c], p)[:, None]) % p
+        piv = A[b, r]
+        f = A[b, :, c]
+        f[numpy.arange(len(b)), r] = 0
+        A[b] = (A[b] - f[:, :, None] * piv[:, None, :]) % p
+        pivots[b, r] = c
+        rank[b] += 1
+    return rank, pivots
+
 def gauss(pivot=_pivot, ncpus=1, fun=None):
     r"""
     Creates a solver based on fraction free gaussian elimination.
@@ -676,7 +794,7 @@ def _gauss(pivot, ncpus, fun, mat, degrees, infolevel):
 
     return _normalize([vector(R, v) for v in sol])
 
-def hermite(early_termination=True):
+def hermite(early_termination=True, algorithm="recursive"):
     r"""
     Creates a solver which computes a nullspace basis of minimal degree.
 
@@ -686,6 +804,10 @@ def hermite(early_termination=True):
       as soon as the first solution vector has been found. If set to ``False``, the calculation continues
       up to some (potentially rather pessimistic) worst case bound on the possible degrees of the solution
       vectors. If degree information is supplied to the solver, the ``early_termination`` setting is ignored.
+    - ``algorithm`` -- either ``"recursive"`` (default) or ``"pm_basis"``. The latter computes a minimal
+      approximant basis by a divide-and-conquer scheme which only ever multiplies truncated polynomials
+      and works on plain lists of polynomials. It is intended for matrices over `GF(p)[x]` for word-size
+      primes `p`, where the polynomial arithmetic is done by FLINT.
 
     OUTPUT:
 
@@ -699,21 +821,35 @@ def hermite(early_termination=True):
        sage: V = my_solver(A)
        sage: A*V[0]
        (0, 0, 0, 0)
+       sage: my_solver = hermite(algorithm="pm_basis")
+       sage: V = my_solver(A)
+       sage: A*V[0]
+       (0, 0, 0, 0)
+       sage: hermite(algorithm="pm-basis")
+       Traceback (most recent call last):
+       ...
+       ValueError: unknown algorithm: pm-basis
 
     ALGORITHM: Hermite-Pade approximation
     """
+    _check_hermite_algorithm(algorithm)
     def hermite_solver(mat, degrees=[], infolevel=0):
         r"""See docstring of hermite() for further information"""
-        return _hermite(early_termination, mat, degrees, infolevel)
+        return _hermite(early_termination, mat, degrees, infolevel, algorithm=algorithm)
     return hermite_solver
 
-def _hermite(early_termination, mat, degrees, infolevel, truncate=None):
+def _check_hermite_algorithm(algorithm):
+    if algorithm not in ("recursive", "pm_basis"):
+        raise ValueError("unknown algorithm: " + str(algorithm))
+
+def _hermite(early_termination, mat, degrees, infolevel, truncate=None, algorithm="recursive"):
     r"""
     internal version of nullspace.hermite_.
     """
     # if the truncate option is set to an integer, approximation proceeds to order x^truncate
     # and, if len(degrees)>0, only solutions whose degree is at most degrees[0] are returned. 
-    
+    _check_hermite_algorithm(algorithm)
+
     n, m = mat.dimensions()
     matdeg = max( mat[i,j].degree() for i in range(n) for j in range(m) )
     _launch_info(infolevel, "hermite", dim=(n,m), deg=matdeg, domain=mat.parent().base_ring())
@@ -727,8 +863,13 @@ def _hermite(early_termination, mat, degrees, infolevel, truncate=None):
         deg = degrees[0] + matdeg 
         early_termination = False
     R = mat.parent().base_ring() # expected to be univariate polynomial ring over a field
-    V, done = _hermite_rec(early_termination, R, mat, deg + 1, [0 for i in range(m) ], \
-                           _alter_infolevel(infolevel, -1, 1))
+    if algorithm == "pm_basis":
+        A = [ [ mat[i,j].truncate(deg + 1) for j in range(m) ] for i in range(n) ]
+        V, done = _pm_basis(early_termination, R, A, deg + 1, [0 for i in range(m) ], \
+                            _alter_infolevel(infolevel, -1, 1))
+    else:
+        V, done = _hermite_rec(early_termination, R, mat, deg + 1, [0 for i in range(m) ], \
+                               _alter_infolevel(infolevel, -1, 1))
     V = V.transpose()
     if truncate is not None:
         if len(degrees) > 0:
@@ -890,6 +1031,166 @@ def _hermite_rec(early_termination, R, A, cut, offset, infolevel):
     # 5. return V0*V1
     return V0*V1, done
 
+def _pm_basis(early_termination, R, A, cut, offset, infolevel):
+    r"""
+    Divide-and-conquer minimal approximant basis (PM-basis).
+
+    Same input and output as ``_hermite_rec``, except that ``A`` is given as a list of lists of
+    polynomials of degree less than ``cut``. In contrast to ``_hermite_rec``, the residual
+    passed to the second recursive call is obtained from truncated products only, and the first
+    recursive call only sees ``A`` truncated at the split point.
+    """
+
+    # 0. if cut is small, switch to direct method
+    if cut <= 64:
+        _info(infolevel, "base case: switching to direct method.")
+        B = [ [ p.padded_list(cut) for p in row ] for row in A ]
+        return _hermite_base(early_termination, R, B, cut, offset)
+
+    cut2 = int(math.ceil(cut/2))
+
+    # 1. compute V0 such that A*V0 == 0 mod x^cut2 recursively
+    _info(infolevel, "descending into first recursive call...")
+    A0 = [ [ p.truncate(cut2) for p in row ] for row in A ]
+    V0, done = _pm_basis(early_termination, R, A0, cut2, offset, _alter_infolevel(infolevel, -1, 1))
+    del A0
+    _info(infolevel, "...done")
+    if done: # we don't check for false alarm
+        return V0, done
+
+    # 2. residual B = (A*V0 mod x^cut)/x^cut2, using truncated products only
+    m = V0.nrows()
+    V0l = [ list(v) for v in V0.columns() ]
+    B = [ [ sum(row[k]._mul_trunc_(v[k], cut) for k in range(m)).shift(-cut2) for v in V0l ]
+          for row in A ]
+    del V0l
+
+    # 3. compute V1 such that B*V1 == 0 mod x^(cut-cut2) recursively
+    _info(infolevel, "descending into second recursive call...")
+    V1, done = _pm_basis(early_termination, R, B, cut - cut2, offset, _alter_infolevel(infolevel, -1, 1))
+    _info(infolevel, "...done")
+
+    # 4. return V0*V1
+    return V0*V1, done
+
+def _mpade(R, E, points, infolevel):
+    r"""
+    Simultaneous interpolation (M-Pade approximation) in evaluation form.
+
+    INPUT:
+
+    - ``R`` -- a univariate polynomial ring over a field ``K``
+    - ``E`` -- a list of ``len(points)`` lists of ``m`` elements of ``K``. It will be overwritten.
+    - ``points`` -- a list of pairwise distinct elements of ``K``
+    - ``infolevel`` -- integer indicating the desired verbosity
+
+    OUTPUT: a polynomial square matrix ``V`` of size ``m`` whose columns form a reduced basis
+    of the module of all vectors `v` in `R^m` with :math:`\sum_j E[k][j] v_j(points[k]) = 0`
+    for all `k`, and the list of the degrees of its columns.
+
+    The solver never forms a matrix with ``len(points)`` rows and polynomial entries,
+    so that the memory needed is essentially that for ``E``.
+
+    EXAMPLES::
+
+       sage: from ore_algebra.nullspace import _mpade
+       sage: K = GF(1093); R.<x> = K['x']
+       sage: E = [[K(1), K(k), K(k)^2] for k in range(100)]
+       sage: V, D = _mpade(R, [list(e) for e in E], [K(k) for k in range(100)], 0)
+       sage: sorted(D)
+       [1, 1, 98]
+       sage: all(sum(E[k][j]*V[j, c](k) for j in range(3)) == 0 for k in range(100) for c in range(3))
+       True
+    """
+    _launch_info(infolevel, "mpade", dim=(len(E), len(E[0])), domain=R)
+    D = [0 for j in range(len(E[0]))]
+    V = _mpade_rec(R, E, points, D, _alter_infolevel(infolevel, -1, 1))
+    return V, D
+
+def _mpade_base(R, E, points, D):
+    r"""
+    Base case of simultaneous interpolation (iterative version). The arguments are as for
+    ``_mpade``, and ``D`` is the list of current degrees of the basis, which is updated.
+    """
+    m = len(D)
+    N = len(points)
+    x = R.gen()
+    one = R.one()
+    zero = R.zero()
+    V = [ [ (one if i==j else zero) for i in range(m) ] for j in range(m) ]
+    zero = R.base_ring().zero()
+
+    for k in range(N):
+        row = E[k]
+        # pivot: among the indices j where row[j]!=0, pick one where D[j] is minimal
+        piv = -1
+        for j in range(m):
+            if row[j] and (piv == -1 or D[j] < D[piv]):
+                piv = j
+        if piv == -1:
+            continue # kth condition is already satisfied
+        # elimination
+        piv_element = -1/row[piv]
+        for j in range(m):
+            if j != piv and row[j]:
+                q = piv_element*row[j]
+                for v in V:
+                    v[j] += q*v[piv]
+                for l in range(k, N):
+                    El = E[l]
+                    El[j] += q*El[piv]
+        # multiplication by x - points[k] and degree update
+        xk = points[k]
+        for v in V:
+            v[piv] *= x - xk
+        for l in range(k + 1, N):
+            E[l][piv] *= points[l] - xk
+        row[piv] = zero
+        D[piv] += 1
+
+    return Matrix(R, V)
+
+def _mpade_rec(R, E, points, D, infolevel):
+    r"""
+    Recursive step of simultaneous interpolation (divide and conquer). The arguments are as for
+    ``_mpade``, and ``D`` is the list of current degrees of the basis, which is updated.
+    """
+    N = len(points)
+
+    # 0. if there are few conditions, switch to direct method
+    if N <= 64:
+        return _mpade_base(R, E, points, D)
+
+    split = int(math.ceil(N/2))
+
+    # 1. compute V0 for the first half of the conditions recursively
+    _info(infolevel, "descending into first recursive call...")
+    V0 = _mpade_rec(R, E[:split], points[:split], D, _alter_infolevel(infolevel, -1, 1))
+    _info(infolevel, "...done")
+
+    # 2. evaluate V0 at the remaining points and update the remaining conditions accordingly
+    m = len(D)
+    right = points[split:]
+    M = product_tree(R.gen(), right, 0, len(right))
+    vals = []
+    for i in range(m):
+        vals.append([])
+        for j in range(m):
+            L = []
+            multipoint_evaluate(V0[i, j] % M[0], right, 0, len(right), M, L)
+            vals[i].append(L)
+    E1 = [ [ sum(row[i]*vals[i][j][l] for i in range(m)) for j in range(m) ]
+           for l, row in enumerate(E[split:]) ]
+    del vals
+
+    # 3. compute V1 for the updated second half recursively
+    _info(infolevel, "descending into second recursive call...")
+    V1 = _mpade_rec(R, E1, right, D, _alter_infolevel(infolevel, -1, 1))
+    _info(infolevel, "...done")
+
+    # 4. return V0*V1
+    return V0*V1
+
 def kronecker(subsolver, presolver=None):
     r"""
     Creates a solver for matrices of multivariate polynomials over some domain `K`,
@@ -1096,7 +1397,6 @@ def _lagrange(subsolver, start_point, ncpus, mat, degrees, infolevel):
     else:
         rational = False
 
-    x = R.gen()
     K = R.base_ring()
     char = K.characteristic()
     one = R.one()
@@ -1108,11 +1408,8 @@ def _lagrange(subsolver, start_point, ncpus, mat, degrees, infolevel):
     if char > 0 and char < start_point + bound:
         raise ValueError("not enough evaluation points")
 
-    points = [R(start_point + p) for p in range(bound)]
-    M = product_tree(x, points, 0, bound)
+    points, M, I, Mprime = _subproduct_tree(R, start_point, bound)
     mod = M[0]
-    Mprime = []
-    multipoint_evaluate(mod.derivative(), points, 0, bound, M, Mprime)
 
     if rational:
         mymat = mat.apply_map(lambda p: (p.numerator() * p.denominator().inverse_mod(mod)) % mod, R)
@@ -1120,7 +1417,7 @@ def _lagrange(subsolver, start_point, ncpus, mat, degrees, infolevel):
         mymat = mat
 
     try:
-        V = _lagrange_rec(mod, mymat, Mprime, 0, bound, M, subsolver, _alter_infolevel(infolevel, -1, 1))
+        V = _lagrange_solve(mymat, Mprime, points, M, I, subsolver, _alter_infolevel(infolevel, -1, 1))
     except NoSolution:
         return []
     
@@ -1155,11 +1452,8 @@ def _lagrange(subsolver, start_point, ncpus, mat, degrees, infolevel):
         _info(infolevel, "Taking ", bound, " more interpolation points...", alter = -1)
         if start_point + bound > char:
             raise ValueError("not enough evaluation points")
-        points = [R(start_point + p) for p in range(bound)]
-        M = product_tree(x, points, 0, bound)
+        points, M, I, Mprime = _subproduct_tree(R, start_point, bound)
         mod = M[0]
-        Mprime = []
-        multipoint_evaluate(mod.derivative(), points, 0, bound, M, Mprime)
 
         if rational:
             try:
@@ -1173,7 +1467,7 @@ def _lagrange(subsolver, start_point, ncpus, mat, degrees, infolevel):
         else:
             mymat = mat
 
-        Vnew = _lagrange_rec(mod, mymat, Mprime, 0, bound, M, subsolver, _alter_infolevel(infolevel, -2, 1))
+        Vnew = _lagrange_solve(mymat, Mprime, points, M, I, subsolver, _alter_infolevel(infolevel, -2, 1))
 
         _info(infolevel, "Combining with previous partial solution...", alter = -1)
         inv = xgcd(modulus, mod)[1]*modulus
@@ -1240,6 +1534,104 @@ def multipoint_evaluate(poly, points, a, b, product_tree, L):
     r1 = poly % product_tree[2][0]
     multipoint_evaluate(r1, points, split, b, product_tree[2], L)
 
+_subproduct_trees = collections.OrderedDict()
+_SUBPRODUCT_TREES_MAX = 8
+
+def _subproduct_tree(R, start_point, bound):
+    # The evaluation points start_point, ..., start_point + bound - 1 used by lagrange, their product tree,
+    # the tree of the inverses needed by _reduce, and the values of the derivative of the root at the points.
+    # They only depend on the arguments and are therefore shared by all calls of the solver; only the
+    # _SUBPRODUCT_TREES_MAX most recently used ones are kept.
+    key = (R, start_point, bound)
+    try:
+        trees = _subproduct_trees[key]
+        _subproduct_trees.move_to_end(key)
+        return trees
+    except KeyError:
+        pass
+    points = [R(start_point + p) for p in range(bound)]
+    M = product_tree(R.gen(), points, 0, bound)
+    I = _inverse_tree(M)
+    L = []
+    _remainder_tree([M[0].derivative()], 0, bound, M, I, L)
+    Mprime = [v[0] for v in L]
+    trees = _subproduct_trees[key] = (points, M, I, Mprime)
+    if len(_subproduct_trees) > _SUBPRODUCT_TREES_MAX:
+        _subproduct_trees.popitem(last=False)
+    return trees
+
+def _inverse_tree(product_tree):
+    # for every node with polynomial M of degree n, the inverse of the reversal of M modulo x^n
+
+    M = product_tree[0]
+    I = M.reverse().inverse_series_trunc(M.degree())
+    if product_tree[1] is None:
+        return (I, None, None)
+    return (I, _inverse_tree(product_tree[1]), _inverse_tree(product_tree[2]))
+
+def _reduce(poly, M, I):
+    # remainder of poly modulo M, using the precomputed inverse I from _inverse_tree
+
+    n = M.degree()
+    d = poly.degree()
+    if d < n:
+        return poly
+    elif d >= 2*n:
+        return poly % M
+    q = poly.reverse(d)._mul_trunc_(I, d - n + 1).reverse(d - n)
+    return poly.truncate(n) - M._mul_trunc_(q, n)
+
+def _remainder_tree(polys, a, b, product_tree, inverses, L):
+    # simultaneous multipoint evaluation of all polys at the points of the product tree;
+    # appends to L, for each point, the list of the values of all polys at this point.
+
+    if b - a == 1:
+        L.append([p[0] for p in polys])
+        return
+
+    split = int(math.ceil((a+b)/2))
+
+    r0 = [_reduce(p, product_tree[1][0], inverses[1][0]) for p in polys]
+    _remainder_tree(r0, a, split, product_tree[1], inverses[1], L)
+    del r0
+
+    r1 = [_reduce(p, product_tree[2][0], inverses[2][0]) for p in polys]
+    _remainder_tree(r1, split, b, product_tree[2], inverses[2], L)
+
+def _lagrange_solve(mat, Mprime, points, product_tree, inverses, subsolver, infolevel):
+    # solve the images of mat at all points and interpolate the solutions
+
+    if subsolver is not word_size_gauss:
+        return _lagrange_rec(product_tree[0], mat, Mprime, 0, len(points), product_tree, inverses, subsolver, infolevel)
+
+    # evaluate the whole matrix in one pass through the tree, so that all images can be eliminated at once
+    R = product_tree[0].parent()
+    n, m = mat.dimensions()
+    bound = len(points)
+    images = []
+    _remainder_tree([R(p) for row in mat for p in row], 0, bound, product_tree, inverses, images)
+    images = [[v[i*m:(i + 1)*m] for i in range(n)] for v in images]
+    V = _word_size_gauss_batch(R.base_ring(), images, n, m, infolevel)
+    del images
+    if any(len(v) == 0 for v in V):
+        raise NoSolution
+    V = [[[R(p/Mprime[k]) for p in v] for v in V[k]] for k in range(bound)]
+    return _lagrange_combine(V, 0, bound, product_tree)
+
+def _lagrange_combine(V, a, b, product_tree):
+    # interpolate the solutions V[a], ..., V[b-1] found for the points in the given subtree
+
+    if b - a == 1:
+        return V[a]
+
+    split = int(math.ceil((a + b)/2))
+    V_left = _lagrange_combine(V, a, split, product_tree[1])
+    V_right = _lagrange_combine(V, split, b, product_tree[2])
+    M_left = product_tree[1][0]
+    M_right = product_tree[2][0]
+
+    return [ list(map(lambda v_l, v_r: M_right*v_l + M_left*v_r, V_left[i], V_right[i])) for i in range(len(V_left)) ]
+
 def _lagrange_base(mat, MprimeA, subsolver, infolevel):
     # base case of interpolation solver (a separate function in order to facilitate profiling)
 
@@ -1250,7 +1642,7 @@ def _lagrange_base(mat, MprimeA, subsolver, infolevel):
         raise NoSolution
     return [[ R(p/MprimeA) for p in v ] for v in V]
 
-def _lagrange_rec(mod, mat, Mprime, a, b, product_tree, subsolver, infolevel):
+def _lagrange_rec(mod, mat, Mprime, a, b, product_tree, inverses, subsolver, infolevel):
     # recursive step of interpolation solver
 
     if b - a == 1:
@@ -1261,12 +1653,12 @@ def _lagrange_rec(mod, mat, Mprime, a, b, product_tree, subsolver, infolevel):
     M_left = product_tree[1][0]
     M_right = product_tree[2][0]
 
-    mymat = [ [ p % M_left for p in v ] for v in mat ] 
-    V_left = _lagrange_rec(mod, mymat, Mprime, a, split, product_tree[1], subsolver, infolevel)
+    mymat = [ [ _reduce(p, M_left, inverses[1][0]) for p in v ] for v in mat ]
+    V_left = _lagrange_rec(mod, mymat, Mprime, a, split, product_tree[1], inverses[1], subsolver, infolevel)
     del mymat
 
-    mymat = [ [ p % M_right for p in v ] for v in mat ]
-    V_right = _lagrange_rec(mod, mymat, Mprime, split, b, product_tree[2], subsolver, infolevel)
+    mymat = [ [ _reduce(p, M_right, inverses[2][0]) for p in v ] for v in mat ]
+    V_right = _lagrange_rec(mod, mymat, Mprime, split, b, product_tree[2], inverses[2], subsolver, infolevel)
     del mymat
     
     return [ list(map(lambda v_l, v_r: M_right*v_l + M_left*v_r, V_left[i], V_right[i])) for i in range(len(V_left)) ]
@@ -1323,7 +1715,147 @@ def galois(subsolver, max_modulus=MAX_MODULUS, proof=False):
 def _galois(subsolver, max_modulus, proof, mat, degrees, infolevel):
     raise NotImplementedError
 
-def cra(subsolver, max_modulus=MAX_MODULUS, proof=False, ncpus=1):
+class _ImageStore(object):
+    r"""
+    Disk storage for the modular images of a nullspace basis, used by cra when ``spill`` is set.
+
+    The temporary files are created in the directory ``dir``, or in the default temporary directory if
+    ``dir`` is ``None``.
+
+    Every image is written as one row of word-size integers to an anonymous temporary file, using a
+    dense layout determined by the number of vectors, their length, and a degree bound for each
+    variable. When the solution vectors are requested, the rows added since the previous request are
+    read back through a memory map, one solution vector at a time, and merged by chinese remaindering
+    into the lifted solution, which is kept in a second temporary file. The rows are then discarded,
+    so that every image is merged only once and the images of all the primes never need to be in
+    memory at once.
+
+    EXAMPLES::
+
+       sage: from ore_algebra.nullspace import _ImageStore
+       sage: R.<x> = ZZ[]
+       sage: store = _ImageStore(None, 1, 2, [1])
+       sage: for p in [10007, 10009]:
+       ....:     Rp = GF(p)['x']
+       ....:     store.append(p, [[Rp(-3*x + 1), Rp(5*x)]])
+       sage: len(store), store.modulus()
+       (1, 100160063)
+       sage: def balanced(v, M):
+       ....:     return [e.map_coefficients(lambda c: c - M if 2*c > M else c) for e in v]
+       sage: [balanced(v, store.modulus()) for v in store.vectors(R)]
+       [[-3*x + 1, 5*x]]
+       sage: store.append(10037, [[GF(10037)['x'](-3*x + 1), GF(10037)['x'](5*x)]])
+       sage: [balanced(v, store.modulus()) for v in store.vectors(R)]
+       [[-3*x + 1, 5*x]]
+       sage: store.close()
+    """
+    def __init__(self, dir, n, m, degrees):
+        import tempfile
+        self.dir = dir
+        self.file = tempfile.TemporaryFile(dir=self.dir) # images not merged yet
+        self.lifted = None # solution vectors lifted modulo self.lifted_modulus
+        self.n = n
+        self.m = m
+        self.degrees = degrees
+        self.slots = prod(d + 1 for d in degrees)
+        self.primes = [] # moduli of the images in self.file
+        self.lifted_modulus = ZZ.one()
+
+    def __len__(self):
+        return self.n
+
+    def modulus(self):
+        return self.lifted_modulus*prod(ZZ(p) for p in self.primes)
+
+    def close(self):
+        # deletes the temporary files
+        self.file.close()
+        if self.lifted is not None:
+            self.lifted.close()
+
+    def _index(self, exp):
+        if len(self.degrees) == 1:
+            return int(exp)
+        k = 0
+        for e, d in zip(exp, self.degrees):
+            k = k*(d + 1) + e
+        return k
+
+    def _exponent(self, k):
+        if len(self.degrees) == 1:
+            return k
+        exp = []
+        for d in reversed(self.degrees):
+            k, e = divmod(k, d + 1)
+            exp.append(e)
+        return tuple(reversed(exp))
+
+    def append(self, p, V):
+        import numpy
+        row = numpy.zeros(self.n*self.m*self.slots, dtype=numpy.uint64)
+        for i, v in enumerate(V):
+            for j, e in enumerate(v):
+                offset = (i*self.m + j)*self.slots
+                for exp, c in e.dict().items():
+                    row[offset + self._index(exp)] = int(c)
+        self.file.seek(0, 2)
+        self.file.write(row.tobytes())
+        self.file.flush()
+        self.primes.append(p)
+
+    def _merge(self):
+        # merges the images in self.file into the lifted solution and discards them
+        if not self.primes:
+            return
+        import numpy
+        import pickle
+        import tempfile
+        from sage.arith.multi_modular import MultiModularBasis
+        mm = MultiModularBasis(self.primes)
+        M0 = self.lifted_modulus
+        M1 = prod(ZZ(p) for p in self.primes)
+        M = M0*M1
+        u = M0*M0.inverse_mod(M1) # = 1 mod M1, = 0 mod M0
+        width = self.m*self.slots
+        data = numpy.memmap(self.file, dtype=numpy.uint64, mode='r', shape=(len(self.primes), self.n*width))
+        lifted = tempfile.TemporaryFile(dir=self.dir)
+        if self.lifted is not None:
+            self.lifted.seek(0)
+        for i in range(self.n):
+            v = [{} for j in range(self.m)] if self.lifted is None else pickle.load(self.lifted)
+            block = data[:, i*width:(i + 1)*width]
+            for j in range(self.m):
+                e = v[j]
+                for k in range(self.slots):
+                    col = block[:, j*self.slots + k].tolist()
+                    a = ZZ(e.get(k, 0))
+                    b = mm.crt(col) % M1 if any(col) else ZZ.zero()
+                    c = (a + (b - a)*u) % M
+                    if c:
+                        e[k] = int(c)
+                    else:
+                        e.pop(k, None)
+            del block
+            pickle.dump(v, lifted)
+        del data
+        if self.lifted is not None:
+            self.lifted.close()
+        self.lifted = lifted
+        self.lifted_modulus = M
+        self.file.seek(0)
+        self.file.truncate()
+        self.primes = []
+
+    def vectors(self, R):
+        # yields the solution vectors with coefficients lifted to [0, modulus()) as lists of elements of R
+        import pickle
+        self._merge()
+        self.lifted.seek(0)
+        for i in range(self.n):
+            v = pickle.load(self.lifted)
+            yield [R({self._exponent(k): c for k, c in e.items()}) for e in v]
+
+def cra(subsolver, max_modulus=MAX_MODULUS, proof=False, ncpus=1, spill=None):
     r"""
     Creates a subsolver based on chinese remaindering for matrices over `K[x]` or `K[x,y,..]` where
     `K` is `ZZ` or `QQ` or `GF(p)`.
@@ -1338,6 +1870,10 @@ def cra(subsolver, max_modulus=MAX_MODULUS, proof=False, ncpus=1):
     - ``proof`` -- a boolean value. If set to ``False`` (default), a termination is only tested in a
       homomorphic image, which saves much time but may, with a very low probability, lead to a wrong output.
     - ``ncpus`` -- number of cpus that may be used in parallel by the solver (default=1).
+    - ``spill`` -- if ``None`` or ``False`` (default), the partial solution is kept in memory. Otherwise,
+      the modular images are written to a temporary file in the directory ``spill`` (a string), or in the
+      default temporary directory if ``spill`` is ``True``, and they are merged from there one vector at a
+      time. This bounds the memory needed for the images independently of the number of primes.
 
     OUTPUT:
 
@@ -1352,6 +1888,14 @@ def cra(subsolver, max_modulus=MAX_MODULUS, proof=False, ncpus=1):
        sage: V = my_solver(A) ## fails in sage 6.8 because (GF(3037000453)['x','y'].zero()).degree(GF(3037000453)['x','y'].gen(0))
        sage: A*V[0]
        (0, 0, 0, 0)
+       sage: A = MatrixSpace(ZZ['x'], 4, 7).random_element(degree=3)
+       sage: V = cra(gauss(), spill=True)(A)
+       sage: A*V[0]
+       (0, 0, 0, 0)
+       sage: cra(gauss(), spill=1)
+       Traceback (most recent call last):
+       ...
+       TypeError: spill must be a boolean, None, or a directory name
 
     ALGORITHM:
 
@@ -1366,12 +1910,19 @@ def cra(subsolver, max_modulus=MAX_MODULUS, proof=False, ncpus=1):
     #. If the solution candidate is not correct, consider some more primes and try again.
 
     """
+    if spill is None or spill is False:
+        spill = None
+    elif spill is True:
+        import tempfile
+        spill = tempfile.gettempdir()
+    elif not isinstance(spill, str):
+        raise TypeError("spill must be a boolean, None, or a directory name")
     def cra_solver(mat, degrees=[], infolevel=0) :
         r"""See docstring of cra() for further information."""
-        return _cra(subsolver, max_modulus, proof, ncpus, mat, degrees, infolevel)
+        return _cra(subsolver, max_modulus, proof, ncpus, spill, mat, degrees, infolevel)
     return cra_solver
 
-def _cra(subsolver, max_modulus, proof, ncpus, mat, degrees, infolevel):
+def _cra(subsolver, max_modulus, proof, ncpus, spill, mat, degrees, infolevel):
     r"""
     Internal version of nullspace.cra_ 
     """
@@ -1415,6 +1966,7 @@ def _cra(subsolver, max_modulus, proof, ncpus, mat, degrees, infolevel):
                 # MAIN WORK, SEQUENTIALLY
                 Vp = subsolver(mat.apply_map(Zp, Zp), degrees=degrees, infolevel=_alter_infolevel(infolevel, -2, 1))
                 m = p
+                images = [(p, Vp)]
             else:
                 Zp = []
                 while len(Zp) < ncpus:
@@ -1426,6 +1978,7 @@ def _cra(subsolver, max_modulus, proof, ncpus, mat, degrees, infolevel):
                 Vpp = [ u[1] for u in Vpp ]
                 if any( len(u) - len(Vpp[0]) for u in Vpp ):
                     raise ArithmeticError # solution spaces have different sizes
+                images = list(zip(primes, Vpp))
                 basis = list(map(R, CRT_basis(primes)))
                 Vp = [ v.apply_map(lambda u: basis[0]*R(u)) for v in Vpp[0] ]
                 for i in range(1, len(Vpp)):
@@ -1448,10 +2001,15 @@ def _cra(subsolver, max_modulus, proof, ncpus, mat, degrees, infolevel):
         
         if V is None or len(V) > len(Vp) or any(degrees[i] > true_degrees[i] for i in range(len(x))):
             # initialization, or all previous primes were unlucky
+            if spill is not None and V is not None:
+                V.close()
             if len(Vp) == 0:
                 return []
-            V = [ [R(e) for e in v] for v in Vp ]
-            M = m
+            if spill is None:
+                V = [ [R(e) for e in v] for v in Vp ]
+                M = m
+            else:
+                V = _ImageStore(spill, len(Vp), len(Vp[0]), true_degrees)
             degrees = true_degrees
             _info(infolevel, "expecting solution degrees ", degrees, alter = -1)
         elif len(V) < len(Vp): # this prime is unlucky, skip it
@@ -1462,7 +2020,11 @@ def _cra(subsolver, max_modulus, proof, ncpus, mat, degrees, infolevel):
             continue
         
         # combine the new solution with the known partial solution
-        if M != m: # (i.e., always except in the first iteration)
+        if spill is not None:
+            for q, W in images:
+                V.append(q, W)
+            M = V.modulus()
+        elif M != m: # (i.e., always except in the first iteration)
             (g, M0, p0) = xgcd(m, M)
             (M0, p0) = (R(M0*m), R(p0*M))
             M *= m
@@ -1476,7 +2038,7 @@ def _cra(subsolver, max_modulus, proof, ncpus, mat, degrees, infolevel):
         try:
             sol = []
             m = M//2
-            for v in V:
+            for v in (V if spill is None else V.vectors(R)):
                 d = ZZ.one()
                 for e in v:
                     for c in e.coefficients():
@@ -1486,6 +2048,8 @@ def _cra(subsolver, max_modulus, proof, ncpus, mat, degrees, infolevel):
                        (proof and any(mat * w) ):
                     raise ArithmeticError # more primes needed
                 sol.append(w)
+            if spill is not None:
+                V.close()
             return sol # if no error was raised for any of the v in V, then we are done        
         except (ValueError, ArithmeticError):
             pass
@@ -1976,17 +2540,21 @@ def _compress(subsolver, presolver, modulus, mat, degrees, infolevel):
                 
     return V
 
-def wiedemann():
+def wiedemann(block=1, ncpus=1):
     r"""
     Constructs a solver using Wiedemann's algorithm
 
     INPUT:
 
-    - none.
+    - ``block`` -- a positive integer. If greater than one, the solver uses the block version of the
+      algorithm with this many Krylov sequences, combined by a matrix Berlekamp-Massey algorithm. This
+      requires a matrix over a field `K` (default: 1).
+    - ``ncpus`` -- maximum number of cpus that may be used in parallel for computing the Krylov
+      sequences of the block version (default: 1).
 
     OUTPUT:
 
-    - a solver for matrices over `R[x..]`
+    - a solver for matrices over `R[x..]`, or over `K` if ``block`` is greater than one
 
     EXAMPLES::
 
@@ -1997,7 +2565,18 @@ def wiedemann():
        sage: A*V[0]
        (0, 0, 0, 0)
 
-    ALGORITHM: Wiedemann's algorithm.
+    The block version finds, with high probability, the whole nullspace whenever its dimension
+    does not exceed the block size::
+
+       sage: A = MatrixSpace(GF(1093), 30, 27).random_element() * MatrixSpace(GF(1093), 27, 30).random_element()
+       sage: V = wiedemann(block=4, ncpus=2)(A)
+       sage: all(not A*v for v in V)
+       True
+       sage: len(V) == A.right_kernel().dimension()
+       True
+
+    ALGORITHM: Wiedemann's algorithm, resp. the block Wiedemann algorithm of Coppersmith with
+    a matrix generator computed by the M-Basis algorithm of Giorgi, Jeannerod and Villard.
 
     .. NOTE::
 
@@ -2008,12 +2587,15 @@ def wiedemann():
           any Python object ``A`` which provides the following functions:
           ``A.dimensions()``, ``A.parent()``, and ``A*v`` for a vector ``v``.
 
-       #. The solver returns at most one solution vector, even if the nullspace has higher dimension.
-          If it returns the empty list, it only means that the nullspace is probably empty. 
+       #. The solver returns at most one solution vector (at most ``block`` in the block version),
+          even if the nullspace has higher dimension. If it returns the empty list, it only means that
+          the nullspace is probably empty. The output of the block version is in echelon form.
 
     """
     def wiedemann_solver(mat, degrees=[], infolevel=0):
         r"""See docstring of wiedemann() for further information"""
+        if block > 1:
+            return _block_wiedemann(mat, block, ncpus, infolevel)
         return _wiedemann(mat, degrees, infolevel)
     return wiedemann_solver
 
@@ -2073,6 +2655,100 @@ def _wiedemann(A, degrees, infolevel):
     return _normalize([ vector(R, x) ])
 
 
+def _block_wiedemann(A, s, ncpus, infolevel):
+
+    K = A.parent().base_ring()
+    n, m = A.dimensions()
+    _launch_info(infolevel, "block wiedemann", dim=(n, m), domain=K)
+
+    if not K.is_field():
+        raise TypeError("block wiedemann requires a matrix over a field")
+
+    if n != m:
+        _info(infolevel, "Bringing matrix into square form", alter=-1)
+        A = A.transpose() * A
+        (n, m) = A.dimensions()
+
+    X = [ vector(K, [K.random_element() for i in range(m) ]) for j in range(s) ]
+    Y = Matrix(K, [[K.random_element() for i in range(m) ] for j in range(s) ])
+    L = 2*((m + s - 1)//s) + 4 # number of terms of the matrix sequence
+
+    # 1. the s Krylov sequences Y*A^i*(A*X[j]) are independent of each other
+    _info(infolevel, "Computing ", s, " Krylov sequences of length ", L, alter=-1)
+    def krylov(j):
+        v = A*X[j]
+        seq = []
+        for i in range(L):
+            seq.append(Y*v)
+            v = A*v ###### MOST EXPENSIVE STEP (if matrix is big and entries are small)
+        return seq
+
+    if ncpus > 1:
+        forked_krylov = parallel(ncpus=ncpus)(krylov)
+        cols = dict( (u[0][0], v) for u, v in forked_krylov(list(range(s))) )
+        cols = [ cols[j] for j in range(s) ]
+    else:
+        cols = [ krylov(j) for j in range(s) ]
+    S = [ Matrix(K, s, s, lambda r, j: cols[j][i][r]) for i in range(L) ]
+    del cols
+
+    # 2. matrix Berlekamp-Massey: an order basis of [G(z) | -I], where G = sum(S[i]*z^i), computed
+    # column by column as in the M-Basis algorithm. The shift of the second block ensures that the
+    # right parts of the minimal columns have lower degree than their left parts.
+    _info(infolevel, "Computing matrix generator", alter=-1)
+    MS = MatrixSpace(K, 2*s, 2*s)
+    V = [ MS(1) ] # coefficients of the basis matrix, V[t] belongs to z^t
+    delta = [0]*s + [1]*s
+    for k in range(L):
+        Res = Matrix(K, s, 2*s) # coefficient of z^k in [G(z) | -I]*V(z)
+        for t in range(min(k + 1, len(V))):
+            Res += S[k - t]*V[t][:s]
+        if k < len(V):
+            Res -= V[k][s:]
+        order = sorted(range(2*s), key=lambda j: (delta[j], j))
+        pivots = []
+        for r in range(s):
+            candidates = [ j for j in order if j not in pivots and Res[r, j] ]
+            if not candidates:
+                continue
+            piv = candidates[0]
+            for j in candidates[1:]:
+                c = Res[r, j]/Res[r, piv]
+                Res.add_multiple_of_column(j, piv, -c)
+                for Vt in V:
+                    Vt.add_multiple_of_column(j, piv, -c)
+            pivots.append(piv)
+        if pivots:
+            V.append(MS())
+            for piv in pivots:
+                for t in range(len(V) - 1, 0, -1):
+                    V[t].set_column(piv, V[t - 1].column(piv))
+                V[0].set_column(piv, vector(K, 2*s))
+                delta[piv] += 1
+
+    # 3. turn the generator columns into kernel vectors
+    _info(infolevel, "Computing solution vectors", alter=-1)
+    sol = []
+    for j in sorted((j for j in range(2*s) if any(Vt[:s].column(j) for Vt in V)), key=lambda j: delta[j])[:s]:
+        d = delta[j]
+        coeffs = [ V[t][:s].column(j) if t < len(V) else vector(K, s) for t in range(d + 1) ]
+        u = vector(K, m)
+        for t in range(d + 1): # Horner scheme for sum(A^k*X*coeffs[d - k], k=0..d)
+            u = A*u + sum(c*x for c, x in zip(coeffs[t], X))
+        for i in range(d + 1):
+            if not u:
+                break
+            w = A*u
+            if not w:
+                sol.append(u)
+                break
+            u = w
+
+    if len(sol) == 0:
+        return []
+    sol = [ v for v in Matrix(K, sol).echelon_form() if v ]
+    return _normalize([ vector(K, v) for v in sol ])
+
 #################################################################################################################
 
 #def take_picture(mat, idx):